@@ -1,15 +1,33 @@
 import argparse
+import asyncio
+import concurrent.futures
 import csv
+import hashlib
+import http.client
+import importlib
+import io
+import itertools
+import json
+import multiprocessing
+import multiprocessing.managers
 import os
+import pickle
 import platform
+import queue
+import re
 import shlex
 import shutil
+import signal
 import stat
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import urllib.error
+import urllib.parse
 import urllib.request
+import uuid
 import zipfile
 
 # https://github.com/per1234/inoliblist
@@ -18,6 +36,48 @@ import inoliblist  # nopep8
 
 process_repos_with_open_pr_default = False
 check_for_typos_default = False
+# number of repositories to process in parallel
+default_jobs = 1
+# maximum number of concurrent GitHub API requests for the social checks
+default_github_api_concurrency = 8
+# number of inoliblist rows to do the social checks for at a time
+social_check_batch_size = 100
+# the GitHub search API only provides the first 1000 results of a search
+github_search_result_limit = 1000
+github_api_url = "https://api.github.com/"
+github_api_results_per_page = 100
+github_graphql_api_url = "https://api.github.com/graphql"
+# number of repositories to do the social checks for in each GraphQL API request
+graphql_batch_size = 25
+# when less than this fraction of a GitHub API rate limit remains, the requests are spaced so the remaining requests
+# last until the rate limit is reset
+github_api_pacing_threshold = 0.5
+# this fraction of each GitHub API rate limit is reserved for the priority requests
+github_api_priority_reserve = 0.05
+# (s) wait after a secondary rate limit response that doesn't have a Retry-After header, doubled for each consecutive
+# secondary rate limit response
+github_api_secondary_rate_limit_delay = 60
+# (s) interval between the logs of the GitHub API rate limit statistics
+github_api_statistics_interval = 60
+# headers of the GitHub API responses used by GitHubAPIRateLimiter
+github_api_rate_limit_header_names = ("X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset",
+                                      "X-RateLimit-Resource", "Retry-After")
+# (s)
+github_api_timeout = 60
+# number of times a GitHub API request that failed due to a network or server error is made again
+github_api_maximum_retries = 5
+# (s) wait before the first retry of a failed GitHub API request, doubled for each retry
+github_api_retry_delay = 2
+# (MB)
+default_github_api_cache_maximum_size = 100
+# when a cache is full, the least recently used files are deleted until it is this fraction of its maximum size
+cache_eviction_target_ratio = 0.9
+# (MB) 0 disables the archive cache
+default_archive_cache_maximum_size = 0
+# (B)
+download_chunk_size = 1024 * 1024
+# "bash" to use arduino-ci-script for all checks, "python" to use the in-process implementations where available
+default_check_engine = "bash"
 
 # for data files such as the blacklists
 data_folder_name = "data"
@@ -28,16 +88,45 @@ output_folder_name = "output"
 # repos will be cloned to this folder for the arduino-ci-script checks
 work_folder_name = "work"
 tools_folder_name = "tools"
+# record of the installed tools, used to only install the tools that are missing or out of date
+tool_manifest_path = tools_folder_name + "/tools.json"
+# persistent data that is reused from one run to the next
+cache_folder_name = "cache"
 scripts_folder_name = "scripts"
+etc_folder_name = "etc"
 inoliblist_input_folder_name = input_folder_name + "/inoliblist"
 inoliblist_csv_download_url = "https://per1234.github.io/inoliblist/" + inoliblist.output_filename
 default_inoliblist_path = inoliblist_input_folder_name + '/' + inoliblist.output_filename
+# the ETag and Last-Modified headers of the download of inoliblist.csv are saved to this file alongside it
+inoliblist_download_metadata_extension = ".json"
+# (s)
+inoliblist_download_timeout = 60
+# (bytes)
+inoliblist_download_chunk_size = 64 * 1024
 arduino_ci_script_clone_url = "https://github.com/per1234/arduino-ci-script.git"
 default_arduino_ci_script_branch = "master"
 arduino_ci_script_folder = tools_folder_name + "/arduino-ci-script"
 arduino_ci_script_path = arduino_ci_script_folder + "/arduino-ci-script.sh"
 arduino_ci_script_wrapper_path = scripts_folder_name + "/arduino-ci-script-wrapper.sh"
 bash_function_wrapper_script_path = scripts_folder_name + "/function-wrapper.sh"
+arduino_ci_script_worker_script_path = scripts_folder_name + "/arduino-ci-script-worker.sh"
+# (s) maximum time for an invocation in the arduino-ci-script worker, after which it is run without the worker
+arduino_ci_script_worker_timeout = 600
+github_api_cache_folder = cache_folder_name + "/github_api"
+# the results of the checks of each repository, for use by incremental runs
+incremental_state_folder = cache_folder_name + "/incremental"
+codespell_ignore_words_list_path = etc_folder_name + "/codespell-ignore-words-list.txt"
+# GitHub archives of the repositories, by commit
+archive_cache_folder = cache_folder_name + "/archives"
+# compiled typo matching automatons, by hash of the dictionary
+typo_automaton_cache_folder = cache_folder_name + "/typo_automaton"
+# bitmap indexes of inolibbuglist.csv for --query
+query_index_cache_folder = cache_folder_name + "/query_index"
+# tokens of the --query expressions: parentheses, operators, and column names
+query_token_regex = re.compile(r"[()&|~]|[A-Za-z_][A-Za-z0-9_]*")
+archive_checksum_extension = ".sha256"
+# GitHub puts the commit SHA of the archive in the comment of the .zip file
+archive_commit_regex = re.compile(r"[0-9a-f]{40}")
 
 default_arduino_ci_script_arduino_ide_version = "1.8.6"
 
@@ -46,6 +135,8 @@ verification_failed_browser_script_filename = "verification_failed"
 owner_blacklist_filename = "owner_blacklist.csv"
 repository_blacklist_filename = "repository_blacklist.csv"
 inolibbuglist_filename = "inolibbuglist.csv"
+# record of the completed rows, used to resume an interrupted run
+journal_filename = "journal.jsonl"
 
 default_bash_command = "bash"
 # create scripts that open a maximum of this many browser tabs at a time to avoid slowing/crashing the browser
@@ -55,6 +146,21 @@ default_git_command = "git"
 
 # (s) delay between deleting and creating folders
 create_folder_delay = 1
+default_scratch_folder = work_folder_name
+# the scratch folders of each repository are created under the scratch folder with this prefix
+scratch_folder_prefix = "inolibbuglist-"
+# when the disk usage fraction of the scratch folder's file system reaches the high watermark, creation of new scratch
+# folders waits until it drops below the low watermark or all pending deletions are done
+scratch_folder_high_watermark = 0.9
+scratch_folder_low_watermark = 0.8
+# maximum number of scratch folders waiting for deletion before releasing a folder blocks
+maximum_pending_scratch_folder_deletions = 8
+# (s)
+scratch_folder_backpressure_poll_interval = 1
+# the streamed output file is flushed after this many rows or this many seconds, whichever comes first
+output_file_flush_row_interval = 10
+# (s)
+output_file_flush_interval = 30
 
 
 class Column:
@@ -242,8 +348,925 @@ class Column:
     count = column_counter
 
 
+class InolibbuglistRow:
+    """Compact row of the inolibbuglist table.
+
+    The inoliblist columns are stored as a list of strings. The bug columns are tri-state ("True", "False", or "") so
+    they are stored as bits of two integers, one for whether the column is set and one for whether it is True. Any other
+    bug column value (e.g. "None" from a failed check) is stored in a dictionary. Rows are indexed like the equivalent
+    list and the strings are only produced when the row is read, e.g. by csv.writer.
+    """
+    __slots__ = ("inoliblist_fields", "set_bug_columns", "true_bug_columns", "other_bug_column_values")
+
+    def __init__(self, row_list=()):
+        """
+        Keyword arguments:
+        row_list -- list of the initial values of the columns, starting from the first column
+        """
+        self.inoliblist_fields = [""] * inoliblist.Column.count
+        self.set_bug_columns = 0
+        self.true_bug_columns = 0
+        self.other_bug_column_values = None
+        for column_index, cell_contents in enumerate(row_list):
+            self[column_index] = cell_contents
+
+    def __len__(self):
+        return Column.count
+
+    def __iter__(self):
+        for column_index in range(Column.count):
+            yield self[column_index]
+
+    def __eq__(self, other):
+        if not isinstance(other, (InolibbuglistRow, list, tuple)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __getstate__(self):
+        return self.inoliblist_fields, self.set_bug_columns, self.true_bug_columns, self.other_bug_column_values
+
+    def __setstate__(self, state):
+        self.inoliblist_fields, self.set_bug_columns, self.true_bug_columns, self.other_bug_column_values = state
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[column_index] for column_index in range(*index.indices(Column.count))]
+
+        index = self.normalize_index(index=index)
+        bit = self.determine_bug_column_bit(index=index)
+        if bit is None:
+            return self.inoliblist_fields[index]
+        if self.set_bug_columns & bit:
+            if self.true_bug_columns & bit:
+                return "True"
+            return "False"
+        if self.other_bug_column_values is not None:
+            return self.other_bug_column_values.get(bit, "")
+        return ""
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            column_indexes = range(*index.indices(Column.count))
+            values = list(value)
+            if len(values) != len(column_indexes):
+                raise ValueError("Can't change the number of columns of an InolibbuglistRow")
+            for column_index, cell_contents in zip(column_indexes, values):
+                self[column_index] = cell_contents
+            return
+
+        index = self.normalize_index(index=index)
+        bit = self.determine_bug_column_bit(index=index)
+        if bit is None:
+            self.inoliblist_fields[index] = value
+            return
+        self.set_bug_columns &= ~bit
+        self.true_bug_columns &= ~bit
+        if self.other_bug_column_values is not None:
+            self.other_bug_column_values.pop(bit, None)
+        if value == "True":
+            self.set_bug_columns |= bit
+            self.true_bug_columns |= bit
+        elif value == "False":
+            self.set_bug_columns |= bit
+        elif value != "":
+            if self.other_bug_column_values is None:
+                self.other_bug_column_values = {}
+            self.other_bug_column_values[bit] = value
+
+    def normalize_index(self, index):
+        """Return the non-negative equivalent of the column index."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("InolibbuglistRow index out of range")
+        return index
+
+    @staticmethod
+    def determine_bug_column_bit(index):
+        """Return the bit of the bug column, or None if the index is of an inoliblist column.
+
+        Keyword arguments:
+        index -- non-negative column index
+        """
+        if index < inoliblist.Column.count:
+            return None
+        return 1 << (index - inoliblist.Column.count)
+
+
+class OpenInTabsScriptWriter:
+    """Writes the rows of the input file that pass the inclusion and exclusion rules to open-in-tabs scripts, starting a
+    new script every maximum_browser_tabs rows."""
+
+    def __init__(self, heading_row, url_column, inclusion_columns, exclusion_columns, output_filename=None):
+        """
+        Keyword arguments:
+        heading_row -- column heading row of the input file
+        url_column -- column containing the URL to open
+        inclusion_columns -- list of the columns that must be "True" for the URL to be added to the script, or True to
+                             add all URLs
+        exclusion_columns -- list of the columns that exclude the URL from the script if "True"
+        output_filename -- filename of the scripts, without the number and extension. Defaults to the heading text of
+                           the first inclusion column.
+        """
+        self.url_column = url_column
+        self.inclusion_columns = [inclusion_column for inclusion_column in inclusion_columns
+                                  if inclusion_column is not True]
+        self.exclusion_columns = exclusion_columns
+        if output_filename is None:
+            # use the first inclusion column heading text as the filename
+            output_filename = heading_row[inclusion_columns[0]]
+        self.output_filename = output_filename
+        # setting it above the threshold value to always trigger the filename increment on the first result
+        # (to avoid confusing debug output)
+        self.tabs_count = maximum_browser_tabs + 1
+        self.filename_count = 0
+        self.browser_script_file = None
+
+    def write_row(self, input_row):
+        # any inclusion column mismatch or exclusion column match excludes the row
+        for inclusion_column in self.inclusion_columns:
+            if input_row[inclusion_column] != "True":
+                return
+        for exclusion_column in self.exclusion_columns:
+            if input_row[exclusion_column] == "True":
+                return
+
+        self.tabs_count += 1
+        if self.tabs_count > maximum_browser_tabs:
+            self.close()
+            self.filename_count += 1
+            self.tabs_count = 0
+            browser_script_filename = self.output_filename + str(self.filename_count) + browser_script_extension
+            inoliblist.logger.info("Creating open-in-tabs script: " + browser_script_filename)
+            self.browser_script_file = open(file=output_folder_name + "/" + browser_script_filename,
+                                            mode='a',
+                                            encoding=inoliblist.file_encoding,
+                                            newline=inoliblist.file_newline
+                                            )
+        self.browser_script_file.write(browser_command + " " + input_row[self.url_column] + '\n')
+
+    def close(self):
+        if self.browser_script_file is not None:
+            self.browser_script_file.close()
+            self.browser_script_file = None
+
+
+class RepositoryArchive:
+    """View of the GitHub archive of a repository that checks can query without extracting it to disk.
+
+    Paths are relative to the repository root folder. Folder paths have a trailing slash.
+    """
+
+    def __init__(self, archive_file):
+        """Keyword arguments:
+        archive_file -- path or file object of the archive
+        """
+        self.zip_file = zipfile.ZipFile(archive_file, "r")
+        # for some idiotic reason, the folder extracted from the GitHub generated .zip file doesn't
+        # always match {repo name}-{branch name}
+        # for example, https://github.com/EnviroDIY/GPRSbee should be GPRSbee-v1.2_hacked but
+        # actually it's GPRSbee-1.2_hacked
+        # namelist()[0] includes a trailing slash
+        self.root_folder_name = self.zip_file.namelist()[0]
+        # path of the repository folder, set when the archive is extracted
+        self.repository_installation_path = None
+
+        self.members = {}
+        # paths of the files and folders directly under each folder
+        self.folder_contents = {"": []}
+        for zip_info in self.zip_file.infolist():
+            path = zip_info.filename[len(self.root_folder_name):]
+            if path == "":
+                continue
+            self.members[path] = zip_info
+            if path.endswith('/'):
+                self.folder_contents.setdefault(path, [])
+            parent_folder_path = path.rstrip('/').rpartition('/')[0]
+            if parent_folder_path != "":
+                parent_folder_path += '/'
+            self.folder_contents.setdefault(parent_folder_path, []).append(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.zip_file.close()
+
+    def paths(self):
+        """Return the paths of all files and folders in the repository."""
+        return self.members.keys()
+
+    def exists(self, path):
+        return path in self.members or path in self.folder_contents
+
+    def is_folder(self, path):
+        return path.endswith('/') and self.exists(path)
+
+    def list_folder(self, folder_path):
+        """Return the paths of the files and folders directly under the folder."""
+        return self.folder_contents.get(folder_path, [])
+
+    def read(self, path):
+        """Return the contents of a file as bytes."""
+        return self.zip_file.read(self.members[path])
+
+    def is_symlink(self, path):
+        # the upper 16 bits of the external attributes are the Unix file mode
+        return stat.S_ISLNK(self.members[path].external_attr >> 16)
+
+    def extract(self, folder_path):
+        """Extract the archive to the folder, if not already extracted, and return the path of the repository folder."""
+        if self.repository_installation_path is None:
+            self.zip_file.extractall(folder_path)
+            self.repository_installation_path = folder_path + '/' + self.root_folder_name
+        return self.repository_installation_path
+
+
+class ArduinoCIScriptWorker:
+    """Long-lived bash process that sources arduino-ci-script once and runs the function invocations sent to it.
+
+    The protocol is line based: each invocation is written to the worker's stdin as a single line and the worker
+    responds with the combined stdout and stderr of the invocation, followed by a line containing the response marker
+    and the exit status.
+    """
+
+    def __init__(self, timeout=arduino_ci_script_worker_timeout):
+        """
+        Keyword arguments:
+        timeout -- maximum time in seconds for an invocation
+        """
+        self.timeout = timeout
+        self.process = None
+        # the worker process is not usable from a forked process
+        self.process_id = None
+        self.response_marker = "inolibbuglist-worker-" + uuid.uuid4().hex
+        # lines of the worker's output, read by a thread so that the wait for a response can time out
+        self.output_lines = None
+
+    def start(self):
+        commandline = [bash_command,
+                       arduino_ci_script_worker_script_path,
+                       arduino_ci_script_wrapper_path,
+                       arduino_ci_script_path,
+                       arduino_ci_script_application_folder,
+                       arduino_ci_script_arduino_ide_version,
+                       self.response_marker]
+        inoliblist.logger.info("Starting arduino-ci-script worker: " + " ".join(commandline))
+        # the worker gets its own process group so the processes of a hung invocation can be killed along with it
+        self.process = subprocess.Popen(commandline,
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        start_new_session=platform.system() != "Windows")
+        self.process_id = os.getpid()
+        self.output_lines = queue.Queue()
+        threading.Thread(target=self.read_output, args=(self.process.stdout, self.output_lines), daemon=True).start()
+
+    @staticmethod
+    def read_output(worker_stdout, output_lines):
+        for line in worker_stdout:
+            output_lines.put(line)
+        # the worker exited
+        output_lines.put(None)
+
+    def stop(self):
+        if self.process is not None and self.process_id == os.getpid():
+            self.process.stdin.close()
+            self.process.wait()
+        self.process = None
+
+    def kill(self):
+        if self.process is not None and self.process_id == os.getpid():
+            try:
+                if platform.system() == "Windows":
+                    self.process.kill()
+                else:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
+                # the worker already exited
+                pass
+            self.process.wait()
+        self.process = None
+
+    def run(self, invocation):
+        """Run the invocation in the worker, starting or restarting the worker as necessary.
+
+        Keyword arguments:
+        invocation -- bash command line of the arduino-ci-script function call
+
+        Returns a tuple of the exit status and output of the invocation, or None if the invocation can't be passed to
+        the worker, timed out, or the worker died while running it, even after a restart.
+        """
+        try:
+            # bash reads the invocation as bytes in the encoding of the file system paths
+            invocation_line = os.fsencode(invocation + '\n')
+        except UnicodeEncodeError:
+            inoliblist.logger.warning("Unable to encode the arduino-ci-script worker invocation")
+            return None
+
+        for attempt in range(2):
+            if self.process is None or self.process_id != os.getpid() or self.process.poll() is not None:
+                self.start()
+            try:
+                self.process.stdin.write(invocation_line)
+                self.process.stdin.flush()
+                deadline = time.monotonic() + self.timeout
+                output = ""
+                while True:
+                    line = self.output_lines.get(timeout=max(deadline - time.monotonic(), 0))
+                    if line is None:
+                        # the worker exited before responding
+                        raise BrokenPipeError
+                    line = line.decode(encoding="utf-8", errors="replace")
+                    if line.startswith(self.response_marker + ' '):
+                        # strip the newline the worker adds before the marker
+                        return int(line[len(self.response_marker) + 1:]), output[:-1]
+                    output += line
+            except queue.Empty:
+                inoliblist.logger.warning("arduino-ci-script worker invocation timed out, restarting the worker")
+                self.kill()
+                return None
+            except OSError:
+                inoliblist.logger.warning("arduino-ci-script worker died, restarting")
+                self.kill()
+
+        return None
+
+
+class ScratchFolderManager:
+    """Provides a fresh, unique scratch folder for each repository and deletes the released folders from a background
+    thread, so the processing of the next repository doesn't wait for the deletion.
+    """
+
+    def __init__(self, root_folder_path):
+        self.root_folder_path = root_folder_path
+        self.deletion_queue = queue.Queue()
+        self.pending_deletion_count = 0
+        self.pending_deletion_condition = threading.Condition()
+        self.reaper_thread = None
+        self.process_id = os.getpid()
+
+    def create_folder(self):
+        """Create a new scratch folder and return its path."""
+        self.wait_for_disk_space()
+        os.makedirs(self.root_folder_path, exist_ok=True)
+        return tempfile.mkdtemp(prefix=scratch_folder_prefix + str(os.getpid()) + '-', dir=self.root_folder_path)
+
+    def release_folder(self, folder_path):
+        """Queue the scratch folder for deletion by the reaper thread."""
+        if self.reaper_thread is None:
+            self.reaper_thread = threading.Thread(target=self.reap, daemon=True)
+            self.reaper_thread.start()
+        with self.pending_deletion_condition:
+            # don't let the reaper fall too far behind
+            self.pending_deletion_condition.wait_for(
+                lambda: self.pending_deletion_count < maximum_pending_scratch_folder_deletions
+            )
+            self.pending_deletion_count += 1
+        self.deletion_queue.put(folder_path)
+
+    def reap(self):
+        while True:
+            folder_path = self.deletion_queue.get()
+            try:
+                shutil.rmtree(folder_path, onerror=onerror)
+            except OSError as exception:
+                inoliblist.logger.warning("Unable to delete scratch folder " + folder_path + ": " + str(exception))
+            with self.pending_deletion_condition:
+                self.pending_deletion_count -= 1
+                self.pending_deletion_condition.notify_all()
+
+    def determine_disk_usage(self):
+        """Return the fraction of the scratch folder's file system that is used."""
+        disk_usage = shutil.disk_usage(self.root_folder_path if os.path.exists(self.root_folder_path) else '.')
+        return disk_usage.used / disk_usage.total
+
+    def wait_for_disk_space(self):
+        """Apply backpressure when the scratch folder's file system is too full, giving the reaper a chance to catch up.
+        """
+        if self.determine_disk_usage() < scratch_folder_high_watermark:
+            return
+        inoliblist.logger.info("Scratch folder disk usage above high watermark, waiting for pending deletions")
+        with self.pending_deletion_condition:
+            while self.pending_deletion_count > 0 and self.determine_disk_usage() >= scratch_folder_low_watermark:
+                self.pending_deletion_condition.wait(timeout=scratch_folder_backpressure_poll_interval)
+
+    def remove_folders(self):
+        """Wait for the pending deletions, then delete any remaining scratch folders, such as those left by the worker
+        processes of the pool or by a previous run."""
+        with self.pending_deletion_condition:
+            self.pending_deletion_condition.wait_for(lambda: self.pending_deletion_count == 0)
+        if not os.path.isdir(self.root_folder_path):
+            return
+        for folder_name in os.listdir(self.root_folder_path):
+            if folder_name.startswith(scratch_folder_prefix):
+                shutil.rmtree(os.path.join(self.root_folder_path, folder_name), onerror=onerror)
+
+
+class GitHubAPIRateLimiter:
+    """Schedules the GitHub API requests according to the rate limits.
+
+    The state of each rate limit resource ("core", "search", "graphql") is updated from the X-RateLimit headers of every
+    response. Once less than github_api_pacing_threshold of a rate limit remains, the requests are spaced so that the
+    remaining requests last until the rate limit is reset. The last github_api_priority_reserve of each rate limit is
+    reserved for the priority requests, which are the ones that allow expensive work to be skipped, such as the search
+    sweep for my open items and the default branch tip commit lookup of --incremental. Priority requests are not spaced.
+    After a secondary rate limit response, all requests wait for the time given by the Retry-After header.
+
+    With --jobs, a single rate limiter in the server process of a GitHubAPIRateLimiterManager is shared by all the
+    processes, so the methods only take arguments that can be pickled.
+    """
+
+    def __init__(self, state=None):
+        """
+        Keyword arguments:
+        state -- state of another rate limiter to continue from, as returned by get_state()
+        """
+        self.condition = threading.Condition()
+        # limit, remaining, and reset time of each resource
+        self.rate_limits = {}
+        self.next_request_times = {}
+        self.blocked_until = 0
+        self.consecutive_secondary_rate_limits = 0
+        self.request_count = 0
+        self.rate_limited_count = 0
+        # (s)
+        self.wait_time = 0
+        if state is not None:
+            for attribute_name, value in state.items():
+                setattr(self, attribute_name, value)
+        self.statistics_time = time.monotonic()
+
+    def get_state(self):
+        """Return the rate limit state and the statistics."""
+        with self.condition:
+            return {"rate_limits": self.rate_limits,
+                    "next_request_times": self.next_request_times,
+                    "blocked_until": self.blocked_until,
+                    "consecutive_secondary_rate_limits": self.consecutive_secondary_rate_limits,
+                    "request_count": self.request_count,
+                    "rate_limited_count": self.rate_limited_count,
+                    "wait_time": self.wait_time}
+
+    def acquire(self, resource, priority=False):
+        """Wait until a request to the resource can be made.
+
+        Keyword arguments:
+        resource -- rate limit resource of the request
+        priority -- whether the request can use the reserved part of the rate limit
+        """
+        with self.condition:
+            while True:
+                delay = self.determine_delay(resource=resource, priority=priority)
+                if delay <= 0:
+                    break
+                if delay >= github_api_statistics_interval:
+                    inoliblist.logger.warning("GitHub API rate limit reached, waiting " + str(int(delay)) + " s")
+                wait_start_time = time.monotonic()
+                self.condition.wait(timeout=delay)
+                self.wait_time += time.monotonic() - wait_start_time
+
+            self.request_count += 1
+            rate_limit = self.rate_limits.get(resource)
+            if rate_limit is not None:
+                # the count is corrected by the headers of the response
+                rate_limit["remaining"] -= 1
+                self.next_request_times[resource] = time.time() + self.determine_interval(rate_limit=rate_limit)
+
+            if time.monotonic() - self.statistics_time >= github_api_statistics_interval:
+                self.log_statistics()
+
+    def determine_delay(self, resource, priority):
+        """Return the time in seconds until a request to the resource can be made."""
+        now = time.time()
+        delay = self.blocked_until - now
+        rate_limit = self.rate_limits.get(resource)
+        if rate_limit is None:
+            # nothing is known about the rate limit until the first response
+            return delay
+        if now >= rate_limit["reset"]:
+            # the rate limit has been reset, its new state is provided by the next response
+            del self.rate_limits[resource]
+            self.next_request_times.pop(resource, None)
+            return delay
+
+        if priority:
+            minimum_remaining = 0
+        else:
+            minimum_remaining = int(rate_limit["limit"] * github_api_priority_reserve)
+            delay = max(delay, self.next_request_times.get(resource, 0) - now)
+        if rate_limit["remaining"] <= minimum_remaining:
+            # wait for the reset
+            delay = max(delay, rate_limit["reset"] - now + 1)
+        return delay
+
+    @staticmethod
+    def determine_interval(rate_limit):
+        """Return the time in seconds to leave between the non-priority requests to the resource."""
+        if rate_limit["remaining"] >= rate_limit["limit"] * github_api_pacing_threshold:
+            return 0
+        spendable_remaining = rate_limit["remaining"] - int(rate_limit["limit"] * github_api_priority_reserve)
+        return (rate_limit["reset"] - time.time()) / max(spendable_remaining, 1)
+
+    def update(self, headers):
+        """Update the rate limit state from the headers of a response.
+
+        Keyword arguments:
+        headers -- dictionary of the rate limit headers of the response, as returned by determine_rate_limit_headers()
+        """
+        if headers.get("X-RateLimit-Remaining") is None:
+            return
+        resource = headers.get("X-RateLimit-Resource", "core")
+        rate_limit = {"limit": int(headers["X-RateLimit-Limit"]),
+                      "remaining": int(headers["X-RateLimit-Remaining"]),
+                      "reset": int(headers["X-RateLimit-Reset"])}
+        with self.condition:
+            previous_rate_limit = self.rate_limits.get(resource)
+            if previous_rate_limit is not None and previous_rate_limit["reset"] == rate_limit["reset"]:
+                # the responses to concurrent requests can arrive out of order
+                rate_limit["remaining"] = min(rate_limit["remaining"], previous_rate_limit["remaining"] + 1)
+            self.rate_limits[resource] = rate_limit
+            self.condition.notify_all()
+
+    def record_success(self, headers):
+        """Update the rate limit state from the headers of a successful response."""
+        self.update(headers=headers)
+        with self.condition:
+            self.consecutive_secondary_rate_limits = 0
+
+    def handle_error(self, code, headers, secondary_rate_limit_message):
+        """Update the rate limit state from an HTTP error response. Returns whether the request was rejected by a rate
+        limit, in which case it should be made again once acquire() allows it.
+
+        Keyword arguments:
+        code -- HTTP status code of the response
+        headers -- dictionary of the rate limit headers of the response, as returned by determine_rate_limit_headers()
+        secondary_rate_limit_message -- whether the body of the response is a secondary rate limit message
+        """
+        self.update(headers=headers)
+        if code not in (403, 429):
+            return False
+
+        retry_after = headers.get("Retry-After")
+        if headers.get("X-RateLimit-Remaining") == "0" and retry_after is None:
+            # primary rate limit, acquire() waits for the reset
+            with self.condition:
+                self.rate_limited_count += 1
+            return True
+        if retry_after is None and not secondary_rate_limit_message:
+            return False
+        self.handle_secondary_rate_limit(retry_after=retry_after)
+        return True
+
+    def handle_secondary_rate_limit(self, retry_after=None):
+        """Block all requests for the time given by the Retry-After header of the secondary rate limit response, or
+        with exponential backoff if the response doesn't have the header."""
+        with self.condition:
+            self.rate_limited_count += 1
+            if retry_after is None:
+                delay = github_api_secondary_rate_limit_delay * 2 ** min(self.consecutive_secondary_rate_limits, 5)
+            else:
+                delay = int(retry_after)
+            self.consecutive_secondary_rate_limits += 1
+            self.blocked_until = max(self.blocked_until, time.time() + delay)
+        inoliblist.logger.warning("GitHub API secondary rate limit reached, waiting " + str(delay) + " s")
+
+    def log_statistics(self):
+        with self.condition:
+            self.statistics_time = time.monotonic()
+            rate_limit_statistics = [resource + " " + str(rate_limit["remaining"]) + "/" + str(rate_limit["limit"]) +
+                                     " remaining, reset in " + str(max(int(rate_limit["reset"] - time.time()), 0)) +
+                                     " s"
+                                     for resource, rate_limit in sorted(self.rate_limits.items())]
+            inoliblist.logger.info("GitHub API: " + str(self.request_count) + " requests, " +
+                                   str(self.rate_limited_count) + " rate limited, " +
+                                   str(int(self.wait_time)) + " s waiting" +
+                                   "".join("; " + statistic for statistic in rate_limit_statistics))
+
+
+class GitHubAPIRateLimiterManager(multiprocessing.managers.BaseManager):
+    """Server process of the GitHubAPIRateLimiter shared by the worker processes of --jobs."""
+
+
+GitHubAPIRateLimiterManager.register("GitHubAPIRateLimiter", GitHubAPIRateLimiter)
+
+
+class InoliblistDownload(io.RawIOBase):
+    """Conditional download of inoliblist.csv that updates the copy saved by the previous run.
+
+    The ETag and Last-Modified headers of the response are saved alongside the copy and used to make a conditional
+    request next time, so the file is only downloaded again when it has changed. The download can be read as it arrives,
+    which allows processing of inoliblist to start before the download is finished. The copy is only replaced once the
+    download is complete.
+    """
+
+    def __init__(self, url, path):
+        super().__init__()
+        self.url = url
+        self.path = path
+        self.metadata_path = path + inoliblist_download_metadata_extension
+        self.temporary_path = path + "." + str(os.getpid()) + ".tmp"
+        self.response = None
+        self.temporary_file = None
+
+    def start(self):
+        """Make the request. Returns True if the response must be read, or False if the saved copy is to be used."""
+        headers = {}
+        metadata = read_json_file(file_path=self.metadata_path)
+        if metadata is not None and metadata.get("url") == self.url and os.path.isfile(self.path):
+            if metadata.get("etag") is not None:
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified") is not None:
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            self.response = urllib.request.urlopen(urllib.request.Request(url=self.url, headers=headers),
+                                                   timeout=inoliblist_download_timeout)
+        except urllib.error.HTTPError as exception:
+            if exception.code == 304 and headers:
+                inoliblist.logger.info("inoliblist has not changed since the previous download")
+                return False
+            self.use_saved_copy(exception=exception)
+            return False
+        except OSError as exception:
+            self.use_saved_copy(exception=exception)
+            return False
+
+        inoliblist.logger.info("Downloading inoliblist from " + self.url)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.temporary_file = open(file=self.temporary_path, mode='wb')
+        return True
+
+    def use_saved_copy(self, exception):
+        if not os.path.isfile(self.path):
+            raise exception
+        inoliblist.logger.warning("Unable to download inoliblist (" + str(exception) + "), using the previous download")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.response.read(len(buffer))
+        if data:
+            self.temporary_file.write(data)
+        else:
+            self.finish()
+        buffer[:len(data)] = data
+        return len(data)
+
+    def read_to_end(self):
+        buffer = bytearray(inoliblist_download_chunk_size)
+        while self.readinto(buffer):
+            pass
+
+    def finish(self):
+        """Replace the saved copy with the completed download."""
+        if self.temporary_file is None:
+            return
+        self.temporary_file.close()
+        self.temporary_file = None
+        os.replace(self.temporary_path, self.path)
+        write_json_file(file_path=self.metadata_path,
+                        json_data={"url": self.url,
+                                   "etag": self.response.headers.get("ETag"),
+                                   "last_modified": self.response.headers.get("Last-Modified")})
+
+    def close(self):
+        if self.temporary_file is not None:
+            # the download is incomplete so the saved copy is kept
+            self.temporary_file.close()
+            self.temporary_file = None
+            os.remove(self.temporary_path)
+        if self.response is not None:
+            self.response.close()
+            self.response = None
+        super().close()
+
+
+class InolibbuglistOutputFile:
+    """Writes the rows of the inolibbuglist table to the output file as they are produced, so partial results are
+    available during the run and the rows don't have to be kept in memory."""
+
+    def __init__(self, output_path):
+        self.output_file = open(file=output_path,
+                                mode='w',
+                                encoding=inoliblist.file_encoding,
+                                newline=inoliblist.file_newline
+                                )
+        self.output_csv = csv.writer(self.output_file,
+                                     delimiter=inoliblist.output_file_delimiter,
+                                     quotechar=inoliblist.output_file_quotechar)
+        self.unflushed_row_count = 0
+        self.flush_time = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        self.output_file.close()
+
+    def write_row(self, row_list):
+        self.output_csv.writerow(row_list)
+        self.unflushed_row_count += 1
+        if (self.unflushed_row_count >= output_file_flush_row_interval or
+                time.monotonic() - self.flush_time >= output_file_flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.output_file.flush()
+        self.unflushed_row_count = 0
+        self.flush_time = time.monotonic()
+
+
+class InolibbuglistJournal:
+    """Append-only record of the completed inolibbuglist rows, which allows an interrupted run to be resumed.
+
+    Only the URLs of the completed rows are kept in memory. The rows completed by the interrupted run are read from the
+    journal file when they are reused.
+    """
+
+    def __init__(self, journal_path, resume_journal):
+        """
+        Keyword arguments:
+        journal_path -- path of the journal file
+        resume_journal -- reuse the rows completed by the previous run from the journal and continue it, rather than
+                          starting a new journal
+        """
+        self.journal_path = journal_path
+        self.completed_repository_urls = set()
+        # offsets of the entries of the rows completed by the interrupted run in the journal file, by repository URL
+        self.resumed_row_offsets = {}
+        self.journal_reader = None
+
+        # rewrite the journal so an incomplete last entry doesn't corrupt the entries appended to it
+        temporary_journal_path = journal_path + ".tmp"
+        with open(file=temporary_journal_path, mode='wb') as temporary_journal_file:
+            if resume_journal and os.path.isfile(journal_path):
+                with open(file=journal_path, mode='rb') as journal_file:
+                    for line in journal_file:
+                        try:
+                            journal_entry = json.loads(line.decode(encoding="utf-8"))
+                        except ValueError:
+                            # the last entry is incomplete if the run was interrupted while writing it
+                            break
+                        repository_url = journal_entry["repository_url"]
+                        if repository_url not in self.completed_repository_urls:
+                            self.completed_repository_urls.add(repository_url)
+                            self.resumed_row_offsets[repository_url] = temporary_journal_file.tell()
+                            temporary_journal_file.write(line.rstrip(b"\n") + b"\n")
+                inoliblist.logger.info("Resuming with " + str(len(self.completed_repository_urls)) + " completed rows")
+        os.replace(temporary_journal_path, journal_path)
+        self.journal_file = open(file=journal_path, mode='a', encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def close(self):
+        self.journal_file.close()
+        if self.journal_reader is not None:
+            self.journal_reader.close()
+
+    def append(self, row_list):
+        repository_url = row_list[inoliblist.Column.repository_url]
+        if repository_url not in self.completed_repository_urls:
+            self.completed_repository_urls.add(repository_url)
+            self.journal_file.write(json.dumps({"repository_url": repository_url, "row": list(row_list)}) + '\n')
+            self.journal_file.flush()
+
+    def read_resumed_row(self, repository_url):
+        """Return the row completed by the interrupted run for the repository, or None if there is none."""
+        resumed_row_offset = self.resumed_row_offsets.get(repository_url)
+        if resumed_row_offset is None:
+            return None
+        if self.journal_reader is None:
+            self.journal_reader = open(file=self.journal_path, mode='rb')
+        self.journal_reader.seek(resumed_row_offset)
+        return InolibbuglistRow(row_list=json.loads(self.journal_reader.readline().decode(encoding="utf-8"))["row"])
+
+
+class InolibbuglistIndex:
+    """Bitmap index of the columns of inolibbuglist.csv for answering queries without rescanning the file.
+
+    The bitmap of each column is an integer with bit n set if the column of row n is "True".
+    """
+
+    def __init__(self, repository_urls, bitmaps):
+        self.repository_urls = repository_urls
+        # dictionary of the bitmaps, by column index
+        self.bitmaps = bitmaps
+        self.all_rows_bitmap = (1 << len(repository_urls)) - 1
+
+    @classmethod
+    def from_file(cls, input_path):
+        """Return the index of the file, using the cached index if the file has not changed since it was built."""
+        input_file_status = os.stat(input_path)
+        cache_path = (query_index_cache_folder + '/' +
+                      hashlib.sha256(os.path.abspath(input_path).encode()).hexdigest() + ".pickle")
+        cache_key = (input_file_status.st_mtime_ns, input_file_status.st_size, Column.count)
+        try:
+            with open(file=cache_path, mode='rb') as cache_file:
+                cached_index = pickle.load(cache_file)
+            if cached_index["cache_key"] == cache_key:
+                return cls(repository_urls=cached_index["repository_urls"], bitmaps=cached_index["bitmaps"])
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError):
+            pass
+
+        with open(file=input_path,
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as input_file:
+            input_csv = csv.reader(input_file,
+                                   delimiter=inoliblist.output_file_delimiter,
+                                   quotechar=inoliblist.output_file_quotechar)
+            # skip the column heading row
+            next(input_csv)
+            repository_urls = []
+            true_row_numbers = {}
+            for row_number, input_row in enumerate(input_csv):
+                repository_urls.append(input_row[inoliblist.Column.repository_url])
+                for column_index, cell_contents in enumerate(input_row):
+                    if cell_contents == "True":
+                        true_row_numbers.setdefault(column_index, []).append(row_number)
+
+        bitmaps = {}
+        for column_index, row_numbers in true_row_numbers.items():
+            bitmap_bytes = bytearray((len(repository_urls) + 7) // 8)
+            for row_number in row_numbers:
+                bitmap_bytes[row_number // 8] |= 1 << (row_number % 8)
+            bitmaps[column_index] = int.from_bytes(bitmap_bytes, byteorder="little")
+
+        os.makedirs(query_index_cache_folder, exist_ok=True)
+        with open(file=cache_path, mode='wb') as cache_file:
+            pickle.dump({"cache_key": cache_key, "repository_urls": repository_urls, "bitmaps": bitmaps}, cache_file)
+        return cls(repository_urls=repository_urls, bitmaps=bitmaps)
+
+    def query(self, expression):
+        """Return the list of the repository URLs of the rows that match the query expression.
+
+        The expression consists of column names (the attribute names of Column and inoliblist.Column), which match the
+        rows where the column is "True", combined with and, or, not, and parentheses. The operators may also be written
+        as &, |, and ~.
+        """
+        tokens = query_token_regex.findall(expression)
+        if "".join(tokens) != re.sub(r"\s", "", expression):
+            raise ValueError("Invalid characters in query: " + expression)
+        bitmap, position = self.evaluate_or(tokens=tokens, position=0)
+        if position != len(tokens):
+            raise ValueError("Unexpected \"" + tokens[position] + "\" in query: " + expression)
+        repository_urls = []
+        bitmap_bytes = bitmap.to_bytes(length=(len(self.repository_urls) + 7) // 8, byteorder="little")
+        for byte_index, bitmap_byte in enumerate(bitmap_bytes):
+            # most bytes of the bitmap of a selective query are empty
+            if bitmap_byte:
+                for bit_index in range(8):
+                    if bitmap_byte >> bit_index & 1:
+                        repository_urls.append(self.repository_urls[byte_index * 8 + bit_index])
+        return repository_urls
+
+    def evaluate_or(self, tokens, position):
+        bitmap, position = self.evaluate_and(tokens=tokens, position=position)
+        while position < len(tokens) and tokens[position].lower() in ("or", "|"):
+            operand_bitmap, position = self.evaluate_and(tokens=tokens, position=position + 1)
+            bitmap |= operand_bitmap
+        return bitmap, position
+
+    def evaluate_and(self, tokens, position):
+        bitmap, position = self.evaluate_not(tokens=tokens, position=position)
+        while position < len(tokens) and tokens[position].lower() in ("and", "&"):
+            operand_bitmap, position = self.evaluate_not(tokens=tokens, position=position + 1)
+            bitmap &= operand_bitmap
+        return bitmap, position
+
+    def evaluate_not(self, tokens, position):
+        if position >= len(tokens):
+            raise ValueError("Unexpected end of query")
+        token = tokens[position]
+        if token.lower() in ("not", "~"):
+            bitmap, position = self.evaluate_not(tokens=tokens, position=position + 1)
+            return self.all_rows_bitmap & ~bitmap, position
+        if token == '(':
+            bitmap, position = self.evaluate_or(tokens=tokens, position=position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError("Missing \")\" in query")
+            return bitmap, position + 1
+        column_index = determine_column_indexes().get(token)
+        if column_index is None:
+            raise ValueError("Unknown column in query: " + token)
+        return self.bitmaps.get(column_index, 0), position + 1
+
+
 # Globals
 table = [[""] * Column.count]
+github_token = ""
 github_login = ""
 git_command = default_git_command
 bash_command = default_bash_command
@@ -253,6 +1276,52 @@ arduino_ci_script_application_folder = ""
 browser_command = ""
 process_repos_with_open_pr = process_repos_with_open_pr_default
 check_for_typos = check_for_typos_default
+jobs = default_jobs
+github_api_concurrency = default_github_api_concurrency
+use_graphql = False
+# GraphQL node ID of github_login, populated by determine_github_user_id()
+github_user_id = None
+# (B)
+github_api_cache_maximum_size = default_github_api_cache_maximum_size * 1024 * 1024
+# size of the GitHub API cache, determined on the first write of the run
+github_api_cache_size = None
+github_api_cache_hits = 0
+github_api_cache_misses = 0
+github_api_cache_lock = threading.Lock()
+incremental = False
+# (B)
+archive_cache_maximum_size = default_archive_cache_maximum_size * 1024 * 1024
+# size of the archive cache, determined on the first download of the run
+archive_cache_size = None
+check_engine = default_check_engine
+bash_worker = False
+scratch_folder = default_scratch_folder
+# the ScratchFolderManager of this process
+scratch_folder_manager = None
+# the GitHubAPIRateLimiter of this process, or the proxy of the one shared by the worker processes of --jobs
+github_api_rate_limiter = None
+# process the rate limiter was set for
+github_api_rate_limiter_process_id = None
+resume = False
+inoliblist_url = inoliblist_csv_download_url
+stream_inoliblist = False
+# the ArduinoCIScriptWorker of this process
+arduino_ci_script_worker = None
+# names of the Arduino IDE reference pages, loaded by load_reference_links()
+reference_links = None
+# codespell's dictionary, loaded by load_misspellings()
+misspellings = None
+# Aho-Corasick automaton of codespell's dictionary, loaded by load_typo_automaton()
+typo_automaton = None
+arduino_ci_script_commit = ""
+# in-memory index of the blacklists, populated by load_blacklists()
+owner_blacklist = set()
+repository_blacklist = set()
+blacklist_modification_times = {}
+# casefolded full names of the repositories where I have open PRs and issues, populated by index_my_open_items()
+# None means the repositories must be checked individually
+my_open_pull_requests = None
+my_open_issues = None
 
 bash_script_success_exit_status = 0
 arduino_ci_script_exit_statuses = {
@@ -340,6 +1409,146 @@ arduino_ci_script_exit_statuses = {
     }
 }
 
+sketch_extensions = (".ino", ".pde")
+header_file_extensions = (".h", ".hh", ".hpp")
+# dot folders that are expected in a library root folder
+non_spurious_dot_folder_names = (".git", ".github", ".svn", ".hg")
+valid_folder_name_first_character_regex = re.compile(r"[a-zA-Z0-9]")
+invalid_folder_name_character_regex = re.compile(r"[^a-zA-Z0-9_.-]")
+maximum_folder_name_length = 63
+# library names may also contain spaces
+invalid_library_name_character_regex = re.compile(r"[^a-zA-Z0-9 _.-]")
+utf_8_bom = "\ufeff"
+misspelled_library_properties_filename_regex = re.compile(r"^librar(y|ies)[._ -]?propert(y|ie|ies)(\.txt)?$",
+                                                          re.IGNORECASE)
+# the check_library_properties exit statuses for missing required fields
+required_library_properties_keys = (("name", 9),
+                                    ("version", 10),
+                                    ("author", 11),
+                                    ("maintainer", 12),
+                                    ("sentence", 13),
+                                    ("paragraph", 14),
+                                    ("category", 15),
+                                    ("url", 16))
+# library.properties keys, lowercased with separators removed, mapped to the correctly spelled key and the
+# check_library_properties exit status for a misspelling
+misspelled_library_properties_keys = {
+    "architecture": ("architectures", 4),
+    "architectures": ("architectures", 4),
+    "include": ("includes", 23),
+    "includes": ("includes", 23),
+    "dotalinkage": ("dot_a_linkage", 24),
+    "dotalink": ("dot_a_linkage", 24),
+    "precompile": ("precompiled", 25),
+    "precompiled": ("precompiled", 25),
+    "ldflag": ("ldflags", 26),
+    "ldflags": ("ldflags", 26)
+}
+# relaxed semver, as accepted by the Library Manager
+valid_library_version_regex = re.compile(
+    r"^(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*)){0,2}(-[0-9A-Za-z.-]+)?(\+[0-9A-Za-z.-]+)?$"
+)
+valid_library_categories = frozenset(("Display",
+                                      "Communication",
+                                      "Signal Input/Output",
+                                      "Sensors",
+                                      "Device Control",
+                                      "Timing",
+                                      "Data Storage",
+                                      "Data Processing",
+                                      "Other"))
+valid_library_architectures = frozenset(("*",
+                                         "avr",
+                                         "megaavr",
+                                         "sam",
+                                         "samd",
+                                         "nrf51",
+                                         "nrf52",
+                                         "arc32",
+                                         "esp8266",
+                                         "esp32",
+                                         "stm32",
+                                         "stm32f1",
+                                         "stm32f4",
+                                         "STM32F1",
+                                         "STM32F4",
+                                         "i586",
+                                         "i686",
+                                         "pic32",
+                                         "teensy",
+                                         "mbed",
+                                         "nRF5",
+                                         "rp2040"))
+# common mistakes, architecture names are case sensitive
+invalid_library_architectures = frozenset(valid_architecture_variant
+                                          for valid_architecture in valid_library_architectures
+                                          for valid_architecture_variant in (valid_architecture.upper(),
+                                                                             valid_architecture.lower(),
+                                                                             valid_architecture.capitalize())
+                                          if valid_architecture_variant not in valid_library_architectures)
+url_scheme_regex = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
+# (s) timeout of the requests used to check whether the library.properties url is dead
+url_check_timeout = 30
+misspelled_keywords_txt_filename_regex = re.compile(r"^key[ _-]?words?([._ -]?txt)?$", re.IGNORECASE)
+keywords_txt_space_separated_line_regex = re.compile(r"^\S+ +\S+")
+valid_keyword_regex = re.compile(r"^[a-zA-Z0-9_]+$")
+valid_keyword_tokentypes = frozenset(("KEYWORD1",
+                                      "KEYWORD2",
+                                      "KEYWORD3",
+                                      "LITERAL1",
+                                      "LITERAL2"))
+valid_rsyntaxtextarea_tokentypes = frozenset(("COMMENT_DOCUMENTATION",
+                                              "COMMENT_EOL",
+                                              "COMMENT_KEYWORD",
+                                              "COMMENT_MARKUP",
+                                              "COMMENT_MULTILINE",
+                                              "DATA_TYPE",
+                                              "ERROR_CHAR",
+                                              "ERROR_IDENTIFIER",
+                                              "ERROR_NUMBER_FORMAT",
+                                              "ERROR_STRING_DOUBLE",
+                                              "FUNCTION",
+                                              "IDENTIFIER",
+                                              "LITERAL_BACKQUOTE",
+                                              "LITERAL_BOOLEAN",
+                                              "LITERAL_CHAR",
+                                              "LITERAL_NUMBER_DECIMAL_INT",
+                                              "LITERAL_NUMBER_FLOAT",
+                                              "LITERAL_NUMBER_HEXADECIMAL",
+                                              "LITERAL_STRING_DOUBLE_QUOTE",
+                                              "MARKUP_CDATA",
+                                              "MARKUP_CDATA_DELIMITER",
+                                              "MARKUP_COMMENT",
+                                              "MARKUP_DTD",
+                                              "MARKUP_ENTITY_REFERENCE",
+                                              "MARKUP_PROCESSING_INSTRUCTION",
+                                              "MARKUP_TAG_ATTRIBUTE",
+                                              "MARKUP_TAG_ATTRIBUTE_VALUE",
+                                              "MARKUP_TAG_DELIMITER",
+                                              "MARKUP_TAG_NAME",
+                                              "OPERATOR",
+                                              "PREPROCESSOR",
+                                              "REGEX",
+                                              "RESERVED_WORD",
+                                              "RESERVED_WORD_2",
+                                              "SEPARATOR",
+                                              "VARIABLE",
+                                              "WHITESPACE"))
+# path of the reference pages under the Arduino IDE installation folder
+arduino_ide_reference_folder = ("reference", "www.arduino.cc", "en", "Reference")
+# codespell's default dictionaries, in the data folder of codespell_lib
+codespell_dictionary_filenames = ("dictionary.txt", "dictionary_rare.txt")
+# codespell's definition of a word
+codespell_word_regex = re.compile(r"[\w\-'\u2019]+")
+codespell_non_word_character_regex = re.compile(r"[^\w\-'\u2019]")
+# bytes.translate() table that replaces the ASCII non-word characters with spaces
+ascii_non_word_character_translation = bytes(character if re.match(r"[a-zA-Z0-9_\-']", chr(character)) else ord(' ')
+                                             for character in range(256))
+# codespell ignores a misspelling that is actually a valid word preceded by one of these string escape sequences
+string_escape_characters = ("a", "b", "f", "n", "r", "t", "v")
+# files are considered binary if there is a null byte in this many bytes at the start
+binary_file_sniff_length = 1024
+
 
 def initialize_table(inoliblist_csv):
     """Fill in the first row of the table with the heading text."""
@@ -441,7 +1650,7 @@ def initialize_table(inoliblist_csv):
 
 
 def main():
-    inoliblist.set_github_token(github_token_input=argument.github_token)
+    set_github_token(github_token_input=argument.github_token)
     inoliblist.set_verbosity(enable_verbosity_input=argument.enable_verbosity)
 
     inoliblist.logger.info("Starting")
@@ -457,22 +1666,71 @@ def main():
         arduino_ci_script_application_folder_input=argument.arduino_ci_script_application_folder
     )
     set_browser_command(browser_command_input=argument.browser_command)
+    set_jobs(jobs_input=argument.jobs)
+    set_github_api_concurrency(github_api_concurrency_input=argument.github_api_concurrency)
+    set_use_graphql(use_graphql_input=argument.use_graphql)
+    set_github_api_cache_maximum_size(github_api_cache_maximum_size_input=argument.github_api_cache_maximum_size)
+    set_incremental(incremental_input=argument.incremental)
+    set_archive_cache_maximum_size(archive_cache_maximum_size_input=argument.archive_cache_maximum_size)
+    set_check_engine(check_engine_input=argument.check_engine)
+    set_bash_worker(bash_worker_input=argument.bash_worker)
+    set_scratch_folder(scratch_folder_input=argument.scratch_folder)
+    set_resume(resume_input=argument.resume)
+    set_inoliblist_url(inoliblist_url_input=argument.inoliblist_url)
+    set_stream_inoliblist(stream_inoliblist_input=argument.stream_inoliblist)
 
-    clean_folder(output_folder_name)
-    clean_folder(inoliblist_input_folder_name)
+    if argument.query is not None:
+        run_query(expression=argument.query, script_filename=argument.query_script_filename)
+        return
+
+    if resume:
+        # everything in the output folder except the journal of the interrupted run is regenerated
+        os.makedirs(output_folder_name, exist_ok=True)
+        for output_filename in os.listdir(output_folder_name):
+            if output_filename != journal_filename:
+                os.remove(output_folder_name + "/" + output_filename)
+    else:
+        clean_folder(output_folder_name)
     clean_folder(work_folder_name)
+    get_scratch_folder_manager().remove_folders()
+
+    index_my_open_items()
 
     process_verification_failed_list(
         verification_failed_list_path=input_folder_name + "/" + inoliblist.verification_failed_list_filename)
 
-    # download inoliblist.csv
-    urllib.request.urlretrieve(url=inoliblist_csv_download_url, filename=default_inoliblist_path)
-    install_tools()
-    process_inoliblist(inoliblist_path=default_inoliblist_path)
-    create_inolibbuglist_output_file()
+    # the inoliblist download is streamed by process_inoliblist()
+    inoliblist_stream_url = None
+    if resume and os.path.isfile(default_inoliblist_path):
+        inoliblist.logger.info("Resuming: using the previously downloaded inoliblist")
+    elif stream_inoliblist:
+        inoliblist_stream_url = inoliblist_url
+    else:
+        download_inoliblist(url=inoliblist_url, path=default_inoliblist_path)
+    if resume and os.path.isfile(arduino_ci_script_path):
+        inoliblist.logger.info("Resuming: using the previously installed tools")
+    else:
+        install_tools()
+    set_arduino_ci_script_commit(arduino_ci_script_commit_input=determine_arduino_ci_script_commit())
+    process_inoliblist(inoliblist_path=default_inoliblist_path,
+                       inoliblist_url=inoliblist_stream_url,
+                       output_path=output_folder_name + "/" + inolibbuglist_filename,
+                       journal_path=output_folder_name + "/" + journal_filename)
 
     create_open_in_tabs_scripts()
 
+    log_github_api_cache_statistics()
+    get_github_api_rate_limiter().log_statistics()
+
+    if arduino_ci_script_worker is not None:
+        arduino_ci_script_worker.stop()
+
+
+def set_github_token(github_token_input):
+    global github_token
+    github_token = github_token_input
+    inoliblist.set_github_token(github_token_input=github_token_input)
+
 
 def set_github_login(github_login_input):
     global github_login
@@ -519,6 +1777,75 @@ def set_check_for_typos(check_for_typos_input):
     check_for_typos = check_for_typos_input
 
 
+def set_jobs(jobs_input):
+    global jobs
+    jobs = jobs_input
+
+
+def set_github_api_concurrency(github_api_concurrency_input):
+    global github_api_concurrency
+    github_api_concurrency = github_api_concurrency_input
+
+
+def set_use_graphql(use_graphql_input):
+    global use_graphql
+    use_graphql = use_graphql_input
+
+
+def set_github_api_cache_maximum_size(github_api_cache_maximum_size_input):
+    """Set the maximum size of the GitHub API cache in MB."""
+    global github_api_cache_maximum_size
+    github_api_cache_maximum_size = github_api_cache_maximum_size_input * 1024 * 1024
+
+
+def set_incremental(incremental_input):
+    global incremental
+    incremental = incremental_input
+
+
+def set_archive_cache_maximum_size(archive_cache_maximum_size_input):
+    """Set the maximum size of the archive cache in MB."""
+    global archive_cache_maximum_size
+    archive_cache_maximum_size = archive_cache_maximum_size_input * 1024 * 1024
+
+
+def set_check_engine(check_engine_input):
+    global check_engine
+    check_engine = check_engine_input
+
+
+def set_bash_worker(bash_worker_input):
+    global bash_worker
+    bash_worker = bash_worker_input
+
+
+def set_resume(resume_input):
+    global resume
+    resume = resume_input
+
+
+def set_inoliblist_url(inoliblist_url_input):
+    global inoliblist_url
+    inoliblist_url = inoliblist_url_input
+
+
+def set_stream_inoliblist(stream_inoliblist_input):
+    global stream_inoliblist
+    stream_inoliblist = stream_inoliblist_input
+
+
+def set_scratch_folder(scratch_folder_input):
+    global scratch_folder
+    global scratch_folder_manager
+    scratch_folder = scratch_folder_input
+    scratch_folder_manager = None
+
+
+def set_arduino_ci_script_commit(arduino_ci_script_commit_input):
+    global arduino_ci_script_commit
+    arduino_ci_script_commit = arduino_ci_script_commit_input
+
+
 def process_verification_failed_list(verification_failed_list_path):
     """Output a list of whether I have an open PR in the repos that failed inoliblist library verification"""
     inoliblist.logger.info("Processing verification failed list")
@@ -558,60 +1885,139 @@ def write_to_verification_failed_output_file(write_string):
 
 
 def check_blacklist(repository_url):
+    load_blacklists()
+
     repository_owner = determine_repository_owner(repository_url=repository_url)
-    with open(file=data_folder_name + "/" + owner_blacklist_filename,
-              mode='r',
-              encoding=inoliblist.file_encoding,
-              newline=inoliblist.file_newline
-              ) as owner_blacklist_file:
-        owner_blacklist_csv = csv.reader(owner_blacklist_file,
-                                         delimiter=inoliblist.output_file_delimiter,
-                                         quotechar=inoliblist.output_file_quotechar)
-        # skip the heading row
-        next(owner_blacklist_csv)
+    if repository_owner.casefold() in owner_blacklist:
+        # the owner of the repository is blacklisted
+        inoliblist.logger.info("Owner " + repository_owner + " is blacklisted.")
+        return True
 
-        for owner_blacklist_row in owner_blacklist_csv:
-            # assumes the first column is the Owner column, but that's reasonable
-            if owner_blacklist_row[0].strip().lower() == repository_owner.lower():
-                # the owner of the repository is blacklisted
-                inoliblist.logger.info("Owner " + repository_owner + " is blacklisted.")
-                return True
+    repository_full_name = determine_repository_full_name(repository_url=repository_url)
+    if repository_full_name.casefold() in repository_blacklist:
+        # the repository is blacklisted
+        inoliblist.logger.info("Repository " + repository_full_name + " is blacklisted.")
+        return True
+
+    # the repository is not blacklisted
+    return False
+
+
+def load_blacklists():
+    """Load the blacklists into the in-memory index. The files are only parsed again if they have been modified."""
+    global owner_blacklist
+    global repository_blacklist
 
-    with open(file=data_folder_name + "/" + repository_blacklist_filename,
+    owner_blacklist_path = data_folder_name + "/" + owner_blacklist_filename
+    owner_blacklist_modification_time = os.path.getmtime(owner_blacklist_path)
+    if blacklist_modification_times.get(owner_blacklist_path) != owner_blacklist_modification_time:
+        # assumes the first column is the Owner column, but that's reasonable
+        owner_blacklist = {owner_blacklist_row[0].strip().casefold() for owner_blacklist_row in
+                           read_blacklist(blacklist_path=owner_blacklist_path)}
+        blacklist_modification_times[owner_blacklist_path] = owner_blacklist_modification_time
+
+    repository_blacklist_path = data_folder_name + "/" + repository_blacklist_filename
+    repository_blacklist_modification_time = os.path.getmtime(repository_blacklist_path)
+    if blacklist_modification_times.get(repository_blacklist_path) != repository_blacklist_modification_time:
+        # assumes the first column is the Repository column, but that's reasonable
+        repository_blacklist = {
+            determine_repository_full_name(repository_url=repository_blacklist_row[0]).casefold()
+            for repository_blacklist_row in read_blacklist(blacklist_path=repository_blacklist_path)
+        }
+        blacklist_modification_times[repository_blacklist_path] = repository_blacklist_modification_time
+
+
+def read_blacklist(blacklist_path):
+    """Return a list of the rows of a blacklist file, without the heading row."""
+    with open(file=blacklist_path,
               mode='r',
               encoding=inoliblist.file_encoding,
               newline=inoliblist.file_newline
-              ) as repository_blacklist_file:
-        repository_blacklist_csv = csv.reader(repository_blacklist_file,
-                                              delimiter=inoliblist.output_file_delimiter,
-                                              quotechar=inoliblist.output_file_quotechar)
+              ) as blacklist_file:
+        blacklist_csv = csv.reader(blacklist_file,
+                                   delimiter=inoliblist.output_file_delimiter,
+                                   quotechar=inoliblist.output_file_quotechar)
         # skip the heading row
-        next(repository_blacklist_csv)
-
-        repository_full_name = determine_repository_full_name(repository_url=repository_url)
-        for repository_blacklist_row in repository_blacklist_csv:
-            # assumes the first column is the Repository column, but that's reasonable
-            if determine_repository_full_name(
-                    repository_url=repository_blacklist_row[0]
-            ).lower() == repository_full_name.lower():
-                # the repository is blacklisted
-                inoliblist.logger.info("Repository " + repository_full_name + " is blacklisted.")
-                return True
-    # the repository is not blacklisted
-    return False
+        next(blacklist_csv)
+
+        # skip blank lines
+        return [blacklist_row for blacklist_row in blacklist_csv if blacklist_row]
+
+
+def get_owner_blacklist():
+    """Return the owner_blacklist global variable. Used by the unit tests to check the value."""
+    return owner_blacklist
+
+
+def get_repository_blacklist():
+    """Return the repository_blacklist global variable. Used by the unit tests to check the value."""
+    return repository_blacklist
 
 
 def determine_repository_owner(repository_url):
     return repository_url.split('/')[3].strip()
 
 
+def index_my_open_items():
+    """Find all repositories where I have an open PR or issue with a search sweep so that check_for_open_pr() and
+    check_for_open_issue() don't need to page through every open PR and issue of each repository."""
+    global my_open_pull_requests
+    global my_open_issues
+
+    if not github_login:
+        # nothing can be mine
+        my_open_pull_requests = set()
+        my_open_issues = set()
+        return
+
+    inoliblist.logger.info("Searching for my open pull requests and issues")
+    my_open_pull_requests = search_my_open_items(type_qualifier="pr")
+    my_open_issues = search_my_open_items(type_qualifier="issue")
+
+
+def search_my_open_items(type_qualifier):
+    """Return the set of casefolded full names of the repositories where I have an open item of the given type ("pr"
+    or "issue"), or None if the search failed or returned more results than the search API makes available.
+    """
+    repository_full_names = set()
+    page_number = 1
+    additional_pages = True
+    while additional_pages:
+        try:
+            get_github_api_response_return = get_github_api_response(
+                request="search/issues",
+                request_parameters="q=is:open+is:" + type_qualifier + "+author:" + github_login,
+                page_number=page_number,
+                # the search sweep avoids the open item requests for each repository
+                priority=True)
+        except urllib.error.URLError:
+            inoliblist.logger.warning("HTTP error while searching for my open items of type " + type_qualifier)
+            return None
+        json_data = get_github_api_response_return["json_data"]
+        if json_data["total_count"] > github_search_result_limit:
+            inoliblist.logger.warning("Too many open items of type " + type_qualifier +
+                                      " to search, checking each repository instead")
+            return None
+
+        for item in json_data["items"]:
+            # the repository_url item is in the format https://api.github.com/repos/{owner}/{repo}
+            repository_full_names.add("/".join(item["repository_url"].split('/')[-2:]).casefold())
+
+        additional_pages = get_github_api_response_return["additional_pages"]
+        page_number += 1
+    return repository_full_names
+
+
 def check_for_open_pr(repository_full_name):
+    if my_open_pull_requests is not None:
+        return repository_full_name.casefold() in my_open_pull_requests
+
     i_have_open_pull_request = False
     page_number = 1
     additional_pages = True
     while additional_pages:
         try:
-            get_github_api_response_return = inoliblist.get_github_api_response(
+            get_github_api_response_return = get_github_api_response(
                 request="repos/" +
                         repository_full_name +
                         "/pulls",
@@ -627,25 +2033,524 @@ def check_for_open_pr(repository_full_name):
                 break
             additional_pages = get_github_api_response_return["additional_pages"]
             page_number += 1
-        except urllib.error.HTTPError:
-            # there was an unrecoverable HTTP error but this could have been caused by the repo being
+        except urllib.error.URLError:
+            # there was an unrecoverable HTTP or network error but this could have been caused by the repo being
             # deleted since inoliblist was created so just skip the repo
             inoliblist.logger.warning("HTTP error while checking if I have an open pull request")
             return None
     return i_have_open_pull_request
 
 
-def determine_repository_full_name(repository_url):
-    return repository_url.split('/')[3] + "/" + repository_url.split('/')[4].strip()
+def check_for_open_issue(repository_full_name):
+    if my_open_issues is not None:
+        i_have_open_issue = repository_full_name.casefold() in my_open_issues
+        if i_have_open_issue:
+            inoliblist.logger.info("I have an open issue")
+        return i_have_open_issue
 
+    i_have_open_issue = False
+    page_number = 1
+    additional_pages = True
+    while additional_pages:
+        try:
+            get_github_api_response_return = get_github_api_response(
+                request="repos/" +
+                        repository_full_name +
+                        "/issues",
+                request_parameters="state=open",
+                page_number=page_number)
+            json_data = list(get_github_api_response_return["json_data"])
 
-def clean_folder(folder_path):
-    if os.path.exists(folder_path):
-        # delete the folder
-        shutil.rmtree(folder_path, onerror=onerror)
-        time.sleep(create_folder_delay)
-    # create the folder
-    os.makedirs(folder_path)
+            for issue in json_data:
+                if issue["user"]["login"] == github_login:
+                    # GitHub considers pull requests to be issues (though issues are not pull requests)
+                    # so any item with a "pull_request" key must be excluded from the check
+                    if "pull_request" not in issue:
+                        inoliblist.logger.info("I have an open issue")
+                        i_have_open_issue = True
+                        break
+            if i_have_open_issue:
+                break
+
+            additional_pages = get_github_api_response_return["additional_pages"]
+            page_number += 1
+        except urllib.error.URLError:
+            # there was an unrecoverable HTTP or network error but this could have been caused by the repo being
+            # deleted since inoliblist was created so carry on
+            inoliblist.logger.warning("HTTP error while checking if I have an open issue")
+            return None
+    return i_have_open_issue
+
+
+def check_if_contributor(repository_full_name):
+    i_am_contributor = False
+    page_number = 1
+    additional_pages = True
+    while additional_pages:
+        try:
+            get_github_api_response_return = get_github_api_response(
+                request="repos/" +
+                        repository_full_name +
+                        "/contributors",
+                page_number=page_number)
+            json_data = list(get_github_api_response_return["json_data"])
+
+            for contributor in json_data:
+                if contributor["login"] == github_login:
+                    inoliblist.logger.info("I'm a contributor")
+                    i_am_contributor = True
+                    break
+            if i_am_contributor:
+                break
+
+            additional_pages = get_github_api_response_return["additional_pages"]
+            page_number += 1
+        except urllib.error.URLError:
+            # there was an unrecoverable HTTP or network error but this could have been caused by the repo being
+            # deleted since inoliblist was created so carry on
+            inoliblist.logger.warning("HTTP error while checking if I'm a contributor")
+            return None
+    return i_am_contributor
+
+
+def detect_arduino_library_topic_abuse(row_list):
+    """Return whether the repository uses the "arduino-library" topic but no library was found by inoliblist."""
+    return (
+        row_list[inoliblist.Column.library_path] == '' and
+        row_list[inoliblist.Column.github_topics].find("arduino-library") != -1
+    )
+
+
+def resolve_social_checks(inoliblist_rows):
+    """Do the open issue, open PR, and contributor checks for a batch of inoliblist rows.
+
+    Returns a list with an item for each row. The item is None for rows that won't need the checks (archived or
+    blacklisted), otherwise a dictionary of the check results. A result is None if the check was not needed or failed.
+    """
+    if use_graphql:
+        social_check_results, failed_row_indexes = resolve_social_checks_graphql(inoliblist_rows=inoliblist_rows)
+        if not failed_row_indexes:
+            return social_check_results
+        inoliblist.logger.warning("GraphQL API request failed, using the REST API instead for " +
+                                  str(len(failed_row_indexes)) + " repositories")
+    else:
+        social_check_results = [None] * len(inoliblist_rows)
+        failed_row_indexes = range(len(inoliblist_rows))
+
+    # the REST API checks are done concurrently
+    event_loop = asyncio.new_event_loop()
+    try:
+        rest_social_check_results = event_loop.run_until_complete(resolve_social_checks_async(
+            inoliblist_rows=[inoliblist_rows[row_index] for row_index in failed_row_indexes]
+        ))
+    finally:
+        event_loop.close()
+    for row_index, social_check_result in zip(failed_row_indexes, rest_social_check_results):
+        social_check_results[row_index] = social_check_result
+    return social_check_results
+
+
+async def resolve_social_checks_async(inoliblist_rows):
+    event_loop = asyncio.get_event_loop()
+    # get_github_api_response() is blocking so the requests are run in a thread pool, which also sets the
+    # maximum number of concurrent requests
+    with concurrent.futures.ThreadPoolExecutor(max_workers=github_api_concurrency) as executor:
+        async def run_check(check_function, repository_full_name):
+            return await event_loop.run_in_executor(executor, check_function, repository_full_name)
+
+        async def resolve_row(inoliblist_row_list):
+            if not determine_social_checks_needed(inoliblist_row_list=inoliblist_row_list):
+                return None
+
+            repository_full_name = (inoliblist_row_list[inoliblist.Column.repository_owner] + "/" +
+                                    inoliblist_row_list[inoliblist.Column.repository_name])
+            social_check_result = {"i_have_open_issue": None,
+                                   "i_have_open_pull_request": None,
+                                   "i_am_contributor": None}
+
+            async def resolve_open_issue():
+                if detect_arduino_library_topic_abuse(row_list=inoliblist_row_list):
+                    social_check_result["i_have_open_issue"] = await run_check(
+                        check_function=check_for_open_issue,
+                        repository_full_name=repository_full_name
+                    )
+
+            async def resolve_open_pull_request_and_contributor():
+                social_check_result["i_have_open_pull_request"] = await run_check(
+                    check_function=check_for_open_pr,
+                    repository_full_name=repository_full_name
+                )
+                # the contributor check is not needed if the row will be skipped due to an open PR
+                if social_check_result["i_have_open_pull_request"] is not True or process_repos_with_open_pr:
+                    social_check_result["i_am_contributor"] = await run_check(
+                        check_function=check_if_contributor,
+                        repository_full_name=repository_full_name
+                    )
+
+            await asyncio.gather(resolve_open_issue(), resolve_open_pull_request_and_contributor())
+            return social_check_result
+
+        return await asyncio.gather(*[resolve_row(inoliblist_row_list=inoliblist_row_list)
+                                      for inoliblist_row_list in inoliblist_rows])
+
+
+def determine_social_checks_needed(inoliblist_row_list):
+    """Return whether process_inoliblist_row() will need the social checks for the row."""
+    return not (inoliblist_row_list[inoliblist.Column.archived] == "True" or
+                check_blacklist(repository_url=inoliblist_row_list[inoliblist.Column.repository_url]))
+
+
+def resolve_social_checks_graphql(inoliblist_rows):
+    """Do the social checks for a batch of inoliblist rows with the GitHub GraphQL API, which can check many
+    repositories in a single request.
+
+    Returns the list of results in the format of resolve_social_checks() and the list of the indexes of the rows whose
+    request failed, which don't have a result yet.
+    """
+    social_check_results = [None] * len(inoliblist_rows)
+    row_indexes = [row_index for row_index, inoliblist_row_list in enumerate(inoliblist_rows)
+                   if determine_social_checks_needed(inoliblist_row_list=inoliblist_row_list)]
+    if github_user_id is None and not determine_github_user_id():
+        return social_check_results, row_indexes
+
+    failed_row_indexes = []
+    for batch_row_indexes in read_batches(iterable=row_indexes, batch_size=graphql_batch_size):
+        query_fields = []
+        for row_index in batch_row_indexes:
+            inoliblist_row_list = inoliblist_rows[row_index]
+            repository_owner = inoliblist_row_list[inoliblist.Column.repository_owner]
+            repository_name = inoliblist_row_list[inoliblist.Column.repository_name]
+            # the commit history of the default branch is what the contributors REST API endpoint is based on
+            query_fields.append(
+                "contributor" + str(row_index) + ": repository(owner: " + json.dumps(repository_owner) +
+                ", name: " + json.dumps(repository_name) + ") { defaultBranchRef { target { ... on Commit { " +
+                "history(first: 1, author: {id: " + json.dumps(github_user_id) + "}) { totalCount } } } } }"
+            )
+            # the PR and issue searches are only needed when they weren't already found by index_my_open_items()
+            for field_name, type_qualifier, my_open_items in (
+                    ("pull_request", "pr", my_open_pull_requests),
+                    ("issue", "issue", my_open_issues)
+            ):
+                if my_open_items is None:
+                    query_fields.append(
+                        field_name + str(row_index) + ": search(query: " +
+                        json.dumps("repo:" + repository_owner + "/" + repository_name + " is:open is:" +
+                                   type_qualifier + " author:" + github_login) +
+                        ", type: ISSUE, first: 1) { issueCount }"
+                    )
+
+        try:
+            json_data = get_github_graphql_response(query="query { " + " ".join(query_fields) + " }")["data"]
+        except (urllib.error.URLError, KeyError):
+            json_data = None
+        if json_data is None:
+            # the results of the other requests are still used
+            failed_row_indexes.extend(batch_row_indexes)
+            continue
+
+        for row_index in batch_row_indexes:
+            inoliblist_row_list = inoliblist_rows[row_index]
+            repository_full_name = (inoliblist_row_list[inoliblist.Column.repository_owner] + "/" +
+                                    inoliblist_row_list[inoliblist.Column.repository_name])
+            social_check_result = {"i_have_open_issue": None,
+                                   "i_have_open_pull_request": None,
+                                   "i_am_contributor": None}
+
+            repository_data = json_data.get("contributor" + str(row_index))
+            # the repository data is null if the repository has been deleted since inoliblist was created
+            if repository_data is not None:
+                if repository_data["defaultBranchRef"] is None:
+                    # empty repository
+                    social_check_result["i_am_contributor"] = False
+                else:
+                    social_check_result["i_am_contributor"] = (
+                        repository_data["defaultBranchRef"]["target"]["history"]["totalCount"] > 0
+                    )
+                if social_check_result["i_am_contributor"]:
+                    inoliblist.logger.info(repository_full_name + ": I'm a contributor")
+
+                if my_open_pull_requests is None:
+                    social_check_result["i_have_open_pull_request"] = (
+                        json_data["pull_request" + str(row_index)]["issueCount"] > 0
+                    )
+                else:
+                    social_check_result["i_have_open_pull_request"] = check_for_open_pr(
+                        repository_full_name=repository_full_name
+                    )
+
+                if detect_arduino_library_topic_abuse(row_list=inoliblist_row_list):
+                    if my_open_issues is None:
+                        social_check_result["i_have_open_issue"] = (
+                            json_data["issue" + str(row_index)]["issueCount"] > 0
+                        )
+                    else:
+                        social_check_result["i_have_open_issue"] = check_for_open_issue(
+                            repository_full_name=repository_full_name
+                        )
+
+            social_check_results[row_index] = social_check_result
+
+    return social_check_results, failed_row_indexes
+
+
+def determine_github_user_id():
+    """Look up the GraphQL node ID of github_login, which is needed to filter commit history by author. Returns whether
+    the ID was found."""
+    global github_user_id
+
+    try:
+        json_data = get_github_graphql_response(query="query { user(login: " + json.dumps(github_login) + ") { id } }",
+                                                priority=True)
+        github_user_id = json_data["data"]["user"]["id"]
+    except (urllib.error.URLError, KeyError, TypeError):
+        inoliblist.logger.warning("Unable to determine the GraphQL ID of GitHub user " + str(github_login))
+        return False
+    return True
+
+
+def get_github_api_response(request, request_parameters="", page_number=1, priority=False):
+    """Make a GitHub API request and return the decoded JSON response and whether there are additional pages.
+
+    The responses are stored in the GitHub API cache along with their ETag and Last-Modified headers, which are used to
+    make conditional requests. A 304 response means the cached response is still valid and doesn't count against the
+    rate limit.
+
+    Keyword arguments:
+    request -- API endpoint
+    request_parameters -- query string parameters
+    page_number -- page of the results
+    priority -- whether the request can use the part of the rate limit reserved for priority requests
+    """
+    global github_api_cache_hits
+    global github_api_cache_misses
+
+    url = (github_api_url + request + "?" + request_parameters + "&per_page=" + str(github_api_results_per_page) +
+           "&page=" + str(page_number))
+    cache_entry_path = github_api_cache_folder + "/" + hashlib.sha256(url.encode()).hexdigest() + ".json"
+    cache_entry = read_json_file(file_path=cache_entry_path)
+
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if github_token:
+        headers["Authorization"] = "token " + github_token
+    if cache_entry is not None:
+        if cache_entry["etag"] is not None:
+            headers["If-None-Match"] = cache_entry["etag"]
+        if cache_entry["last_modified"] is not None:
+            headers["If-Modified-Since"] = cache_entry["last_modified"]
+
+    rate_limiter = get_github_api_rate_limiter()
+    resource = "search" if request.startswith("search/") else "core"
+    retry_count = 0
+    while True:
+        rate_limiter.acquire(resource=resource, priority=priority)
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url=url, headers=headers),
+                                        timeout=github_api_timeout) as response:
+                json_data = json.loads(response.read().decode(inoliblist.file_encoding))
+                response_headers = response.headers
+            rate_limiter.record_success(headers=determine_rate_limit_headers(headers=response_headers))
+            break
+        except urllib.error.HTTPError as exception:
+            if exception.code == 304 and cache_entry is not None:
+                rate_limiter.record_success(headers=determine_rate_limit_headers(headers=exception.headers))
+                try:
+                    # update the modification time of the cache entry so it is treated as recently used by the
+                    # eviction
+                    os.utime(cache_entry_path)
+                    with github_api_cache_lock:
+                        github_api_cache_hits += 1
+                except FileNotFoundError:
+                    # the entry was evicted since it was read, so it is a cache miss and the entry is written again
+                    with github_api_cache_lock:
+                        github_api_cache_misses += 1
+                    write_github_api_cache_entry(cache_entry_path=cache_entry_path, cache_entry=cache_entry)
+                return {"json_data": cache_entry["json_data"], "additional_pages": cache_entry["additional_pages"]}
+            if handle_github_api_error(rate_limiter=rate_limiter, exception=exception):
+                # try again once the rate limit allows it
+                continue
+            if exception.code < 500 or retry_count == github_api_maximum_retries:
+                raise
+            failure = exception
+        except (OSError, http.client.HTTPException, ValueError) as exception:
+            # network errors, timeouts, and truncated responses
+            if retry_count == github_api_maximum_retries:
+                if isinstance(exception, urllib.error.URLError):
+                    raise
+                # the callers handle the failed requests as URLError
+                raise urllib.error.URLError(reason=exception)
+            failure = exception
+
+        retry_delay = github_api_retry_delay * 2 ** retry_count
+        retry_count += 1
+        inoliblist.logger.warning("GitHub API request failed (" + str(failure) + "), retrying in " +
+                                  str(retry_delay) + " s")
+        time.sleep(retry_delay)
+
+    with github_api_cache_lock:
+        github_api_cache_misses += 1
+    # the Link header only contains a "next" link if there are additional pages
+    additional_pages = 'rel="next"' in response_headers.get("Link", "")
+    if response_headers.get("ETag") is not None or response_headers.get("Last-Modified") is not None:
+        write_github_api_cache_entry(cache_entry_path=cache_entry_path,
+                                     cache_entry={"url": url,
+                                                  "etag": response_headers.get("ETag"),
+                                                  "last_modified": response_headers.get("Last-Modified"),
+                                                  "json_data": json_data,
+                                                  "additional_pages": additional_pages})
+    return {"json_data": json_data, "additional_pages": additional_pages}
+
+
+def write_github_api_cache_entry(cache_entry_path, cache_entry):
+    global github_api_cache_size
+
+    os.makedirs(github_api_cache_folder, exist_ok=True)
+    write_json_file(file_path=cache_entry_path, json_data=cache_entry)
+
+    with github_api_cache_lock:
+        if github_api_cache_size is None:
+            # this is the first write of the run so the size of the entries from previous runs is not known
+            github_api_cache_size = determine_folder_size(folder_path=github_api_cache_folder)
+        else:
+            github_api_cache_size += os.path.getsize(cache_entry_path)
+        if github_api_cache_size > github_api_cache_maximum_size:
+            github_api_cache_size = evict_cache(folder_path=github_api_cache_folder,
+                                                maximum_size=github_api_cache_maximum_size)
+
+
+def read_json_file(file_path):
+    """Return the decoded contents of a JSON file, or None if the file doesn't exist or is not valid."""
+    try:
+        with open(file=file_path, mode='r', encoding=inoliblist.file_encoding) as json_file:
+            return json.load(json_file)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def write_json_file(file_path, json_data):
+    """Write the JSON file via a temporary file so that an interrupted write can't leave a corrupted file."""
+    temporary_file_path = file_path + "." + str(os.getpid()) + "." + str(threading.get_ident()) + ".tmp"
+    with open(file=temporary_file_path, mode='w', encoding=inoliblist.file_encoding) as json_file:
+        json.dump(json_data, json_file)
+    os.replace(temporary_file_path, file_path)
+
+
+def determine_folder_size(folder_path):
+    """Return the total size in bytes of the files in the folder and its subfolders."""
+    folder_size = 0
+    for folder, _, filenames in os.walk(folder_path):
+        for filename in filenames:
+            folder_size += os.path.getsize(os.path.join(folder, filename))
+    return folder_size
+
+
+def evict_cache(folder_path, maximum_size):
+    """Delete the least recently used files from the cache folder until its size is below maximum_size. The files are
+    ordered by modification time, so a cache hit must update the modification time of the file.
+
+    Returns the size of the cache after the eviction.
+    """
+    cache_files = []
+    cache_size = 0
+    for folder, _, filenames in os.walk(folder_path):
+        for filename in filenames:
+            try:
+                file_stat = os.stat(os.path.join(folder, filename))
+            except FileNotFoundError:
+                # evicted by another process
+                continue
+            cache_files.append((file_stat.st_mtime, file_stat.st_size, os.path.join(folder, filename)))
+            cache_size += file_stat.st_size
+
+    # evict down to below the maximum size so that the eviction doesn't need to be done again on the next write
+    target_size = maximum_size * cache_eviction_target_ratio
+    for _, file_size, file_path in sorted(cache_files):
+        if cache_size <= target_size:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            # already evicted by another process, or open by another process on Windows
+            pass
+        cache_size -= file_size
+    inoliblist.logger.info("Evicted cache " + folder_path + " to " + str(cache_size) + " bytes")
+    return cache_size
+
+
+def log_github_api_cache_statistics():
+    inoliblist.logger.info("GitHub API cache: " +
+                           str(github_api_cache_hits) + " hits, " +
+                           str(github_api_cache_misses) + " misses")
+
+
+def determine_rate_limit_headers(headers):
+    """Return a dictionary of the rate limit headers of a GitHub API response, which can be passed to the shared
+    GitHubAPIRateLimiter."""
+    return {header_name: headers[header_name] for header_name in github_api_rate_limit_header_names
+            if headers.get(header_name) is not None}
+
+
+def handle_github_api_error(rate_limiter, exception):
+    """Pass an HTTP error response of the GitHub API to the rate limiter. Returns whether the request was rejected by a
+    rate limit, in which case it should be made again."""
+    return rate_limiter.handle_error(
+        code=exception.code,
+        headers=determine_rate_limit_headers(headers=exception.headers),
+        # the body is only needed to recognize a secondary rate limit response that doesn't have a Retry-After header
+        secondary_rate_limit_message=(exception.code in (403, 429) and
+                                      exception.headers.get("Retry-After") is None and
+                                      b"secondary rate limit" in exception.read())
+    )
+
+
+def get_github_graphql_response(query, priority=False):
+    """Make a request to the GitHub GraphQL API and return the decoded JSON response.
+
+    Keyword arguments:
+    query -- GraphQL query
+    priority -- whether the request can use the part of the rate limit reserved for priority requests
+    """
+    rate_limiter = get_github_api_rate_limiter()
+    while True:
+        rate_limiter.acquire(resource="graphql", priority=priority)
+        request = urllib.request.Request(url=github_graphql_api_url,
+                                         data=json.dumps({"query": query}).encode(),
+                                         headers={"Authorization": "bearer " + str(github_token),
+                                                  "Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=github_api_timeout) as response:
+                json_data = json.loads(response.read().decode(inoliblist.file_encoding))
+                response_headers = response.headers
+        except urllib.error.HTTPError as exception:
+            if handle_github_api_error(rate_limiter=rate_limiter, exception=exception):
+                continue
+            raise
+        if any(error.get("type") == "RATE_LIMITED" for error in json_data.get("errors", [])):
+            # the primary rate limit of the GraphQL API is reported as an error of a successful response
+            rate_limiter.update(headers=determine_rate_limit_headers(headers=response_headers))
+            if response_headers.get("X-RateLimit-Remaining") != "0":
+                rate_limiter.handle_secondary_rate_limit(retry_after=response_headers.get("Retry-After"))
+            continue
+        rate_limiter.record_success(headers=determine_rate_limit_headers(headers=response_headers))
+        break
+
+    if "errors" in json_data:
+        # errors for individual fields, such as a deleted repository, are expected so they are only logged
+        for error in json_data["errors"]:
+            inoliblist.logger.info("GraphQL error: " + error.get("message", ""))
+    return json_data
+
+
+def determine_repository_full_name(repository_url):
+    return repository_url.split('/')[3] + "/" + repository_url.split('/')[4].strip()
+
+
+def clean_folder(folder_path):
+    if os.path.exists(folder_path):
+        # delete the folder
+        shutil.rmtree(folder_path, onerror=onerror)
+        time.sleep(create_folder_delay)
+    # create the folder
+    os.makedirs(folder_path)
 
 
 def get_table():
@@ -653,291 +2558,975 @@ def get_table():
     return table
 
 
-def process_inoliblist(inoliblist_path):
+def process_inoliblist(inoliblist_path, output_path=None, journal_path=None, inoliblist_url=None):
+    """Process all rows of inoliblist.
+
+    Keyword arguments:
+    inoliblist_path -- path of inoliblist.csv
+    inoliblist_url -- if specified, inoliblist.csv is downloaded from this URL to inoliblist_path and the rows are
+                      processed as they arrive. If the copy at inoliblist_path is current, it is used instead.
+    output_path -- if specified, each row is written to this file as soon as it is produced instead of being added to
+                   the table
+    journal_path -- if specified, each completed row is recorded in this journal. If resuming, the rows recorded by the
+                    interrupted run are reused rather than processed again.
+    """
     global table
 
-    # install the Arduino IDE for check_keywords_txt's reference link check
-    # if the IDE version is already installed to arduino_ci_script_application_folder then it will not be reinstalled
-    arduino_ci_script_wrapper_handler(function_name="install_ide",
-                                      function_parameters=arduino_ci_script_arduino_ide_version)
+    install_ide()
 
-    with open(file=inoliblist_path,
-              mode='r',
-              encoding=inoliblist.file_encoding,
-              newline=inoliblist.file_newline
-              ) as inoliblist_file:
+    if check_for_typos:
+        # load the typo automaton before the worker processes are started so that it is only compiled once
+        load_typo_automaton()
+
+    with open_inoliblist(inoliblist_path=inoliblist_path, inoliblist_url=inoliblist_url) as inoliblist_file:
         inoliblist_csv = csv.reader(inoliblist_file,
                                     delimiter=inoliblist.output_file_delimiter,
                                     quotechar=inoliblist.output_file_quotechar)
 
         initialize_table(inoliblist_csv)
 
-        # process inoliblist
-        for inoliblist_row_list in inoliblist_csv:
-            # initialize the row list
-            inolibbuglist_row_list = [""] * Column.count
+        if journal_path is None:
+            inolibbuglist_journal = None
+        else:
+            inolibbuglist_journal = InolibbuglistJournal(journal_path=journal_path, resume_journal=resume)
 
-            # fill the row for the inoliblist columns
-            for column_index, cell_contents in enumerate(inoliblist_row_list):
-                inolibbuglist_row_list[column_index] = cell_contents
+        if output_path is None:
+            inolibbuglist_output_file = None
+        else:
+            inolibbuglist_output_file = InolibbuglistOutputFile(output_path=output_path)
+            for row_list in table:
+                inolibbuglist_output_file.write_row(row_list=row_list)
 
-            inoliblist.logger.info(inolibbuglist_row_list[inoliblist.Column.repository_url])
+        def add_row(row_list):
+            if inolibbuglist_output_file is None:
+                table.append(row_list)
+            else:
+                # only the heading row is kept in the table
+                inolibbuglist_output_file.write_row(row_list=row_list)
+            if inolibbuglist_journal is not None:
+                inolibbuglist_journal.append(row_list=row_list)
 
-            # is it archived?
-            if inolibbuglist_row_list[inoliblist.Column.archived] == "True":
-                inoliblist.logger.info("Skipping: archived")
-                # no point in doing anything further for this row, save the row and go on to the next one
-                # append this row to the table
-                table.append(inolibbuglist_row_list)
-                continue
+        if inolibbuglist_journal is None:
+            def get_completed_row(repository_url):
+                return None
+        else:
+            get_completed_row = inolibbuglist_journal.read_resumed_row
+        try:
+            process_inoliblist_rows(inoliblist_csv=inoliblist_csv,
+                                    add_row=add_row,
+                                    get_completed_row=get_completed_row)
+        finally:
+            if inolibbuglist_output_file is not None:
+                inolibbuglist_output_file.close()
+            if inolibbuglist_journal is not None:
+                inolibbuglist_journal.close()
 
-            # is the repo blacklisted?
-            inolibbuglist_row_list[Column.blacklist] = str(
-                check_blacklist(repository_url=inolibbuglist_row_list[inoliblist.Column.repository_url]))
-            if inolibbuglist_row_list[Column.blacklist] == "True":
-                inoliblist.logger.info("Skipping: blacklisted")
-                # no point in doing anything further for this row, save the row and go on to the next one
-                # append this row to the table
-                table.append(inolibbuglist_row_list)
-                continue
+    get_scratch_folder_manager().remove_folders()
 
-            # detect inappropriate use of the "arduino-library" topic
-            if (
-                    inolibbuglist_row_list[inoliblist.Column.library_path] == '' and
-                    inolibbuglist_row_list[inoliblist.Column.github_topics].find("arduino-library") != -1
-            ):
-                inoliblist.logger.info("arduino-library topic abuse detected")
-                inolibbuglist_row_list[Column.arduino_library_topic_abuse] = "True"
-
-                # check if I have open issues in this repo
-                # I'm only doing this for the "arduino-library" topic abuse repos because
-                # that's the only problem I need to open an issue for so I can avoid the extra API requests
-                i_have_open_issue = False
-                page_number = 1
-                additional_pages = True
-                while additional_pages:
-                    try:
-                        get_github_api_response_return = inoliblist.get_github_api_response(
-                            request="repos/" +
-                                    inolibbuglist_row_list[inoliblist.Column.repository_owner] + "/" +
-                                    inolibbuglist_row_list[inoliblist.Column.repository_name] +
-                                    "/issues",
-                            request_parameters="state=open",
-                            page_number=page_number)
-                        json_data = list(get_github_api_response_return["json_data"])
-
-                        for issue in json_data:
-                            if issue["user"]["login"] == github_login:
-                                # GitHub considers pull requests to be issues (though issues are not pull requests)
-                                # so any item with a "pull_request" key must be excluded from the check
-                                if "pull_request" not in issue:
-                                    inoliblist.logger.info("I have an open issue")
-                                    i_have_open_issue = True
-                                    break
-                        if i_have_open_issue:
-                            break
 
-                        additional_pages = get_github_api_response_return["additional_pages"]
-                        page_number += 1
-                    except urllib.error.HTTPError:
-                        # there was an unrecoverable HTTP error but this could have been caused by the repo being
-                        # deleted since inoliblist was created so carry on
-                        inoliblist.logger.warning("HTTP error while checking if I have an open issue")
-                        i_have_open_issue = ""
-                        break
-                inolibbuglist_row_list[Column.i_have_open_issue] = str(i_have_open_issue)
-            else:
-                inolibbuglist_row_list[Column.arduino_library_topic_abuse] = "False"
+def download_inoliblist(url, path):
+    """Update the copy of inoliblist.csv at path from url, if it has changed."""
+    with InoliblistDownload(url=url, path=path) as inoliblist_download:
+        if inoliblist_download.start():
+            inoliblist_download.read_to_end()
 
-            # do I have an open PR?
-            i_have_open_pull_request = check_for_open_pr(
-                inolibbuglist_row_list[inoliblist.Column.repository_owner] + "/" +
-                inolibbuglist_row_list[inoliblist.Column.repository_name]
-            )
-            if i_have_open_pull_request is not None:
-                inolibbuglist_row_list[Column.i_have_open_pull_request] = str(i_have_open_pull_request)
-                if (
-                        inolibbuglist_row_list[Column.i_have_open_pull_request] == "True" and not (
-                        process_repos_with_open_pr)
-                ):
-                    inoliblist.logger.info("Skipping: Open PR")
-                    # no point in doing anything further for this row, save the row and go on to the next one
-                    # append this row to the table
-                    table.append(inolibbuglist_row_list)
-                    continue
 
-            # am I a contributor?
-            i_am_contributor = False
-            page_number = 1
-            additional_pages = True
-            while additional_pages:
-                try:
-                    get_github_api_response_return = inoliblist.get_github_api_response(
-                        request="repos/" +
-                                inolibbuglist_row_list[inoliblist.Column.repository_owner] + "/" +
-                                inolibbuglist_row_list[inoliblist.Column.repository_name] +
-                                "/contributors",
-                        page_number=page_number)
-                    json_data = list(get_github_api_response_return["json_data"])
-
-                    for contributor in json_data:
-                        if contributor["login"] == github_login:
-                            inoliblist.logger.info("I'm a contributor")
-                            i_am_contributor = True
-                            break
-                    if i_am_contributor:
-                        break
+def open_inoliblist(inoliblist_path, inoliblist_url=None):
+    """Return a text file object of inoliblist.csv.
 
-                    additional_pages = get_github_api_response_return["additional_pages"]
-                    page_number += 1
-                except urllib.error.HTTPError:
-                    # there was an unrecoverable HTTP error but this could have been caused by the repo being
-                    # deleted since inoliblist was created so carry on
-                    inoliblist.logger.warning("HTTP error while checking if I'm a contributor")
-                    i_am_contributor = ""
-                    break
-            inolibbuglist_row_list[Column.i_am_contributor] = str(i_am_contributor)
+    Keyword arguments:
+    inoliblist_path -- path of inoliblist.csv
+    inoliblist_url -- if specified, the file object reads the download of inoliblist.csv from this URL as it arrives,
+                      unless the copy at inoliblist_path is current
+    """
+    if inoliblist_url is not None:
+        inoliblist_download = InoliblistDownload(url=inoliblist_url, path=inoliblist_path)
+        if inoliblist_download.start():
+            return io.TextIOWrapper(io.BufferedReader(inoliblist_download, buffer_size=inoliblist_download_chunk_size),
+                                    encoding=inoliblist.file_encoding,
+                                    newline=inoliblist.file_newline)
+        inoliblist_download.close()
+    return open(file=inoliblist_path,
+                mode='r',
+                encoding=inoliblist.file_encoding,
+                newline=inoliblist.file_newline
+                )
 
-            # library was not found by inoliblist in the root or one subfolder level down
-            if inolibbuglist_row_list[inoliblist.Column.library_path] == '':
-                inoliblist.logger.info("Library was not found by inoliblist")
-                inolibbuglist_row_list[Column.cant_find] = "True"
-            else:
-                inolibbuglist_row_list[Column.cant_find] = "False"
 
-            # library's status is failure
-            if inolibbuglist_row_list[inoliblist.Column.tip_status] == "failure":
-                inoliblist.logger.info("Last commit has failed status")
-                inolibbuglist_row_list[Column.status_failure] = "True"
-            else:
-                inolibbuglist_row_list[Column.status_failure] = "False"
+def process_inoliblist_rows(inoliblist_csv, add_row, get_completed_row):
+    """Process the rows of inoliblist, passing each resulting inolibbuglist row to add_row() in inoliblist order.
 
-            # library not in repo root (it's better to point arduino-ci-script's check_library_structure()
-            # to the library path so it can detect other issues not already identified by inoliblist
-            if inolibbuglist_row_list[inoliblist.Column.library_path] != '/':
-                inoliblist.logger.info("Library not in repo root")
-                inolibbuglist_row_list[Column.not_in_root] = "True"
-            else:
-                inolibbuglist_row_list[Column.not_in_root] = "False"
+    Keyword arguments:
+    inoliblist_csv -- csv.reader of inoliblist, after the heading row
+    add_row -- function called with each inolibbuglist row
+    get_completed_row -- function that returns the already completed inolibbuglist row of a repository URL, or None.
+                         The completed rows are not processed again.
+    """
+    if jobs > 1:
+        # all the processes share a single rate limiter so together they stay within the GitHub API rate limits. It
+        # continues from the state of the rate limiter of this process, which gets the combined state and statistics
+        # back once the pool is done.
+        with GitHubAPIRateLimiterManager() as github_api_rate_limiter_manager:
+            shared_github_api_rate_limiter = github_api_rate_limiter_manager.GitHubAPIRateLimiter(
+                state=get_github_api_rate_limiter().get_state()
+            )
+            set_github_api_rate_limiter(github_api_rate_limiter_input=shared_github_api_rate_limiter)
+            try:
+                # each repository gets its own scratch folder, and imap() returns the rows in inoliblist order so the
+                # table is the same as it would be from a serial run
+                # the pool consumes the input from a separate thread so the social checks of the next batch are done
+                # while the worker processes are busy with the previous batch
+                with multiprocessing.Pool(processes=jobs,
+                                          initializer=initialize_worker,
+                                          initargs=(get_worker_configuration(),)
+                                          ) as pool:
+                    for inolibbuglist_row_list in pool.imap(
+                            process_inoliblist_row_arguments,
+                            generate_process_inoliblist_row_arguments(inoliblist_csv, get_completed_row)
+                    ):
+                        add_row(inolibbuglist_row_list)
+            finally:
+                set_github_api_rate_limiter(github_api_rate_limiter_input=GitHubAPIRateLimiter(
+                    state=shared_github_api_rate_limiter.get_state()
+                ))
+    else:
+        for arguments in generate_process_inoliblist_row_arguments(inoliblist_csv, get_completed_row):
+            add_row(process_inoliblist_row_arguments(arguments))
 
-            # unrecognized license
-            if (
-                    inolibbuglist_row_list[inoliblist.Column.repository_license] ==
-                    inoliblist.unrecognized_license_identifier
+
+def generate_process_inoliblist_row_arguments(inoliblist_csv, get_completed_row):
+    """Yield the arguments for process_inoliblist_row_arguments() for each row of inoliblist. The social checks are
+    resolved concurrently for a batch of rows at a time.
+    """
+    for inoliblist_rows in read_batches(iterable=inoliblist_csv, batch_size=social_check_batch_size):
+        # the journal is appended to while the batch is being yielded, so whether each row is completed is decided once
+        # for the batch
+        completed_row_lists = [get_completed_row(inoliblist_row_list[inoliblist.Column.repository_url])
+                               for inoliblist_row_list in inoliblist_rows]
+        pending_row_indexes = [row_index for row_index, completed_row_list in enumerate(completed_row_lists)
+                               if completed_row_list is None]
+        social_check_results = [None] * len(inoliblist_rows)
+        if pending_row_indexes:
+            for row_index, social_check_result in zip(
+                    pending_row_indexes,
+                    resolve_social_checks(inoliblist_rows=[inoliblist_rows[row_index]
+                                                           for row_index in pending_row_indexes])
             ):
-                inoliblist.logger.info("Unrecognized license")
-                inolibbuglist_row_list[Column.license_unrecognized] = "True"
-            else:
-                inolibbuglist_row_list[Column.license_unrecognized] = "False"
+                social_check_results[row_index] = social_check_result
+        for arguments in zip(inoliblist_rows, social_check_results, completed_row_lists):
+            yield arguments
 
-            # tests indicate that downloading the .zip and unzipping it is significantly faster than a
-            # shallow clone
-            # deleting the repo is also significantly faster
-            # download the GitHub .zip file
-            inoliblist.logger.info("Downloading the library.")
-            try:
-                urllib.request.urlretrieve(url=(inolibbuglist_row_list[inoliblist.Column.repository_url] +
-                                                "/archive/" +
-                                                inolibbuglist_row_list[
-                                                    inoliblist.Column.repository_default_branch] +
-                                                ".zip"
-                                                ),
-                                           filename=(work_folder_name + '/' +
-                                                     inolibbuglist_row_list[
-                                                         inoliblist.Column.repository_name] +
-                                                     ".zip"
-                                                     )
-                                           )
-            except urllib.error.HTTPError:
-                # no point in doing anything further for this row, save the row and go on to the next one
-                # append this row to the table
-                inoliblist.logger.warning("Unable to download the library.")
-                table.append(inolibbuglist_row_list)
+
+def process_inoliblist_row_arguments(arguments):
+    """Wrapper for process_inoliblist_row() that takes the arguments as a tuple, for use with Pool.imap(). Returns the
+    completed row if there is one, rather than processing the row again."""
+    inoliblist_row_list, social_check_result, completed_row_list = arguments
+    if completed_row_list is not None:
+        return completed_row_list
+    return process_inoliblist_row(inoliblist_row_list=inoliblist_row_list, social_check_result=social_check_result)
+
+
+def read_batches(iterable, batch_size):
+    """Yield lists of up to batch_size items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_inoliblist_row(inoliblist_row_list, social_check_result=None):
+    """Run all checks on a row of inoliblist and return the resulting inolibbuglist row.
+
+    Keyword arguments:
+    inoliblist_row_list -- row of inoliblist
+    social_check_result -- results of the open issue, open PR, and contributor checks for the repository from
+                           resolve_social_checks(). If None, the checks are done as part of processing the row.
+    """
+    # initialize the row, filling the inoliblist columns
+    inolibbuglist_row_list = InolibbuglistRow(row_list=inoliblist_row_list)
+
+    inoliblist.logger.info(inolibbuglist_row_list[inoliblist.Column.repository_url])
+
+    # is it archived?
+    if inolibbuglist_row_list[inoliblist.Column.archived] == "True":
+        inoliblist.logger.info("Skipping: archived")
+        # no point in doing anything further for this row
+        return inolibbuglist_row_list
+
+    # is the repo blacklisted?
+    inolibbuglist_row_list[Column.blacklist] = str(
+        check_blacklist(repository_url=inolibbuglist_row_list[inoliblist.Column.repository_url]))
+    if inolibbuglist_row_list[Column.blacklist] == "True":
+        inoliblist.logger.info("Skipping: blacklisted")
+        # no point in doing anything further for this row
+        return inolibbuglist_row_list
+
+    repository_full_name = (inolibbuglist_row_list[inoliblist.Column.repository_owner] + "/" +
+                            inolibbuglist_row_list[inoliblist.Column.repository_name])
+
+    # detect inappropriate use of the "arduino-library" topic
+    if detect_arduino_library_topic_abuse(row_list=inolibbuglist_row_list):
+        inoliblist.logger.info("arduino-library topic abuse detected")
+        inolibbuglist_row_list[Column.arduino_library_topic_abuse] = "True"
+
+        # check if I have open issues in this repo
+        # I'm only doing this for the "arduino-library" topic abuse repos because
+        # that's the only problem I need to open an issue for so I can avoid the extra API requests
+        if social_check_result is None:
+            i_have_open_issue = check_for_open_issue(repository_full_name=repository_full_name)
+        else:
+            i_have_open_issue = social_check_result["i_have_open_issue"]
+        if i_have_open_issue is not None:
+            inolibbuglist_row_list[Column.i_have_open_issue] = str(i_have_open_issue)
+    else:
+        inolibbuglist_row_list[Column.arduino_library_topic_abuse] = "False"
+
+    # do I have an open PR?
+    if social_check_result is None:
+        i_have_open_pull_request = check_for_open_pr(repository_full_name=repository_full_name)
+    else:
+        i_have_open_pull_request = social_check_result["i_have_open_pull_request"]
+    if i_have_open_pull_request is not None:
+        inolibbuglist_row_list[Column.i_have_open_pull_request] = str(i_have_open_pull_request)
+        if (
+                inolibbuglist_row_list[Column.i_have_open_pull_request] == "True" and not (
+                process_repos_with_open_pr)
+        ):
+            inoliblist.logger.info("Skipping: Open PR")
+            # no point in doing anything further for this row
+            return inolibbuglist_row_list
+
+    # am I a contributor?
+    if social_check_result is None:
+        i_am_contributor = check_if_contributor(repository_full_name=repository_full_name)
+    else:
+        i_am_contributor = social_check_result["i_am_contributor"]
+    if i_am_contributor is not None:
+        inolibbuglist_row_list[Column.i_am_contributor] = str(i_am_contributor)
+
+    # library was not found by inoliblist in the root or one subfolder level down
+    if inolibbuglist_row_list[inoliblist.Column.library_path] == '':
+        inoliblist.logger.info("Library was not found by inoliblist")
+        inolibbuglist_row_list[Column.cant_find] = "True"
+    else:
+        inolibbuglist_row_list[Column.cant_find] = "False"
+
+    # library's status is failure
+    if inolibbuglist_row_list[inoliblist.Column.tip_status] == "failure":
+        inoliblist.logger.info("Last commit has failed status")
+        inolibbuglist_row_list[Column.status_failure] = "True"
+    else:
+        inolibbuglist_row_list[Column.status_failure] = "False"
+
+    # library not in repo root (it's better to point arduino-ci-script's check_library_structure()
+    # to the library path so it can detect other issues not already identified by inoliblist
+    if inolibbuglist_row_list[inoliblist.Column.library_path] != '/':
+        inoliblist.logger.info("Library not in repo root")
+        inolibbuglist_row_list[Column.not_in_root] = "True"
+    else:
+        inolibbuglist_row_list[Column.not_in_root] = "False"
+
+    # unrecognized license
+    if (
+            inolibbuglist_row_list[inoliblist.Column.repository_license] ==
+            inoliblist.unrecognized_license_identifier
+    ):
+        inoliblist.logger.info("Unrecognized license")
+        inolibbuglist_row_list[Column.license_unrecognized] = "True"
+    else:
+        inolibbuglist_row_list[Column.license_unrecognized] = "False"
+
+    if incremental or archive_cache_maximum_size > 0:
+        default_branch_tip_commit = determine_default_branch_tip_commit(
+            repository_full_name=repository_full_name,
+            branch=inolibbuglist_row_list[inoliblist.Column.repository_default_branch]
+        )
+    else:
+        default_branch_tip_commit = None
+
+    if incremental:
+        incremental_state_path = determine_incremental_state_path(
+            repository_url=inolibbuglist_row_list[inoliblist.Column.repository_url]
+        )
+        check_configuration = determine_check_configuration(row_list=inolibbuglist_row_list)
+        incremental_state = read_json_file(file_path=incremental_state_path)
+        if (
+                default_branch_tip_commit is not None and
+                incremental_state is not None and
+                incremental_state["commit"] == default_branch_tip_commit and
+                incremental_state["check_configuration"] == check_configuration and
+                len(incremental_state["bug_columns"]) == Column.count - Column.typo
+        ):
+            inoliblist.logger.info("Skipping: Unchanged since the previous run")
+            inolibbuglist_row_list[Column.typo:] = incremental_state["bug_columns"]
+            return inolibbuglist_row_list
+
+    # tests indicate that downloading the .zip and unzipping it is significantly faster than a
+    # shallow clone
+    # deleting the repo is also significantly faster
+    # download the GitHub .zip file
+    inoliblist.logger.info("Downloading the library.")
+    try:
+        repository_archive = download_repository_archive(
+            url=(inolibbuglist_row_list[inoliblist.Column.repository_url] +
+                 "/archive/" +
+                 inolibbuglist_row_list[inoliblist.Column.repository_default_branch] +
+                 ".zip"
+                 ),
+            repository_full_name=repository_full_name,
+            commit=default_branch_tip_commit
+        )
+    except urllib.error.HTTPError:
+        # no point in doing anything further for this row
+        inoliblist.logger.warning("Unable to download the library.")
+        return inolibbuglist_row_list
+
+    # the archive is only extracted to the scratch folder if one of the checks requires it
+    work_folder_path = get_scratch_folder_manager().create_folder()
+    try:
+        with repository_archive:
+            process_repository_archive(row_list=inolibbuglist_row_list,
+                                       repository_archive=repository_archive,
+                                       work_folder_path=work_folder_path)
+    finally:
+        # the folder must be deleted even if a check raised an exception
+        get_scratch_folder_manager().release_folder(folder_path=work_folder_path)
+
+    if incremental and default_branch_tip_commit is not None:
+        # save the results of the checks for use by the next run
+        os.makedirs(incremental_state_folder, exist_ok=True)
+        write_json_file(file_path=incremental_state_path,
+                        json_data={"commit": default_branch_tip_commit,
+                                   "check_configuration": check_configuration,
+                                   "bug_columns": inolibbuglist_row_list[Column.typo:]})
+
+    return inolibbuglist_row_list
+
+
+def download_repository_archive(url, repository_full_name, commit):
+    """Return the GitHub archive of a repository as a RepositoryArchive.
+
+    If the archive cache is enabled and the commit of the archive is known, the archive is read from the cache, or
+    downloaded to the cache if not already there. Otherwise it is downloaded to memory.
+
+    Keyword arguments:
+    url -- URL of the archive of the default branch
+    repository_full_name -- owner/name of the repository
+    commit -- tip commit of the default branch
+    """
+    if archive_cache_maximum_size == 0 or commit is None:
+        with urllib.request.urlopen(url) as response:
+            return RepositoryArchive(archive_file=io.BytesIO(response.read()))
+
+    archive_path = archive_cache_folder + "/" + repository_full_name.casefold() + "/" + commit + ".zip"
+    if verify_cached_archive(archive_path=archive_path):
+        inoliblist.logger.info("Using cached archive")
+        # update the modification time of the archive so it is treated as recently used by the eviction
+        os.utime(archive_path)
+        return RepositoryArchive(archive_file=archive_path)
+    return RepositoryArchive(archive_file=download_archive_to_cache(url=url, archive_path=archive_path, commit=commit))
+
+
+def verify_cached_archive(archive_path):
+    """Return whether the archive is in the cache and its contents match the checksum saved when it was downloaded."""
+    try:
+        with open(file=archive_path + archive_checksum_extension, mode='r') as checksum_file:
+            checksum = checksum_file.read()
+        with open(file=archive_path, mode="rb") as archive_file:
+            return calculate_checksum(input_file=archive_file) == checksum
+    except FileNotFoundError:
+        return False
+
+
+def calculate_checksum(input_file, output_file=None):
+    """Return the SHA-256 checksum of the file, reading it in chunks. If output_file is specified, the data is also
+    written to that file.
+    """
+    checksum = hashlib.sha256()
+    while True:
+        chunk = input_file.read(download_chunk_size)
+        if not chunk:
+            return checksum.hexdigest()
+        checksum.update(chunk)
+        if output_file is not None:
+            output_file.write(chunk)
+
+
+def download_archive_to_cache(url, archive_path, commit):
+    """Download the archive to the archive cache, saving its checksum alongside it.
+
+    The branch might have been updated after its tip commit was determined, so the archive is only cached under the
+    commit if that is the commit in the archive's comment. Otherwise it is cached under the commit from the comment, or
+    not cached if the comment doesn't contain a commit.
+
+    Keyword arguments:
+    url -- URL of the archive
+    archive_path -- path of the archive in the cache
+    commit -- commit the archive is expected to be of
+
+    Returns the path or file object of the downloaded archive.
+    """
+    global archive_cache_size
+
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    temporary_archive_path = archive_path + "." + str(os.getpid()) + ".tmp"
+    with urllib.request.urlopen(url) as response:
+        with open(file=temporary_archive_path, mode="wb") as archive_file:
+            checksum = calculate_checksum(input_file=response, output_file=archive_file)
+    with zipfile.ZipFile(temporary_archive_path, "r") as zip_file:
+        archive_commit = zip_file.comment.decode(encoding="ascii", errors="replace")
+    if archive_commit != commit:
+        inoliblist.logger.info("Archive is of commit " + archive_commit + " rather than " + commit)
+        if not archive_commit_regex.fullmatch(archive_commit):
+            # the commit of the archive is not known so it can't be cached
+            with open(file=temporary_archive_path, mode="rb") as archive_file:
+                archive_data = archive_file.read()
+            os.remove(temporary_archive_path)
+            return io.BytesIO(archive_data)
+        archive_path = os.path.dirname(archive_path) + "/" + archive_commit + ".zip"
+    os.replace(temporary_archive_path, archive_path)
+    with open(file=archive_path + archive_checksum_extension, mode='w') as checksum_file:
+        checksum_file.write(checksum)
+
+    if archive_cache_size is None:
+        # this is the first download of the run so the size of the archives from previous runs is not known
+        archive_cache_size = determine_folder_size(folder_path=archive_cache_folder)
+    else:
+        archive_cache_size += os.path.getsize(archive_path) + os.path.getsize(archive_path + archive_checksum_extension)
+    if archive_cache_size > archive_cache_maximum_size:
+        archive_cache_size = evict_cache(folder_path=archive_cache_folder, maximum_size=archive_cache_maximum_size)
+
+    return archive_path
+
+
+def process_repository_archive(row_list, repository_archive, work_folder_path):
+    """Run the checks that require the contents of the repository. The archive is only extracted to the work folder if
+    a check requires a real folder.
+    """
+    if check_for_typos:
+        check_typos(row_list=row_list, repository_archive=repository_archive, work_folder_path=work_folder_path)
+
+    # run the arduino-ci-script checks
+    # check_library_structure(), check_library_properties(), and check_keywords_txt require a known
+    # library path
+    if row_list[inoliblist.Column.library_path] != "":
+        if row_list[inoliblist.Column.library_path] != "/":
+            library_path = row_list[inoliblist.Column.library_path].strip('/') + '/'
+        else:
+            library_path = ""
+        run_check(function_name="check_library_structure",
+                  repository_archive=repository_archive,
+                  path=library_path,
+                  work_folder_path=work_folder_path,
+                  row_list=row_list
+                  )
+        run_check(function_name="check_library_properties",
+                  repository_archive=repository_archive,
+                  path=library_path,
+                  work_folder_path=work_folder_path,
+                  row_list=row_list
+                  )
+        run_check(function_name="check_keywords_txt",
+                  repository_archive=repository_archive,
+                  path=library_path,
+                  work_folder_path=work_folder_path,
+                  row_list=row_list
+                  )
+    # These checks are only relevant for libraries in the Library Manager index
+    if row_list[inoliblist.Column.in_library_manager_index] == "True":
+        if row_list[inoliblist.Column.library_path] != "/":
+            row_list[Column.lm_but_not_in_root] = "True"
+        else:
+            row_list[Column.lm_but_not_in_root] = "False"
+        run_check(function_name="check_library_manager_compliance",
+                  repository_archive=repository_archive,
+                  path="",
+                  work_folder_path=work_folder_path,
+                  row_list=row_list
+                  )
+    # not yet implemented
+    # arduino_ci_script_handler(function_name="check_includes",
+    #                          function_parameters=shlex.quote(repository_installation_path),
+    #                          row_list=row_list
+    #                          )
+
+
+def check_typos(row_list, repository_archive, work_folder_path):
+    """Check the repository for common misspellings. codespell's dictionary is used in-process if codespell_lib can be
+    imported, otherwise codespell is run on the extracted repository."""
+    typo_counts = find_typos(repository_archive=repository_archive)
+    if typo_counts is None:
+        codespell_exit_status = subprocess_run(command="codespell",
+                                               arguments="--ignore-words=" +
+                                                         shlex.quote(codespell_ignore_words_list_path) + ' ' +
+                                                         shlex.quote(
+                                                             repository_archive.extract(folder_path=work_folder_path)
+                                                         )
+                                               )
+        typo_found = codespell_exit_status != 0
+    else:
+        for repository_path, typo_count in typo_counts.items():
+            inoliblist.logger.info(repository_path + ": " + str(typo_count) + " typos")
+        typo_found = len(typo_counts) > 0
+
+    if typo_found:
+        inoliblist.logger.info("Typo found")
+        row_list[Column.typo] = "True"
+    else:
+        row_list[Column.typo] = "False"
+
+
+def find_typos(repository_archive):
+    """Check the files of the repository for the misspellings in codespell's dictionary, without extracting the archive.
+
+    Hidden files and folders and binary files are skipped, as codespell does by default. If pyahocorasick is installed,
+    each file is scanned in a single pass by an automaton of all the misspellings, otherwise each word of the file is
+    looked up in the dictionary.
+
+    Returns a dictionary of the number of typos in each file that has typos, by path, or None if codespell is not
+    installed.
+    """
+    misspelling_automaton = load_typo_automaton()
+    if misspelling_automaton is None:
+        misspelling_fixes = load_misspellings()
+        if misspelling_fixes is None:
+            return None
+
+    typo_counts = {}
+    for repository_path in repository_archive.paths():
+        if (repository_path.endswith('/') or
+                any(path_component.startswith('.') for path_component in repository_path.split('/')) or
+                repository_archive.is_symlink(path=repository_path)):
+            continue
+        file_contents = repository_archive.read(path=repository_path)
+        if b"\x00" in file_contents[:binary_file_sniff_length]:
+            continue
+        try:
+            file_text = file_contents.decode(encoding="utf-8")
+        except UnicodeDecodeError:
+            file_text = file_contents.decode(encoding="ISO-8859-1")
+
+        if misspelling_automaton is None:
+            typo_count = count_typos(file_text=file_text, misspelling_fixes=misspelling_fixes)
+        else:
+            typo_count = count_typos_with_automaton(file_text=file_text, misspelling_automaton=misspelling_automaton)
+        if typo_count > 0:
+            typo_counts[repository_path] = typo_count
+
+    return typo_counts
+
+
+def count_typos(file_text, misspelling_fixes):
+    """Return the number of words of the text that are in the dictionary of misspellings."""
+    typo_count = 0
+    for word_match in codespell_word_regex.finditer(file_text):
+        word = word_match.group().lower()
+        if word in misspelling_fixes:
+            if (word_match.start() > 0 and file_text[word_match.start() - 1] == '\\' and
+                    word.startswith(string_escape_characters) and word[1:] not in misspelling_fixes):
+                # a valid word preceded by a string escape sequence
                 continue
+            typo_count += 1
+    return typo_count
+
+
+def count_typos_with_automaton(file_text, misspelling_automaton):
+    """Return the number of words of the text that are matched by the automaton of misspellings.
+
+    The automaton's keys are the misspellings surrounded by spaces, so all non-word characters of the text are replaced
+    by spaces, which makes the automaton only match whole words.
+    """
+    file_text = file_text.lower()
+    try:
+        # most files are ASCII, which can be translated much faster than by the regular expression
+        boundary_text = file_text.encode("ascii").translate(ascii_non_word_character_translation).decode("ascii")
+    except UnicodeEncodeError:
+        boundary_text = codespell_non_word_character_regex.sub(' ', file_text)
+    # pad the text so the first and last words are also surrounded by spaces
+    boundary_text = ' ' + boundary_text + ' '
+    typo_count = 0
+    for end_index, misspelling_length in misspelling_automaton.iter(boundary_text):
+        # the index of the start of the misspelling in file_text
+        start_index = end_index - misspelling_length - 1
+        if (start_index > 0 and file_text[start_index - 1] == '\\' and
+                file_text.startswith(string_escape_characters, start_index) and
+                not misspelling_automaton.exists(' ' + file_text[start_index + 1:end_index - 1] + ' ')):
+            # a valid word preceded by a string escape sequence
+            continue
+        typo_count += 1
+    return typo_count
+
+
+def load_typo_automaton():
+    """Load the Aho-Corasick automaton of the misspellings of codespell's dictionary.
+
+    Compiling the automaton is slow so it is saved in the cache folder, and reused for as long as the dictionary and
+    the ignore words list are unchanged. The automaton is only loaded once per process. Returns the automaton, or None
+    if pyahocorasick or codespell is not installed.
+    """
+    global typo_automaton
+    if typo_automaton is None:
+        typo_automaton = False
+        try:
+            import ahocorasick
+        except ImportError:
+            inoliblist.logger.info("pyahocorasick not installed, using codespell's dictionary for the typo check")
+            return None
+        dictionary_paths = determine_codespell_dictionary_paths()
+        if dictionary_paths is None:
+            return None
+
+        input_hash = hashlib.sha256(sys.version.encode())
+        for input_path in dictionary_paths + [codespell_ignore_words_list_path]:
+            with open(file=input_path, mode='rb') as input_file:
+                input_hash.update(input_file.read())
+        cache_path = typo_automaton_cache_folder + '/' + input_hash.hexdigest() + ".pickle"
+
+        try:
+            with open(file=cache_path, mode='rb') as cache_file:
+                typo_automaton = pickle.load(cache_file)
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            inoliblist.logger.info("Compiling typo automaton")
+            typo_automaton = ahocorasick.Automaton()
+            for misspelling in load_misspellings():
+                typo_automaton.add_word(' ' + misspelling + ' ', len(misspelling))
+            typo_automaton.make_automaton()
+
+            try:
+                # the automatons of previous versions of the dictionary are no longer needed
+                clean_folder(typo_automaton_cache_folder)
+                with open(file=cache_path + ".tmp", mode='wb') as cache_file:
+                    pickle.dump(typo_automaton, cache_file)
+                os.replace(cache_path + ".tmp", cache_path)
+            except OSError as exception:
+                inoliblist.logger.warning("Unable to save the typo automaton: " + str(exception))
+
+    if typo_automaton is False:
+        return None
+    return typo_automaton
+
+
+def determine_codespell_dictionary_paths():
+    """Return the list of the paths of codespell's default dictionaries, or None if codespell is not installed."""
+    try:
+        import codespell_lib
+    except ImportError:
+        return None
+
+    codespell_data_folder = os.path.join(os.path.dirname(codespell_lib.__file__), "data")
+    return [os.path.join(codespell_data_folder, dictionary_filename)
+            for dictionary_filename in codespell_dictionary_filenames
+            if os.path.isfile(os.path.join(codespell_data_folder, dictionary_filename))]
 
-            # unzip the file
-            with zipfile.ZipFile(work_folder_name + '/' +
-                                 inolibbuglist_row_list[inoliblist.Column.repository_name] + ".zip",
-                                 "r"
-                                 ) as zip_ref:
-                zip_ref.extractall(work_folder_name)
-                # for some idiotic reason, the folder extracted from the GitHub generated .zip file doesn't
-                # always match {repo name}-{branch name}
-                # for example, https://github.com/EnviroDIY/GPRSbee should be GPRSbee-v1.2_hacked but
-                # actually it's GPRSbee-1.2_hacked
-                # zip_ref.namelist()[0] includes a trailing slash
-                repository_installation_path = work_folder_name + '/' + zip_ref.namelist()[0]
-
-            if check_for_typos:
-                # check for typos
-                codespell_exit_status = subprocess_run(command="codespell",
-                                                       arguments=shlex.quote(
-                                                           repository_installation_path)
-                                                       )
-                if codespell_exit_status != 0:
-                    inoliblist.logger.info("Typo found")
-                    inolibbuglist_row_list[Column.typo] = "True"
-                else:
-                    inolibbuglist_row_list[Column.typo] = "False"
-
-            # run the arduino-ci-script checks
-            # check_library_structure(), check_library_properties(), and check_keywords_txt require a known
-            # library path
-            if inolibbuglist_row_list[inoliblist.Column.library_path] != "":
-                if inolibbuglist_row_list[inoliblist.Column.library_path] != "/":
-                    library_path = repository_installation_path + inolibbuglist_row_list[
-                        inoliblist.Column.library_path] + '/'
-                else:
-                    library_path = repository_installation_path
-                arduino_ci_script_handler(function_name="check_library_structure",
-                                          function_parameters=shlex.quote(library_path),
-                                          row_list=inolibbuglist_row_list
-                                          )
-                arduino_ci_script_handler(function_name="check_library_properties",
-                                          function_parameters=shlex.quote(library_path),
-                                          row_list=inolibbuglist_row_list
-                                          )
-                arduino_ci_script_handler(function_name="check_keywords_txt",
-                                          function_parameters=shlex.quote(library_path),
-                                          row_list=inolibbuglist_row_list
-                                          )
-            # These checks are only relevant for libraries in the Library Manager index
-            if inolibbuglist_row_list[inoliblist.Column.in_library_manager_index] == "True":
-                if inolibbuglist_row_list[inoliblist.Column.library_path] != "/":
-                    inolibbuglist_row_list[Column.lm_but_not_in_root] = "True"
-                else:
-                    inolibbuglist_row_list[Column.lm_but_not_in_root] = "False"
-                arduino_ci_script_handler(function_name="check_library_manager_compliance",
-                                          function_parameters=shlex.quote(repository_installation_path),
-                                          row_list=inolibbuglist_row_list
-                                          )
-            # not yet implemented
-            # arduino_ci_script_handler(function_name="check_includes",
-            #                          function_parameters=shlex.quote(repository_installation_path),
-            #                          row_list=inolibbuglist_row_list
-            #                          )
 
-            # clean out the work folder
-            clean_folder(work_folder_name)
+def load_misspellings():
+    """Load codespell's dictionary, less the words in the ignore words list.
 
-            # append this row to the table
-            table.append(inolibbuglist_row_list)
+    The dictionary is only loaded once per process. Returns a dictionary of the fixes, by lowercase misspelling, or
+    None if codespell is not installed.
+    """
+    global misspellings
+    if misspellings is None:
+        dictionary_paths = determine_codespell_dictionary_paths()
+        if dictionary_paths is None:
+            inoliblist.logger.warning("codespell not installed, running codespell as a command for the typo check")
+            misspellings = False
+            return None
+
+        ignore_words = set()
+        with open(file=codespell_ignore_words_list_path, mode='r', encoding="utf-8") as ignore_words_file:
+            for line in ignore_words_file:
+                ignore_words.add(line.strip())
+
+        misspellings = {}
+        for dictionary_path in dictionary_paths:
+            with open(file=dictionary_path, mode='r', encoding="utf-8") as dictionary_file:
+                for line in dictionary_file:
+                    misspelling, _, fix = line.partition("->")
+                    misspelling = misspelling.lower()
+                    if misspelling not in ignore_words:
+                        misspellings[misspelling] = fix.strip().lower()
+                        # codespell also matches the misspellings with a typographic apostrophe
+                        if "'" in misspelling and misspelling.replace("'", "\u2019") not in ignore_words:
+                            misspellings[misspelling.replace("'", "\u2019")] = fix.strip().lower()
+
+    if misspellings is False:
+        return None
+    return misspellings
+
+
+def determine_default_branch_tip_commit(repository_full_name, branch):
+    """Return the SHA of the commit at the tip of the branch, or None if it could not be determined."""
+    try:
+        return get_github_api_response(
+            request="repos/" + repository_full_name + "/commits/" + urllib.parse.quote(branch, safe=""),
+            # an unchanged tip commit allows the download and checks of the repository to be skipped
+            priority=True
+        )["json_data"]["sha"]
+    except urllib.error.URLError:
+        inoliblist.logger.warning("HTTP error while determining the tip commit of the default branch")
+        return None
+
+
+def determine_incremental_state_path(repository_url):
+    return incremental_state_folder + "/" + hashlib.sha256(repository_url.encode()).hexdigest() + ".json"
+
+
+def determine_check_configuration(row_list):
+    """Return everything other than the repository contents that affects the results of the checks that require
+    downloading the repository. The results of a previous run are only reused if this has not changed.
+    """
+    check_configuration = {"arduino_ci_script_commit": arduino_ci_script_commit,
+                           "arduino_ci_script_arduino_ide_version": arduino_ci_script_arduino_ide_version,
+                           "check_engine": check_engine,
+                           "check_for_typos": check_for_typos,
+                           "library_path": row_list[inoliblist.Column.library_path],
+                           "in_library_manager_index": row_list[inoliblist.Column.in_library_manager_index]}
+    if check_for_typos:
+        # codespell's dictionary changes between versions
+        check_configuration["codespell_version"] = determine_python_package_version(module_name="codespell_lib")
+    return check_configuration
+
+
+def determine_arduino_ci_script_commit():
+    """Return the SHA of the commit of the installed arduino-ci-script."""
+    result = subprocess.run(shlex.split(quote_path(git_command) + " -C " + quote_path(arduino_ci_script_folder) +
+                                        " rev-parse HEAD"),
+                            stdout=subprocess.PIPE)
+    return result.stdout.decode().strip()
+
+
+def get_github_api_rate_limiter():
+    """Return the GitHubAPIRateLimiter of the current process, or the proxy of the shared one in the worker processes of
+    --jobs."""
+    if github_api_rate_limiter is None or github_api_rate_limiter_process_id != os.getpid():
+        set_github_api_rate_limiter(github_api_rate_limiter_input=GitHubAPIRateLimiter())
+    return github_api_rate_limiter
+
+
+def set_github_api_rate_limiter(github_api_rate_limiter_input):
+    global github_api_rate_limiter
+    global github_api_rate_limiter_process_id
+    github_api_rate_limiter = github_api_rate_limiter_input
+    github_api_rate_limiter_process_id = os.getpid()
+
+
+def get_scratch_folder_manager():
+    """Return the ScratchFolderManager of the current process. Each worker process of the pool needs its own because
+    the reaper thread is not inherited by forked processes."""
+    global scratch_folder_manager
+    if scratch_folder_manager is None or scratch_folder_manager.process_id != os.getpid():
+        scratch_folder_manager = ScratchFolderManager(root_folder_path=scratch_folder)
+    return scratch_folder_manager
+
+
+def get_worker_configuration():
+    """Return the configuration needed to initialize the worker processes of the pool."""
+    return {
+        "github_token": github_token,
+        "logging_level": inoliblist.logger.getEffectiveLevel(),
+        "github_login": github_login,
+        "git_command": git_command,
+        "bash_command": bash_command,
+        "arduino_ci_script_branch": arduino_ci_script_branch,
+        "arduino_ci_script_arduino_ide_version": arduino_ci_script_arduino_ide_version,
+        "arduino_ci_script_application_folder": arduino_ci_script_application_folder,
+        "browser_command": browser_command,
+        "jobs": jobs,
+        "github_api_concurrency": github_api_concurrency,
+        "use_graphql": use_graphql,
+        # (MB)
+        "github_api_cache_maximum_size": github_api_cache_maximum_size // (1024 * 1024),
+        "process_repos_with_open_pr": process_repos_with_open_pr,
+        "check_for_typos": check_for_typos,
+        "incremental": incremental,
+        # (MB)
+        "archive_cache_maximum_size": archive_cache_maximum_size // (1024 * 1024),
+        "arduino_ci_script_commit": arduino_ci_script_commit,
+        "check_engine": check_engine,
+        "bash_worker": bash_worker,
+        "scratch_folder": scratch_folder,
+        "github_api_rate_limiter": get_github_api_rate_limiter(),
+        "resume": resume,
+        "inoliblist_url": inoliblist_url,
+        "stream_inoliblist": stream_inoliblist
+    }
+
+
+def initialize_worker(configuration):
+    """Apply the configuration of the main process to a worker process of the pool. This is necessary because on
+    Windows the worker processes don't inherit the global variables of the main process."""
+    set_github_token(github_token_input=configuration["github_token"])
+    inoliblist.logger.setLevel(configuration["logging_level"])
+    set_github_login(github_login_input=configuration["github_login"])
+    set_git_command(git_command_input=configuration["git_command"])
+    set_bash_command(bash_command_input=configuration["bash_command"])
+    set_arduino_ci_script_branch(arduino_ci_script_branch_input=configuration["arduino_ci_script_branch"])
+    set_arduino_ci_script_arduino_ide_version(
+        arduino_ci_script_arduino_ide_version_input=configuration["arduino_ci_script_arduino_ide_version"]
+    )
+    set_arduino_ci_script_application_folder(
+        arduino_ci_script_application_folder_input=configuration["arduino_ci_script_application_folder"]
+    )
+    set_browser_command(browser_command_input=configuration["browser_command"])
+    set_jobs(jobs_input=configuration["jobs"])
+    set_github_api_concurrency(github_api_concurrency_input=configuration["github_api_concurrency"])
+    set_use_graphql(use_graphql_input=configuration["use_graphql"])
+    set_github_api_cache_maximum_size(
+        github_api_cache_maximum_size_input=configuration["github_api_cache_maximum_size"]
+    )
+    set_process_repos_with_open_pr(process_repos_with_open_pr_input=configuration["process_repos_with_open_pr"])
+    set_check_for_typos(check_for_typos_input=configuration["check_for_typos"])
+    set_incremental(incremental_input=configuration["incremental"])
+    set_archive_cache_maximum_size(archive_cache_maximum_size_input=configuration["archive_cache_maximum_size"])
+    set_arduino_ci_script_commit(arduino_ci_script_commit_input=configuration["arduino_ci_script_commit"])
+    set_check_engine(check_engine_input=configuration["check_engine"])
+    set_bash_worker(bash_worker_input=configuration["bash_worker"])
+    set_scratch_folder(scratch_folder_input=configuration["scratch_folder"])
+    set_github_api_rate_limiter(github_api_rate_limiter_input=configuration["github_api_rate_limiter"])
+    set_resume(resume_input=configuration["resume"])
+    set_inoliblist_url(inoliblist_url_input=configuration["inoliblist_url"])
+    set_stream_inoliblist(stream_inoliblist_input=configuration["stream_inoliblist"])
 
 
 def install_tools():
-    clean_folder(tools_folder_name)
+    """Install the tools, reusing the ones installed by previous runs.
+
+    Only the tools that are missing or out of date according to the tool manifest are installed. If a tool can't be
+    updated, for example because there is no network connection, the installed version is used.
+    """
+    tool_manifest = load_tool_manifest()
+
     if check_for_typos:
-        # install codespell
-        subprocess_run(command="pip", arguments="install codespell")
+        tool_manifest["codespell"] = install_python_package(package_name="codespell", module_name="codespell_lib")
+        # pyahocorasick is optional, for faster typo checks
+        tool_manifest["pyahocorasick"] = install_python_package(package_name="pyahocorasick",
+                                                                module_name="ahocorasick")
+
+    tool_manifest["arduino_ci_script"] = install_arduino_ci_script(
+        installed_arduino_ci_script=tool_manifest.get("arduino_ci_script")
+    )
+
+    save_tool_manifest(tool_manifest=tool_manifest)
+
+
+def load_tool_manifest():
+    """Return the tool manifest written by the previous run, or an empty manifest if there is none."""
+    try:
+        with open(file=tool_manifest_path, mode='r', encoding="utf-8") as tool_manifest_file:
+            tool_manifest = json.load(tool_manifest_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(tool_manifest, dict):
+        return {}
+    return tool_manifest
+
+
+def save_tool_manifest(tool_manifest):
+    os.makedirs(tools_folder_name, exist_ok=True)
+    with open(file=tool_manifest_path + ".tmp", mode='w', encoding="utf-8") as tool_manifest_file:
+        json.dump(tool_manifest, tool_manifest_file, indent=2, sort_keys=True)
+    os.replace(tool_manifest_path + ".tmp", tool_manifest_path)
+
+
+def install_python_package(package_name, module_name):
+    """Install the package via pip if it is not already installed. Returns the installed version, or None if the package
+    is not installed.
+
+    Keyword arguments:
+    package_name -- name of the package on PyPI
+    module_name -- name of the module imported from the package
+    """
+    package_version = determine_python_package_version(module_name=module_name)
+    if package_version is None:
+        subprocess_run(command="pip", arguments="install " + package_name)
+        # the module finders cache the contents of the folders of sys.path
+        importlib.invalidate_caches()
+        package_version = determine_python_package_version(module_name=module_name)
+        if package_version is None:
+            inoliblist.logger.warning("Unable to install " + package_name)
+    else:
+        inoliblist.logger.info("Using the installed " + package_name + " " + package_version)
+    return package_version
+
+
+def determine_python_package_version(module_name):
+    """Return the version of the module, an empty string if the module doesn't have a version, or None if the module is
+    not installed."""
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return str(getattr(module, "__version__", ""))
+
+
+def install_arduino_ci_script(installed_arduino_ci_script):
+    """Install arduino-ci-script to the tools folder, or update the installation of a previous run to the tip of
+    arduino_ci_script_branch via a shallow fetch. Returns the tool manifest entry of the installation.
+
+    Keyword arguments:
+    installed_arduino_ci_script -- tool manifest entry of the installation of the previous run, or None
+    """
+    if (
+            installed_arduino_ci_script is not None
+            and os.path.isfile(arduino_ci_script_path)
+            and determine_arduino_ci_script_commit() == installed_arduino_ci_script.get("commit")
+    ):
+        fetch_return = subprocess_run(command=quote_path(git_command),
+                                      arguments="-C " + quote_path(arduino_ci_script_folder) +
+                                                " fetch --depth 1 " + arduino_ci_script_clone_url + ' ' +
+                                                arduino_ci_script_branch
+                                      )
+        if fetch_return == 0:
+            subprocess_run(command=quote_path(git_command),
+                           arguments="-C " + quote_path(arduino_ci_script_folder) + " reset --hard FETCH_HEAD")
+        elif installed_arduino_ci_script.get("branch") == arduino_ci_script_branch:
+            inoliblist.logger.warning("Unable to update arduino-ci-script, using the installed commit " +
+                                      installed_arduino_ci_script["commit"])
+        else:
+            inoliblist.logger.warning("Unable to fetch arduino-ci-script branch " + arduino_ci_script_branch +
+                                      ", using the installed branch " + str(installed_arduino_ci_script.get("branch")))
+            return installed_arduino_ci_script
+    else:
+        # there is no usable installation so clone arduino-ci-script to the tools folder
+        clean_folder(arduino_ci_script_folder)
+        subprocess_run(command=quote_path(git_command),
+                       arguments="clone --branch " +
+                                 arduino_ci_script_branch +
+                                 " --depth 1 " +
+                                 arduino_ci_script_clone_url + ' ' +
+                                 quote_path(arduino_ci_script_folder)
+                       )
+
+    arduino_ci_script_commit_installed = determine_arduino_ci_script_commit()
+    inoliblist.logger.info("Using arduino-ci-script " + arduino_ci_script_branch + " at " +
+                           arduino_ci_script_commit_installed)
+    return {"branch": arduino_ci_script_branch, "commit": arduino_ci_script_commit_installed}
+
+
+def install_ide():
+    """Install the Arduino IDE for check_keywords_txt's reference link check, unless the tool manifest shows it is
+    already installed."""
+    installed_ide = {"version": arduino_ci_script_arduino_ide_version,
+                     "application_folder": arduino_ci_script_application_folder}
+    tool_manifest = load_tool_manifest()
+    if tool_manifest.get("arduino_ide") == installed_ide and any(
+            os.path.isdir(os.path.join(arduino_ci_script_application_folder, ide_folder_name))
+            for ide_folder_name in ("arduino", "arduino-" + arduino_ci_script_arduino_ide_version)
+    ):
+        inoliblist.logger.info("Using the installed Arduino IDE " + arduino_ci_script_arduino_ide_version)
+        return
 
-    # clone arduino-ci-script to the tools folder
-    subprocess_run(command=quote_path(git_command),
-                   arguments="clone --branch " +
-                             arduino_ci_script_branch +
-                             " --depth 1 " +
-                             arduino_ci_script_clone_url + ' ' +
-                             quote_path(arduino_ci_script_folder)
-                   )
+    # if the IDE version is already installed to arduino_ci_script_application_folder then it will not be reinstalled
+    install_ide_return = arduino_ci_script_wrapper_handler(function_name="install_ide",
+                                                           function_parameters=arduino_ci_script_arduino_ide_version)
+    if install_ide_return == bash_script_success_exit_status:
+        tool_manifest["arduino_ide"] = installed_ide
+    else:
+        tool_manifest.pop("arduino_ide", None)
+    save_tool_manifest(tool_manifest=tool_manifest)
 
 
 def subprocess_run(command, arguments):
@@ -961,6 +3550,441 @@ def quote_path(path):
     return path
 
 
+def run_check(function_name, repository_archive, path, work_folder_path, row_list):
+    """Run one of the arduino-ci-script checks on a path in the repository archive.
+
+    If the Python check engine is selected and has an implementation of the check, the check is done in-process on the
+    archive. Otherwise, or if the Python implementation can't decide, the archive is extracted and arduino-ci-script is
+    used.
+    """
+    if check_engine == "python" and function_name in native_checks:
+        exit_status = native_checks[function_name](repository_archive=repository_archive, path=path)
+        if exit_status is not None:
+            if exit_status != bash_script_success_exit_status:
+                row_list[arduino_ci_script_exit_statuses[function_name][exit_status]] = "True"
+            return
+
+    arduino_ci_script_handler(function_name=function_name,
+                              function_parameters=shlex.quote(
+                                  repository_archive.extract(folder_path=work_folder_path) + path
+                              ),
+                              row_list=row_list
+                              )
+
+
+def check_library_structure_native(repository_archive, path):
+    """Python implementation of arduino-ci-script's check_library_structure.
+
+    Keyword arguments:
+    repository_archive -- RepositoryArchive of the repository
+    path -- path of the library folder in the archive
+
+    Returns the exit status of arduino-ci-script's check_library_structure. Like arduino-ci-script, the checks stop at
+    the first problem found.
+    """
+    return next(generate_library_structure_exit_statuses(repository_archive=repository_archive, path=path),
+                bash_script_success_exit_status)
+
+
+def generate_library_structure_exit_statuses(repository_archive, path):
+    """Yield the check_library_structure exit statuses of the problems of the library, in the order arduino-ci-script
+    checks for them."""
+    if path != "" and not repository_archive.is_folder(path=path):
+        yield 7
+        return
+
+    library_file_paths = [archive_path[len(path):] for archive_path in repository_archive.paths()
+                          if archive_path.startswith(path) and not archive_path.endswith('/')]
+    # arduino-ci-script searches the whole library folder for header files
+    if not any(library_file_path.endswith(header_file_extensions) for library_file_path in library_file_paths):
+        yield 9
+
+    root_paths = repository_archive.list_folder(folder_path=path)
+    root_folder_names = [root_path[len(path):-1] for root_path in root_paths if root_path.endswith('/')]
+    root_filenames = [root_path[len(path):] for root_path in root_paths if not root_path.endswith('/')]
+
+    for folder_name in root_folder_names:
+        if folder_name.lower() in ("extra", "extras") and folder_name != "extras":
+            yield 1
+        if folder_name.lower() in ("example", "examples") and folder_name != "examples":
+            yield 2
+        if folder_name.startswith('.') and folder_name not in non_spurious_dot_folder_names:
+            yield 6
+        if folder_name.lower() == "src" and folder_name != "src":
+            yield 8
+
+    for library_file_path in library_file_paths:
+        if '/' not in library_file_path:
+            # the library's own files
+            continue
+        filename = library_file_path.rpartition('/')[2]
+        if filename == "library.properties":
+            yield 3
+        elif filename == "keywords.txt":
+            yield 4
+        elif (
+                filename.lower().endswith(sketch_extensions) and
+                not library_file_path.startswith(("examples/", "extras/"))
+        ):
+            yield 5
+    if any(filename.lower().endswith(sketch_extensions) for filename in root_filenames):
+        yield 5
+
+    if path == "":
+        library_folder_name = repository_archive.root_folder_name[:-1]
+    else:
+        library_folder_name = path[:-1].rpartition('/')[2]
+    yield from check_folder_name(folder_name=library_folder_name, exit_statuses=(10, 11, 12))
+
+    if "src" in root_folder_names and "utility" in root_folder_names:
+        yield 13
+
+    if "examples" in root_folder_names:
+        yield from check_sketch_structure(repository_archive=repository_archive, path=path + "examples/")
+
+
+def check_sketch_structure(repository_archive, path):
+    """Check the structure of the sketches in the folder and its subfolders. Returns the list of
+    check_library_structure exit statuses for the problems found.
+    """
+    exit_statuses = []
+    sketch_filenames = []
+    for sketch_path in repository_archive.list_folder(folder_path=path):
+        if sketch_path.endswith('/'):
+            exit_statuses += check_sketch_structure(repository_archive=repository_archive, path=sketch_path)
+        elif sketch_path.lower().endswith(sketch_extensions):
+            sketch_filenames.append(sketch_path.rpartition('/')[2])
+
+    if sketch_filenames:
+        sketch_folder_name = path[:-1].rpartition('/')[2]
+        if any(not sketch_filename.endswith(sketch_extensions) for sketch_filename in sketch_filenames):
+            exit_statuses.append(15)
+        # a sketch can contain multiple .ino files, but not a mixture of .ino and .pde files
+        sketch_file_extensions = {sketch_filename.lower().rpartition('.')[2] for sketch_filename in sketch_filenames}
+        if len(sketch_file_extensions) > 1:
+            exit_statuses.append(16)
+        if not any(sketch_filename.rpartition('.')[0] == sketch_folder_name for sketch_filename in sketch_filenames):
+            exit_statuses.append(17)
+        exit_statuses += check_folder_name(folder_name=sketch_folder_name, exit_statuses=(18, 19, 20))
+    return exit_statuses
+
+
+def check_folder_name(folder_name, exit_statuses):
+    """Check whether the folder name is valid for a library or sketch.
+
+    Keyword arguments:
+    folder_name -- name of the folder
+    exit_statuses -- tuple of the exit statuses for invalid first character, invalid character, and too long
+
+    Returns the list of the exit statuses for the problems found.
+    """
+    invalid_first_character_exit_status, invalid_character_exit_status, too_long_exit_status = exit_statuses
+    folder_name_exit_statuses = []
+    if not valid_folder_name_first_character_regex.match(folder_name):
+        folder_name_exit_statuses.append(invalid_first_character_exit_status)
+    if invalid_folder_name_character_regex.search(folder_name):
+        folder_name_exit_statuses.append(invalid_character_exit_status)
+    if len(folder_name) > maximum_folder_name_length:
+        folder_name_exit_statuses.append(too_long_exit_status)
+    return folder_name_exit_statuses
+
+
+def check_library_properties_native(repository_archive, path):
+    """Python implementation of arduino-ci-script's check_library_properties.
+
+    Keyword arguments:
+    repository_archive -- RepositoryArchive of the repository
+    path -- path of the library folder in the archive
+
+    Returns the exit status of arduino-ci-script's check_library_properties, or None if a problem can't be decided
+    without arduino-ci-script. Like arduino-ci-script, the checks stop at the first problem found.
+    """
+    return next(generate_library_properties_exit_statuses(repository_archive=repository_archive, path=path),
+                bash_script_success_exit_status)
+
+
+def generate_library_properties_exit_statuses(repository_archive, path):
+    """Yield the check_library_properties exit statuses of the problems of the library, in the order arduino-ci-script
+    checks for them. None is yielded for a problem that can't be decided without arduino-ci-script."""
+    if path != "" and not repository_archive.is_folder(path=path):
+        yield 6
+        return
+
+    for library_path in repository_archive.list_folder(folder_path=path):
+        filename = library_path[len(path):]
+        if filename.lower() == "library.properties" and filename != "library.properties":
+            yield 8
+        elif filename != "library.properties" and misspelled_library_properties_filename_regex.match(filename):
+            yield 7
+
+    if not repository_archive.exists(path=path + "library.properties"):
+        # library.properties is optional for 1.0 format libraries
+        return
+
+    library_properties = {}
+    library_properties_lines = repository_archive.read(
+        path=path + "library.properties"
+    ).decode(encoding="utf-8", errors="replace").lstrip(utf_8_bom).splitlines()
+    for line in library_properties_lines:
+        if line.strip() == "" or line.lstrip().startswith('#'):
+            continue
+        if '=' not in line:
+            yield 17
+            continue
+        key, _, value = line.partition('=')
+        key = key.strip()
+        library_properties[key] = value.strip()
+
+        misspelled_key = misspelled_library_properties_keys.get(re.sub(r"[-_. ]", "", key.lower()))
+        if misspelled_key is not None and key != misspelled_key[0]:
+            yield misspelled_key[1]
+
+    for key, exit_status in required_library_properties_keys:
+        if key not in library_properties:
+            yield exit_status
+
+    if library_properties.get("name") == "":
+        yield 2
+
+    sentence = library_properties.get("sentence", "")
+    if sentence != "" and library_properties.get("paragraph", "").startswith(sentence):
+        yield 1
+
+    if "version" in library_properties and not valid_library_version_regex.match(library_properties["version"]):
+        yield 18
+
+    if "category" in library_properties and library_properties["category"] not in valid_library_categories:
+        yield 19
+
+    if "architectures" in library_properties:
+        architectures = [architecture.strip() for architecture in library_properties["architectures"].split(',')]
+        if architectures == [""]:
+            yield 5
+        else:
+            for architecture in architectures:
+                if architecture in invalid_library_architectures:
+                    yield 3
+                elif architecture not in valid_library_architectures:
+                    # the architecture may be valid but not yet known, arduino-ci-script must decide
+                    yield None
+                    return
+
+    if "url" in library_properties:
+        if library_properties["url"] == "":
+            yield 20
+        elif not url_scheme_regex.match(library_properties["url"]):
+            yield 21
+        elif not check_url(url=library_properties["url"]):
+            yield 22
+
+    if library_properties.get("includes") == "":
+        yield 27
+
+
+def check_url(url):
+    """Return whether the URL can be loaded."""
+    for method in ("HEAD", "GET"):
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url=url, method=method), timeout=url_check_timeout):
+                return True
+        except urllib.error.HTTPError:
+            # some servers don't support HEAD requests so try again with GET
+            continue
+        except (urllib.error.URLError, ValueError, OSError):
+            return False
+    return False
+
+
+def check_keywords_txt_native(repository_archive, path):
+    """Python implementation of arduino-ci-script's check_keywords_txt.
+
+    Keyword arguments:
+    repository_archive -- RepositoryArchive of the repository
+    path -- path of the library folder in the archive
+
+    Returns the exit status of arduino-ci-script's check_keywords_txt, or None if the reference links can't be checked
+    because the Arduino IDE reference pages are not available. Like arduino-ci-script, the checks stop at the first
+    problem found.
+    """
+    return next(generate_keywords_txt_exit_statuses(repository_archive=repository_archive, path=path),
+                bash_script_success_exit_status)
+
+
+def generate_keywords_txt_exit_statuses(repository_archive, path):
+    """Yield the check_keywords_txt exit statuses of the problems of the library, in the order arduino-ci-script checks
+    for them. None is yielded if a reference link can't be checked."""
+    if path != "" and not repository_archive.is_folder(path=path):
+        yield 6
+        return
+
+    for library_path in repository_archive.list_folder(folder_path=path):
+        filename = library_path[len(path):]
+        if filename.lower() == "keywords.txt" and filename != "keywords.txt":
+            yield 8
+        elif filename != "keywords.txt" and misspelled_keywords_txt_filename_regex.match(filename):
+            yield 7
+
+    if not repository_archive.exists(path=path + "keywords.txt"):
+        return
+
+    keywords_txt = repository_archive.read(path=path + "keywords.txt").decode(encoding="utf-8", errors="replace")
+    for line_number, line in enumerate(keywords_txt.splitlines()):
+        if line_number == 0 and line.startswith(utf_8_bom):
+            line = line[len(utf_8_bom):]
+            if line.strip() != "" and not line.lstrip().startswith('#'):
+                # the Arduino IDE doesn't strip the BOM so the first keyword is not recognized
+                yield 10
+        if line.strip() == "" or line.lstrip().startswith('#'):
+            continue
+
+        if '\t' not in line:
+            if keywords_txt_space_separated_line_regex.match(line):
+                yield 9
+            else:
+                yield 2
+            continue
+
+        keyword, _, fields = line.partition('\t')
+        if not valid_keyword_regex.match(keyword):
+            yield 11
+
+        if fields.startswith('\t'):
+            # the Arduino IDE takes the empty field as the KEYWORD_TOKENTYPE
+            yield 4
+            fields = fields.lstrip('\t')
+        keyword_tokentype, *optional_fields = fields.split('\t')
+        if len(optional_fields) > 2 or (len(optional_fields) > 0 and optional_fields[-1] == ""):
+            yield 1
+
+        if keyword_tokentype != keyword_tokentype.lstrip():
+            if len(optional_fields) > 0:
+                yield 5
+            else:
+                yield 3
+        if keyword_tokentype.strip() not in valid_keyword_tokentypes:
+            if ' ' in keyword_tokentype.strip():
+                yield 9
+            else:
+                yield 12
+
+        if len(optional_fields) > 0 and optional_fields[0].strip() != "":
+            reference_link = optional_fields[0].strip()
+            reference_links = load_reference_links()
+            if reference_links is None:
+                yield None
+                return
+            if reference_link not in reference_links["exact"]:
+                if reference_link.casefold() in reference_links["casefolded"]:
+                    yield 16
+                else:
+                    yield 15
+
+        if len(optional_fields) > 1 and optional_fields[1] != "":
+            rsyntaxtextarea_tokentype = optional_fields[1]
+            if rsyntaxtextarea_tokentype != rsyntaxtextarea_tokentype.lstrip():
+                yield 13
+            if rsyntaxtextarea_tokentype.strip() not in valid_rsyntaxtextarea_tokentypes:
+                yield 14
+
+
+def check_library_manager_compliance_native(repository_archive, path):
+    """Python implementation of arduino-ci-script's check_library_manager_compliance.
+
+    The checks are done on the archive's member list, without extracting the archive.
+
+    Keyword arguments:
+    repository_archive -- RepositoryArchive of the repository
+    path -- path of the library folder in the archive
+
+    Returns the exit status of arduino-ci-script's check_library_manager_compliance. Like arduino-ci-script, the checks
+    stop at the first problem found.
+    """
+    return next(generate_library_manager_compliance_exit_statuses(repository_archive=repository_archive, path=path),
+                bash_script_success_exit_status)
+
+
+def generate_library_manager_compliance_exit_statuses(repository_archive, path):
+    """Yield the check_library_manager_compliance exit statuses of the problems of the library, in the order
+    arduino-ci-script checks for them."""
+    if path != "" and not repository_archive.is_folder(path=path):
+        yield 1
+        return
+
+    library_paths = [library_path for library_path in repository_archive.paths() if library_path.startswith(path)]
+    if any(library_path.endswith(".exe") for library_path in library_paths):
+        yield 2
+    if path + ".development" in library_paths:
+        yield 3
+    if any(not library_path.endswith('/') and repository_archive.is_symlink(path=library_path)
+           for library_path in library_paths):
+        yield 4
+
+    library_name = determine_library_name(repository_archive=repository_archive, path=path)
+    if library_name is not None:
+        if not valid_folder_name_first_character_regex.match(library_name):
+            yield 5
+        if invalid_library_name_character_regex.search(library_name):
+            yield 6
+        if len(library_name) > maximum_folder_name_length:
+            yield 7
+
+
+def determine_library_name(repository_archive, path):
+    """Return the value of the library.properties name field, or None if not defined."""
+    if not repository_archive.exists(path=path + "library.properties"):
+        return None
+    library_properties_lines = repository_archive.read(
+        path=path + "library.properties"
+    ).decode(encoding="utf-8", errors="replace").lstrip(utf_8_bom).splitlines()
+    for line in library_properties_lines:
+        key, separator, value = line.partition('=')
+        if separator == '=' and key.strip() == "name":
+            return value.strip()
+    return None
+
+
+def load_reference_links():
+    """Load the names of the Arduino IDE reference pages for the keywords.txt reference link checks.
+
+    The reference pages are only listed once per process. Returns a dictionary of the set of reference link names and
+    the set of casefolded reference link names, or None if the reference pages are not available.
+    """
+    global reference_links
+    if reference_links is None:
+        for ide_folder_name in ("arduino", "arduino-" + arduino_ci_script_arduino_ide_version):
+            reference_folder_path = os.path.join(arduino_ci_script_application_folder, ide_folder_name,
+                                                 *arduino_ide_reference_folder)
+            try:
+                reference_filenames = os.listdir(reference_folder_path)
+            except OSError:
+                continue
+            reference_link_names = {os.path.splitext(reference_filename)[0]
+                                    for reference_filename in reference_filenames
+                                    if reference_filename.endswith(".html")}
+            reference_links = {
+                "exact": reference_link_names,
+                "casefolded": {reference_link_name.casefold() for reference_link_name in reference_link_names}
+            }
+            break
+        else:
+            inoliblist.logger.warning("Arduino IDE reference pages not found, using arduino-ci-script for the "
+                                      "keywords.txt reference link checks")
+            reference_links = False
+
+    if reference_links is False:
+        return None
+    return reference_links
+
+
+# the Python implementations of the arduino-ci-script checks, used when the Python check engine is selected
+native_checks = {
+    "check_library_structure": check_library_structure_native,
+    "check_library_properties": check_library_properties_native,
+    "check_keywords_txt": check_keywords_txt_native,
+    "check_library_manager_compliance": check_library_manager_compliance_native
+}
+
+
 def arduino_ci_script_handler(function_name, function_parameters, row_list):
     check_library_structure_return = arduino_ci_script_wrapper_handler(function_name=function_name,
                                                                        function_parameters=function_parameters)
@@ -969,6 +3993,13 @@ def arduino_ci_script_handler(function_name, function_parameters, row_list):
 
 
 def arduino_ci_script_wrapper_handler(function_name, function_parameters):
+    invocation = function_name + ' ' + function_parameters
+    # the worker protocol is line based
+    if bash_worker and '\n' not in invocation:
+        exit_status = run_arduino_ci_script_worker_invocation(invocation=invocation)
+        if exit_status is not None:
+            return exit_status
+
     command = (shlex.quote(arduino_ci_script_wrapper_path) + ' ' +
                shlex.quote(arduino_ci_script_path) + ' ' +
                shlex.quote(arduino_ci_script_application_folder) + ' ' +
@@ -984,6 +4015,23 @@ def arduino_ci_script_wrapper_handler(function_name, function_parameters):
     return run_bash_command(commandline)
 
 
+def run_arduino_ci_script_worker_invocation(invocation):
+    global arduino_ci_script_worker
+    if arduino_ci_script_worker is None:
+        arduino_ci_script_worker = ArduinoCIScriptWorker()
+    inoliblist.logger.info("Running arduino-ci-script worker invocation: " + invocation)
+    response = arduino_ci_script_worker.run(invocation=invocation)
+    if response is None:
+        inoliblist.logger.warning("arduino-ci-script worker failed, running without the worker: " + invocation)
+        return None
+    exit_status, output = response
+    if output != "":
+        inoliblist.logger.info("output: " + output)
+    inoliblist.logger.info("exit status: " + str(exit_status))
+
+    return exit_status
+
+
 def run_bash_command(commandline):
     commandline = quote_path(bash_command) + ' ' + commandline
     inoliblist.logger.info("Running command: " + commandline)
@@ -1020,6 +4068,56 @@ def create_inolibbuglist_output_file():
         inolibbuglist_csv.writerows(table)
 
 
+def determine_column_indexes():
+    """Return a dictionary of the indexes of the inolibbuglist columns, by the attribute names of Column and
+    inoliblist.Column."""
+    column_indexes = {}
+    for column_class in (inoliblist.Column, Column):
+        for attribute_name, attribute_value in vars(column_class).items():
+            if (isinstance(attribute_value, int) and not attribute_name.startswith('_') and
+                    attribute_name not in ("column_counter", "count", "start_of_normal_bugs")):
+                column_indexes[attribute_name] = attribute_value
+    return column_indexes
+
+
+def run_query(expression, script_filename=None):
+    """Print the repository URLs of the rows of inolibbuglist.csv that match the query expression.
+
+    Keyword arguments:
+    expression -- query expression, as described in InolibbuglistIndex.query()
+    script_filename -- if specified, open-in-tabs scripts of the matching repositories are also created in the output
+                       folder with this filename
+    """
+    inolibbuglist_index = InolibbuglistIndex.from_file(input_path=output_folder_name + "/" + inolibbuglist_filename)
+    try:
+        repository_urls = inolibbuglist_index.query(expression=expression)
+    except ValueError as exception:
+        inoliblist.logger.error(str(exception))
+        return None
+
+    for repository_url in repository_urls:
+        print(repository_url)
+
+    if script_filename is not None:
+        # the scripts are appended to, so the scripts of a previous query with the same filename are deleted first
+        script_filename_regex = re.compile(re.escape(script_filename) + r"[0-9]+" +
+                                           re.escape(browser_script_extension))
+        for output_filename in os.listdir(output_folder_name):
+            if script_filename_regex.fullmatch(output_filename):
+                os.remove(output_folder_name + "/" + output_filename)
+
+        open_in_tabs_script_writer = OpenInTabsScriptWriter(heading_row=["repository_url"],
+                                                            url_column=0,
+                                                            inclusion_columns=[True],
+                                                            exclusion_columns=[],
+                                                            output_filename=script_filename)
+        for repository_url in repository_urls:
+            open_in_tabs_script_writer.write_row(input_row=[repository_url])
+        open_in_tabs_script_writer.close()
+
+    return repository_urls
+
+
 def create_open_in_tabs_scripts():
     # create the scripts for the verification failed list
     if os.path.isfile(output_folder_name + "/" + inoliblist.verification_failed_list_filename):
@@ -1039,28 +4137,42 @@ def create_open_in_tabs_scripts():
     else:
         inoliblist.logger.warning("Output file from verification failed list processing not found.")
 
-    # create the scripts for the "arduino-library" topic abuse
-    create_open_in_tabs_script(input_filename=inolibbuglist_filename,
-                               url_column=inoliblist.Column.repository_url,
-                               inclusion_columns=[Column.arduino_library_topic_abuse],
-                               exclusion_columns=[Column.i_have_open_issue]
-                               )
+    # create the scripts for the inolibbuglist columns in a single pass over the output file
+    # the "arduino-library" topic abuse scripts
+    open_in_tabs_scripts = [{"url_column": inoliblist.Column.repository_url,
+                             "inclusion_columns": [Column.arduino_library_topic_abuse],
+                             "exclusion_columns": [Column.i_have_open_issue]}]
 
-    # create scripts for the rest of the columns
+    # the scripts for the rest of the columns
     if process_repos_with_open_pr:
         exclusion_columns = [Column.blacklist]
     else:
         exclusion_columns = [Column.i_have_open_pull_request, Column.blacklist]
 
     for column_number in range(Column.start_of_normal_bugs, Column.count):
-        create_open_in_tabs_script(input_filename=inolibbuglist_filename,
-                                   url_column=inoliblist.Column.repository_url,
-                                   inclusion_columns=[column_number],
-                                   exclusion_columns=exclusion_columns
-                                   )
+        open_in_tabs_scripts.append({"url_column": inoliblist.Column.repository_url,
+                                     "inclusion_columns": [column_number],
+                                     "exclusion_columns": exclusion_columns})
+
+    create_open_in_tabs_script_set(input_filename=inolibbuglist_filename, open_in_tabs_scripts=open_in_tabs_scripts)
 
 
 def create_open_in_tabs_script(input_filename, url_column, inclusion_columns, exclusion_columns, output_filename=None):
+    create_open_in_tabs_script_set(input_filename=input_filename,
+                                   open_in_tabs_scripts=[{"url_column": url_column,
+                                                          "inclusion_columns": inclusion_columns,
+                                                          "exclusion_columns": exclusion_columns,
+                                                          "output_filename": output_filename}])
+
+
+def create_open_in_tabs_script_set(input_filename, open_in_tabs_scripts):
+    """Create any number of open-in-tabs scripts from a single pass over the input file.
+
+    Keyword arguments:
+    input_filename -- filename of the input file in the output folder
+    open_in_tabs_scripts -- list of dictionaries of the url_column, inclusion_columns, exclusion_columns, and optional
+                            output_filename arguments of OpenInTabsScriptWriter for each script
+    """
     with open(file=output_folder_name + "/" + input_filename,
               mode='r',
               encoding=inoliblist.file_encoding,
@@ -1070,51 +4182,16 @@ def create_open_in_tabs_script(input_filename, url_column, inclusion_columns, ex
                                delimiter=inoliblist.output_file_delimiter,
                                quotechar=inoliblist.output_file_quotechar)
         # read the column heading row
-        input_row = next(input_csv)
-        if output_filename is None:
-            # use the first inclusion column heading text as the filename
-            output_filename = input_row[inclusion_columns[0]]
-
-        # setting it above the threshold value to always trigger the filename increment on the first result
-        # (to avoid confusing debug output)
-        tabs_count = maximum_browser_tabs + 1
-        filename_count = 0
-        for input_row in input_csv:
-            excluded_from_list = False
-            for inclusion_column in inclusion_columns:
-                # any inclusion column mismatch excludes the row
-                if inclusion_column is not True and input_row[inclusion_column] != "True":
-                    excluded_from_list = True
-                    break
-            for exclusion_column in exclusion_columns:
-                # any exclusion column match excludes the row
-                if input_row[exclusion_column] == "True":
-                    excluded_from_list = True
-                    break
-            if excluded_from_list:
-                # go on to the next row
-                continue
-            tabs_count += 1
-            if tabs_count > maximum_browser_tabs:
-                filename_count += 1
-                tabs_count = 0
-                inoliblist.logger.info("Creating open-in-tabs script: " +
-                                       output_filename +
-                                       str(filename_count) +
-                                       browser_script_extension
-                                       )
-            with open(file=(output_folder_name +
-                            "/" +
-                            output_filename +
-                            str(filename_count) +
-                            browser_script_extension),
-                      mode='a',
-                      encoding=inoliblist.file_encoding,
-                      newline=inoliblist.file_newline
-                      ) as browser_script_file:
-                browser_script_file.write(browser_command + " " +
-                                          input_row[url_column] + '\n'
-                                          )
+        heading_row = next(input_csv)
+        open_in_tabs_script_writers = [OpenInTabsScriptWriter(heading_row=heading_row, **open_in_tabs_script)
+                                       for open_in_tabs_script in open_in_tabs_scripts]
+        try:
+            for input_row in input_csv:
+                for open_in_tabs_script_writer in open_in_tabs_script_writers:
+                    open_in_tabs_script_writer.write_row(input_row=input_row)
+        finally:
+            for open_in_tabs_script_writer in open_in_tabs_script_writers:
+                open_in_tabs_script_writer.close()
 
 
 def onerror(func, path, _exc_info):
@@ -1183,6 +4260,87 @@ if __name__ == '__main__':
                                  help="Arduino IDE version to use for the check_keywords_txt() reference link checks",
                                  metavar="VERSION"
                                  )
+    argument_parser.add_argument("--jobs",
+                                 dest="jobs",
+                                 default=default_jobs,
+                                 type=int,
+                                 help="Number of repositories to process in parallel",
+                                 metavar="N"
+                                 )
+    argument_parser.add_argument("--github_api_concurrency",
+                                 dest="github_api_concurrency",
+                                 default=default_github_api_concurrency,
+                                 type=int,
+                                 help="Maximum number of concurrent GitHub API requests",
+                                 metavar="N"
+                                 )
+    argument_parser.add_argument("--graphql",
+                                 dest="use_graphql",
+                                 help="Use the GitHub GraphQL API to check many repositories per request",
+                                 action="store_true"
+                                 )
+    argument_parser.add_argument("--github_api_cache_size",
+                                 dest="github_api_cache_maximum_size",
+                                 default=default_github_api_cache_maximum_size,
+                                 type=int,
+                                 help="Maximum size in MB of the cache of GitHub API responses",
+                                 metavar="SIZE"
+                                 )
+    argument_parser.add_argument("--incremental",
+                                 dest="incremental",
+                                 help="Reuse the results of the previous run for repositories that have not changed",
+                                 action="store_true"
+                                 )
+    argument_parser.add_argument("--resume",
+                                 dest="resume",
+                                 help="Resume an interrupted run from its journal",
+                                 action="store_true"
+                                 )
+    argument_parser.add_argument("--inoliblist_url",
+                                 dest="inoliblist_url",
+                                 default=inoliblist_csv_download_url,
+                                 help="URL to download inoliblist.csv from",
+                                 metavar="URL"
+                                 )
+    argument_parser.add_argument("--stream_inoliblist",
+                                 dest="stream_inoliblist",
+                                 help="Start processing inoliblist while it is downloading",
+                                 action="store_true"
+                                 )
+    argument_parser.add_argument("--archive_cache_size",
+                                 dest="archive_cache_maximum_size",
+                                 default=default_archive_cache_maximum_size,
+                                 type=int,
+                                 help="Maximum size in MB of the cache of repository archives (0 to disable)",
+                                 metavar="SIZE"
+                                 )
+    argument_parser.add_argument("--check_engine",
+                                 dest="check_engine",
+                                 default=default_check_engine,
+                                 choices=["bash", "python"],
+                                 help="Use arduino-ci-script or the in-process Python implementations for the checks",
+                                 )
+    argument_parser.add_argument("--scratch_folder",
+                                 dest="scratch_folder",
+                                 default=default_scratch_folder,
+                                 help="Folder to create the temporary folders the repositories are extracted to under",
+                                 metavar="PATH"
+                                 )
+    argument_parser.add_argument("--bash_worker",
+                                 dest="bash_worker",
+                                 help="Run the arduino-ci-script functions in a persistent bash process",
+                                 action="store_true"
+                                 )
+    argument_parser.add_argument("--query",
+                                 dest="query",
+                                 help="Print the repositories in the existing output that match the expression",
+                                 metavar="EXPRESSION"
+                                 )
+    argument_parser.add_argument("--query_script",
+                                 dest="query_script_filename",
+                                 help="Also create open-in-tabs scripts of the --query results with this filename",
+                                 metavar="FILENAME"
+                                 )
     argument_parser.add_argument("--verbose",
                                  dest="enable_verbosity",
                                  help="Enable verbose output",
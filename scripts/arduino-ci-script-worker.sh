@@ -0,0 +1,18 @@
+#!/bin/bash
+# Long-lived worker that sources arduino-ci-script once and then runs the function invocations it reads from stdin, one per line. The output of each invocation is followed by a line containing the response marker and the exit status, which tells inolibbuglist.py that the invocation has finished.
+
+arduinoCIscriptWrapperPath="$1"
+arduinoCIscriptPath="$2"
+arduinoCIscriptApplicationFolder="$3"
+arduinoCIscriptArduinoIDEversion="$4"
+responseMarker="$5"
+
+source "$arduinoCIscriptWrapperPath" "$arduinoCIscriptPath" "$arduinoCIscriptApplicationFolder" "$arduinoCIscriptArduinoIDEversion"
+
+while IFS= read -r invocation; do
+  # run the invocation in a subshell so that an exit or change to the environment doesn't affect the worker
+  (eval "$invocation") </dev/null 2>&1
+  exitStatus=$?
+  # the leading newline ensures the marker is on its own line even if the output doesn't end in a newline
+  printf '\n%s %s\n' "$responseMarker" "$exitStatus"
+done
@@ -4,6 +4,10 @@
 import sys
 # for unit testing
 import unittest
+# for checking which functions are called
+import unittest.mock
+# for testing that the rows can be passed to the worker processes
+import pickle
 
 # add the parent folder to the module search path
 # https://stackoverflow.com/a/20371877
@@ -89,7 +93,7 @@ class TestInolibbuglist(unittest.TestCase):
         inoliblist.set_verbosity(enable_verbosity_input=True)
 
     def setUp(self):
-        inoliblist.set_github_token(github_token_input=argument.github_token)
+        set_github_token(github_token_input=argument.github_token)
         set_github_login(github_login_input=argument.github_login)
         set_git_command(argument.git_command)
         set_bash_command(bash_command_input=argument.bash_command)
@@ -114,6 +118,19 @@ class TestInolibbuglist(unittest.TestCase):
         # folder is empty
         self.assertFalse(os.listdir(output_folder_name))
 
+    # @unittest.skip("")
+    def test_scratch_folder_manager(self):
+        scratch_folder_manager = ScratchFolderManager(root_folder_path=work_folder_name)
+        scratch_folder_path = scratch_folder_manager.create_folder()
+        self.assertTrue(os.path.isdir(scratch_folder_path))
+        # Each repository gets a unique folder
+        self.assertNotEqual(scratch_folder_manager.create_folder(), scratch_folder_path)
+        scratch_folder_manager.release_folder(folder_path=scratch_folder_path)
+        scratch_folder_manager.remove_folders()
+        self.assertFalse(os.path.exists(scratch_folder_path))
+        # folder is empty
+        self.assertFalse(os.listdir(work_folder_name))
+
     # @unittest.skip("")
     def test_process_verification_failed_list_missing_input_file(self):
         process_verification_failed_list(verification_failed_list_path="verification_failed_list_doesnt_exist.csv")
@@ -186,6 +203,119 @@ class TestInolibbuglist(unittest.TestCase):
         # Processing should have continued for the non-archived repository
         self.assertEqual(get_table()[2][Column.arduino_library_topic_abuse], "True")
 
+    # @unittest.skip("")
+    def test_process_inoliblist_output_path(self):
+        process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_archived.csv",
+                           output_path=output_folder_name + "/" + inolibbuglist_filename)
+        # Only the heading row is kept in the table
+        self.assertEqual(len(get_table()), 1)
+        with open(file=output_folder_name + "/" + inolibbuglist_filename,
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as inolibbuglist_file:
+            inolibbuglist_rows = list(csv.reader(inolibbuglist_file,
+                                                 delimiter=inoliblist.output_file_delimiter,
+                                                 quotechar=inoliblist.output_file_quotechar))
+        self.assertEqual(inolibbuglist_rows[0], get_table()[0])
+        self.assertEqual(inolibbuglist_rows[1][Column.arduino_library_topic_abuse], "")
+        self.assertEqual(inolibbuglist_rows[2][Column.arduino_library_topic_abuse], "True")
+
+    # @unittest.skip("")
+    def test_inolibbuglist_row(self):
+        row_list = [""] * Column.count
+        row_list[inoliblist.Column.repository_url] = "https://github.com/per1234/inolibbuglist"
+        row_list[Column.i_have_open_issue] = "None"
+        row_list[Column.typo] = "True"
+        row_list[Column.count - 1] = "False"
+        inolibbuglist_row = InolibbuglistRow(row_list=row_list)
+        self.assertEqual(list(inolibbuglist_row), row_list)
+        self.assertEqual(inolibbuglist_row[Column.typo:], row_list[Column.typo:])
+        inolibbuglist_row[Column.typo] = ""
+        self.assertEqual(inolibbuglist_row[Column.typo], "")
+        inolibbuglist_row[Column.typo:] = row_list[Column.typo:]
+        self.assertEqual(inolibbuglist_row, row_list)
+        self.assertEqual(pickle.loads(pickle.dumps(inolibbuglist_row)), row_list)
+        with self.assertRaises(ValueError):
+            inolibbuglist_row[Column.typo:] = []
+        # Negative indexes count from the last column, like a list
+        self.assertEqual(inolibbuglist_row[-1], row_list[-1])
+        self.assertEqual(inolibbuglist_row[-Column.count], row_list[0])
+        inolibbuglist_row[-Column.count] = "foobar"
+        self.assertEqual(inolibbuglist_row[0], "foobar")
+        with self.assertRaises(IndexError):
+            inolibbuglist_row[-Column.count - 1]
+        with self.assertRaises(IndexError):
+            inolibbuglist_row[Column.count] = ""
+        self.assertNotEqual(inolibbuglist_row, None)
+        self.assertNotEqual(inolibbuglist_row, 0)
+
+    # @unittest.skip("")
+    def test_inolibbuglist_journal(self):
+        row_list = [""] * Column.count
+        row_list[inoliblist.Column.repository_url] = "https://github.com/per1234/inolibbuglist"
+        with InolibbuglistJournal(journal_path=output_folder_name + "/" + journal_filename,
+                                  resume_journal=False) as inolibbuglist_journal:
+            inolibbuglist_journal.append(row_list=row_list)
+        # Simulate a run interrupted while writing an entry
+        with open(file=output_folder_name + "/" + journal_filename, mode='a', encoding="utf-8") as journal_file:
+            journal_file.write('{"repository_url": "https://github.com/per1234/inol')
+
+        with InolibbuglistJournal(journal_path=output_folder_name + "/" + journal_filename,
+                                  resume_journal=True) as inolibbuglist_journal:
+            self.assertEqual(inolibbuglist_journal.completed_repository_urls,
+                             {row_list[inoliblist.Column.repository_url]})
+            self.assertEqual(inolibbuglist_journal.read_resumed_row(
+                repository_url=row_list[inoliblist.Column.repository_url]
+            ), row_list)
+            self.assertIsNone(inolibbuglist_journal.read_resumed_row(repository_url="https://github.com/per1234/inol"))
+        # The incomplete entry was removed
+        with InolibbuglistJournal(journal_path=output_folder_name + "/" + journal_filename,
+                                  resume_journal=True) as inolibbuglist_journal:
+            self.assertEqual(len(inolibbuglist_journal.completed_repository_urls), 1)
+            # The rows completed by the resumed run are not reused in the same run
+            second_row_list = [""] * Column.count
+            second_row_list[inoliblist.Column.repository_url] = "https://github.com/per1234/inoliblist"
+            inolibbuglist_journal.append(row_list=second_row_list)
+            self.assertIsNone(inolibbuglist_journal.read_resumed_row(
+                repository_url=second_row_list[inoliblist.Column.repository_url]
+            ))
+        with InolibbuglistJournal(journal_path=output_folder_name + "/" + journal_filename,
+                                  resume_journal=True) as inolibbuglist_journal:
+            self.assertEqual(inolibbuglist_journal.read_resumed_row(
+                repository_url=second_row_list[inoliblist.Column.repository_url]
+            ), second_row_list)
+        with InolibbuglistJournal(journal_path=output_folder_name + "/" + journal_filename,
+                                  resume_journal=False) as inolibbuglist_journal:
+            self.assertEqual(inolibbuglist_journal.completed_repository_urls, set())
+
+    # @unittest.skip("")
+    def test_generate_process_inoliblist_row_arguments_duplicate_url(self):
+        # The first row is archived and the second row is a duplicate of it that is not archived
+        with open(file="tests/" + input_folder_name + "/" + "inoliblist_archived.csv",
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as inoliblist_file:
+            inoliblist_csv = csv.reader(inoliblist_file,
+                                        delimiter=inoliblist.output_file_delimiter,
+                                        quotechar=inoliblist.output_file_quotechar)
+            next(inoliblist_csv)
+            completed_rows = {}
+            arguments_list = []
+            for arguments in generate_process_inoliblist_row_arguments(inoliblist_csv=inoliblist_csv,
+                                                                       get_completed_row=completed_rows.get):
+                arguments_list.append(arguments)
+                # The journal adds each completed row while the batch is being yielded
+                inolibbuglist_row_list = process_inoliblist_row_arguments(arguments)
+                completed_rows[inolibbuglist_row_list[inoliblist.Column.repository_url]] = inolibbuglist_row_list
+        self.assertEqual(len(arguments_list), 2)
+        # The archived row doesn't need the social checks
+        self.assertIsNone(arguments_list[0][1])
+        # The duplicate row gets its own social check results rather than the completed archived row
+        self.assertIsNotNone(arguments_list[1][1])
+        self.assertIsNone(arguments_list[1][2])
+
     # @unittest.skip("")
     def test_process_inoliblist_arduino_library_topic_abuse(self):
         process_inoliblist(
@@ -348,6 +478,42 @@ class TestInolibbuglist(unittest.TestCase):
         self.assertTrue(os.path.exists(arduino_ci_script_folder))
         # folder is not empty
         self.assertTrue(os.listdir(arduino_ci_script_folder))
+        # the installation is recorded in the tool manifest
+        self.assertEqual(load_tool_manifest()["arduino_ci_script"],
+                         {"branch": argument.arduino_ci_script_branch, "commit": determine_arduino_ci_script_commit()})
+        # the existing installation is reused
+        install_tools()
+        self.assertEqual(load_tool_manifest()["arduino_ci_script"]["commit"], determine_arduino_ci_script_commit())
+
+    # @unittest.skip("")
+    def test_determine_python_package_version(self):
+        self.assertEqual(determine_python_package_version(module_name="json"), json.__version__)
+        self.assertIsNone(determine_python_package_version(module_name="inolibbuglist_nonexistent_module"))
+
+    # @unittest.skip("")
+    def test_download_inoliblist(self):
+        folder_path = tempfile.mkdtemp()
+        source_path = os.path.join(folder_path, "source.csv")
+        inoliblist_path = os.path.join(folder_path, "inoliblist", "inoliblist.csv")
+        with open(file=source_path, mode='w', encoding="utf-8", newline='') as source_file:
+            source_file.write("foo,bar\r\nbaz,qux\r\n")
+        source_url = urllib.parse.urljoin("file:", urllib.request.pathname2url(source_path))
+
+        download_inoliblist(url=source_url, path=inoliblist_path)
+        with open(file=inoliblist_path, mode='r', encoding="utf-8", newline='') as inoliblist_file:
+            self.assertEqual(inoliblist_file.read(), "foo,bar\r\nbaz,qux\r\n")
+        self.assertEqual(read_json_file(file_path=inoliblist_path + ".json")["url"], source_url)
+
+        # the download can be read as it arrives
+        with open_inoliblist(inoliblist_path=inoliblist_path, inoliblist_url=source_url) as inoliblist_file:
+            self.assertEqual(list(csv.reader(inoliblist_file)), [["foo", "bar"], ["baz", "qux"]])
+
+        # the previous download is used if the download fails
+        os.remove(source_path)
+        download_inoliblist(url=source_url, path=inoliblist_path)
+        self.assertTrue(os.path.isfile(inoliblist_path))
+
+        shutil.rmtree(folder_path)
 
     # @unittest.skip("")
     def test_check_for_open_pr_no_open_pr(self):
@@ -357,6 +523,219 @@ class TestInolibbuglist(unittest.TestCase):
     def test_check_for_open_pr_open_pr(self):
         self.assertTrue(check_for_open_pr(repository_full_name="spapadim/XPT2046"))
 
+    # @unittest.skip("")
+    def test_search_my_open_items(self):
+        self.assertIn("spapadim/xpt2046", search_my_open_items(type_qualifier="pr"))
+        self.assertIn("chris--a/moduino", search_my_open_items(type_qualifier="issue"))
+
+    # @unittest.skip("")
+    def test_check_for_open_issue(self):
+        self.assertTrue(check_for_open_issue(repository_full_name="Chris--A/Moduino"))
+        self.assertFalse(check_for_open_issue(repository_full_name="spapadim/XPT2046"))
+
+    # @unittest.skip("")
+    def test_check_if_contributor(self):
+        self.assertTrue(check_if_contributor(repository_full_name="per1234/MouseTo"))
+        self.assertFalse(check_if_contributor(repository_full_name="vinta/awesome-python"))
+
+    # @unittest.skip("")
+    def test_resolve_social_checks(self):
+        set_process_repos_with_open_pr(True)
+        with open(file="tests/" + input_folder_name + "/" + "inoliblist_i_have_open_issue.csv",
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as inoliblist_file:
+            inoliblist_csv = csv.reader(inoliblist_file,
+                                        delimiter=inoliblist.output_file_delimiter,
+                                        quotechar=inoliblist.output_file_quotechar)
+            # skip the heading row
+            next(inoliblist_csv)
+            social_check_results = resolve_social_checks(inoliblist_rows=list(inoliblist_csv))
+        # arduino-library topic abuse and an open issue from me
+        self.assertTrue(social_check_results[0]["i_have_open_issue"])
+        # arduino-library topic abuse and no open issue from me
+        self.assertFalse(social_check_results[1]["i_have_open_issue"])
+        # No arduino-library topic abuse so the open issue check is not done
+        self.assertIsNone(social_check_results[2]["i_have_open_issue"])
+        # The other checks are always done
+        self.assertIsNotNone(social_check_results[2]["i_have_open_pull_request"])
+        self.assertIsNotNone(social_check_results[2]["i_am_contributor"])
+
+    # @unittest.skip("")
+    def test_resolve_social_checks_graphql(self):
+        with open(file="tests/" + input_folder_name + "/" + "inoliblist_i_have_open_issue.csv",
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as inoliblist_file:
+            inoliblist_csv = csv.reader(inoliblist_file,
+                                        delimiter=inoliblist.output_file_delimiter,
+                                        quotechar=inoliblist.output_file_quotechar)
+            # skip the heading row
+            next(inoliblist_csv)
+            inoliblist_rows = list(inoliblist_csv)
+        # The GraphQL API results should match the REST API results
+        set_use_graphql(use_graphql_input=False)
+        social_check_results = resolve_social_checks(inoliblist_rows=inoliblist_rows)
+        self.assertEqual(resolve_social_checks_graphql(inoliblist_rows=inoliblist_rows), (social_check_results, []))
+
+    # @unittest.skip("")
+    def test_get_github_api_response(self):
+        get_github_api_response_return = get_github_api_response(request="repos/per1234/MouseTo/contributors")
+        self.assertEqual(get_github_api_response_return["json_data"][0]["login"], "per1234")
+        # The second request is a conditional request that returns the cached response
+        self.assertEqual(get_github_api_response(request="repos/per1234/MouseTo/contributors"),
+                         get_github_api_response_return)
+
+    # @unittest.skip("")
+    def test_github_api_rate_limiter(self):
+        github_api_rate_limiter = GitHubAPIRateLimiter()
+        # nothing is known about the rate limit before the first response
+        self.assertLessEqual(github_api_rate_limiter.determine_delay(resource="core", priority=False), 0)
+        rate_limit_reset = int(time.time()) + 3600
+        github_api_rate_limiter.update(headers={"X-RateLimit-Limit": "5000",
+                                                "X-RateLimit-Remaining": "100",
+                                                "X-RateLimit-Reset": str(rate_limit_reset),
+                                                "X-RateLimit-Resource": "core"})
+        # only the priority requests can use the reserved part of the rate limit
+        self.assertGreater(github_api_rate_limiter.determine_delay(resource="core", priority=False), 3500)
+        self.assertLessEqual(github_api_rate_limiter.determine_delay(resource="core", priority=True), 0)
+        # the other resources have their own rate limits
+        self.assertLessEqual(github_api_rate_limiter.determine_delay(resource="search", priority=False), 0)
+        # the requests are spaced once less than half of the rate limit remains
+        self.assertEqual(GitHubAPIRateLimiter.determine_interval(rate_limit={"limit": 5000,
+                                                                             "remaining": 4000,
+                                                                             "reset": rate_limit_reset}), 0)
+        self.assertGreater(GitHubAPIRateLimiter.determine_interval(rate_limit={"limit": 5000,
+                                                                               "remaining": 1000,
+                                                                               "reset": rate_limit_reset}), 4)
+        # a rate limiter can continue from the state of another
+        self.assertEqual(GitHubAPIRateLimiter(state=github_api_rate_limiter.get_state()).get_state(),
+                         github_api_rate_limiter.get_state())
+        # a secondary rate limit response blocks all requests
+        self.assertTrue(github_api_rate_limiter.handle_error(code=403,
+                                                             headers={"Retry-After": "60"},
+                                                             secondary_rate_limit_message=False))
+        self.assertGreater(github_api_rate_limiter.determine_delay(resource="search", priority=True), 50)
+
+    # @unittest.skip("")
+    def test_github_api_rate_limiter_manager(self):
+        with GitHubAPIRateLimiterManager() as github_api_rate_limiter_manager:
+            shared_github_api_rate_limiter = github_api_rate_limiter_manager.GitHubAPIRateLimiter(state=None)
+            # the requests of all the processes are counted by the shared rate limiter
+            processes = [multiprocessing.Process(target=shared_github_api_rate_limiter.acquire,
+                                                 kwargs={"resource": "core"})
+                         for _ in range(2)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            shared_github_api_rate_limiter.acquire(resource="core")
+            self.assertEqual(shared_github_api_rate_limiter.get_state()["request_count"], 3)
+
+    # @unittest.skip("")
+    def test_evict_cache(self):
+        for file_number in range(4):
+            with open(file=output_folder_name + "/" + str(file_number), mode='w') as cache_file:
+                cache_file.write("x" * 10)
+            # the least recently used file is the one with the oldest modification time
+            os.utime(output_folder_name + "/" + str(file_number), (file_number, file_number))
+        self.assertEqual(evict_cache(folder_path=output_folder_name, maximum_size=25), 20)
+        self.assertEqual(sorted(os.listdir(output_folder_name)), ["2", "3"])
+
+    # @unittest.skip("")
+    def test_determine_default_branch_tip_commit(self):
+        self.assertEqual(len(determine_default_branch_tip_commit(repository_full_name="per1234/MouseTo",
+                                                                 branch="master")), 40)
+        self.assertIsNone(determine_default_branch_tip_commit(repository_full_name="per1234/MouseTo",
+                                                              branch="branch-that-doesnt-exist"))
+
+    # @unittest.skip("")
+    def test_process_inoliblist_incremental(self):
+        set_incremental(incremental_input=True)
+        process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_check_keywords_txt.csv")
+        first_run_table = get_table()
+        # The second run reuses the results of the first run, without downloading the repositories again
+        with unittest.mock.patch("inolibbuglist.download_repository_archive",
+                                 side_effect=AssertionError("Repository downloaded by the incremental run")):
+            process_inoliblist(
+                inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_check_keywords_txt.csv"
+            )
+        set_incremental(incremental_input=False)
+        self.assertEqual(get_table(), first_run_table)
+
+    # @unittest.skip("")
+    def test_determine_check_configuration(self):
+        row_list = [""] * Column.count
+        check_configuration = determine_check_configuration(row_list=row_list)
+        # A different Arduino IDE version invalidates the results of the previous run
+        set_arduino_ci_script_arduino_ide_version(arduino_ci_script_arduino_ide_version_input="1.8.5")
+        self.assertNotEqual(determine_check_configuration(row_list=row_list), check_configuration)
+        set_arduino_ci_script_arduino_ide_version(
+            arduino_ci_script_arduino_ide_version_input=default_arduino_ci_script_arduino_ide_version
+        )
+        # The codespell version is only relevant to the typo check
+        set_check_for_typos(check_for_typos_input=True)
+        self.assertIn("codespell_version", determine_check_configuration(row_list=row_list))
+        set_check_for_typos(check_for_typos_input=False)
+        self.assertNotIn("codespell_version", determine_check_configuration(row_list=row_list))
+
+    # @unittest.skip("")
+    def test_initialize_worker(self):
+        set_use_graphql(use_graphql_input=True)
+        set_github_api_cache_maximum_size(github_api_cache_maximum_size_input=1)
+        worker_configuration = get_worker_configuration()
+        set_use_graphql(use_graphql_input=False)
+        set_github_api_cache_maximum_size(github_api_cache_maximum_size_input=default_github_api_cache_maximum_size)
+        self.assertNotEqual(get_worker_configuration(), worker_configuration)
+        # The worker process gets all the settings of the main process
+        initialize_worker(configuration=worker_configuration)
+        self.assertEqual(get_worker_configuration(), worker_configuration)
+        set_use_graphql(use_graphql_input=False)
+        set_github_api_cache_maximum_size(github_api_cache_maximum_size_input=default_github_api_cache_maximum_size)
+
+    # @unittest.skip("")
+    def test_repository_archive(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties", "name=foobar\n")
+            zip_file.writestr("foobar-master/src/", "")
+            zip_file.writestr("foobar-master/src/foobar.h", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            self.assertEqual(repository_archive.root_folder_name, "foobar-master/")
+            self.assertEqual(sorted(repository_archive.list_folder(folder_path="")), ["library.properties", "src/"])
+            self.assertEqual(repository_archive.list_folder(folder_path="src/"), ["src/foobar.h"])
+            self.assertTrue(repository_archive.is_folder(path="src/"))
+            self.assertFalse(repository_archive.exists(path="Library.properties"))
+            self.assertEqual(repository_archive.read(path="library.properties"), b"name=foobar\n")
+            # The archive is only extracted on request
+            self.assertIsNone(repository_archive.repository_installation_path)
+            self.assertEqual(repository_archive.extract(folder_path=work_folder_name),
+                             work_folder_name + "/foobar-master/")
+            self.assertTrue(os.path.isfile(work_folder_name + "/foobar-master/src/foobar.h"))
+
+    # @unittest.skip("")
+    def test_verify_cached_archive(self):
+        commit = determine_default_branch_tip_commit(repository_full_name="per1234/MouseTo", branch="master")
+        archive_path = output_folder_name + "/" + commit + ".zip"
+        self.assertFalse(verify_cached_archive(archive_path=archive_path))
+        self.assertEqual(download_archive_to_cache(url="https://github.com/per1234/MouseTo/archive/master.zip",
+                                                   archive_path=archive_path,
+                                                   commit=commit),
+                         archive_path)
+        self.assertTrue(verify_cached_archive(archive_path=archive_path))
+        # An archive of a different commit than expected is cached under the commit from the archive's comment
+        self.assertEqual(download_archive_to_cache(url="https://github.com/per1234/MouseTo/archive/master.zip",
+                                                   archive_path=output_folder_name + "/" + "0" * 40 + ".zip",
+                                                   commit="0" * 40),
+                         archive_path)
+        self.assertFalse(os.path.exists(output_folder_name + "/" + "0" * 40 + ".zip"))
+        # A corrupted archive fails the verification
+        with open(file=archive_path, mode="ab") as archive_file:
+            archive_file.write(b"foobar")
+        self.assertFalse(verify_cached_archive(archive_path=archive_path))
+
     # @unittest.skip("")
     def test_create_inolibbuglist_output_file(self):
         process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_archived.csv")
@@ -423,6 +802,93 @@ class TestInolibbuglist(unittest.TestCase):
                                  "-new-tab https://github.com/spapadim/XPT2046\n"
                                  )
 
+    # @unittest.skip("")
+    def test_create_open_in_tabs_script_set(self):
+        # Enough rows with each bug to need more than one script per column
+        inolibbuglist_rows = []
+        for row_index in range(2 * maximum_browser_tabs + 1):
+            row_list = [""] * Column.count
+            row_list[inoliblist.Column.repository_url] = "https://github.com/per1234/foobar" + str(row_index)
+            for column_index in range(Column.start_of_normal_bugs, Column.count):
+                row_list[column_index] = str(column_index % (row_index % 3 + 1) == 0)
+            row_list[Column.i_have_open_pull_request] = str(row_index % 5 == 0)
+            inolibbuglist_rows.append(row_list)
+        with open(file=output_folder_name + "/" + inolibbuglist_filename,
+                  mode='w',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as inolibbuglist_file:
+            inolibbuglist_csv = csv.writer(inolibbuglist_file,
+                                           delimiter=inoliblist.output_file_delimiter,
+                                           quotechar=inoliblist.output_file_quotechar)
+            inolibbuglist_csv.writerow(["column" + str(column_index) + "_" for column_index in range(Column.count)])
+            inolibbuglist_csv.writerows(inolibbuglist_rows)
+
+        open_in_tabs_scripts = [{"url_column": inoliblist.Column.repository_url,
+                                 "inclusion_columns": [column_index],
+                                 "exclusion_columns": [Column.i_have_open_pull_request]}
+                                for column_index in range(Column.start_of_normal_bugs, Column.count)]
+
+        create_open_in_tabs_script_set(input_filename=inolibbuglist_filename,
+                                       open_in_tabs_scripts=open_in_tabs_scripts)
+        browser_scripts = {}
+        for output_filename in os.listdir(output_folder_name):
+            if output_filename.endswith(browser_script_extension):
+                with open(file=output_folder_name + "/" + output_filename,
+                          mode='r',
+                          encoding=inoliblist.file_encoding,
+                          newline=inoliblist.file_newline
+                          ) as browser_script:
+                    browser_scripts[output_filename] = browser_script.read()
+
+        # The scripts are the same as the ones written one column at a time by the original implementation, which
+        # started a new script after every maximum_browser_tabs + 1 tabs because the count starts from 0
+        script_tabs = maximum_browser_tabs + 1
+        expected_browser_scripts = {}
+        for column_index in range(Column.start_of_normal_bugs, Column.count):
+            browser_script_lines = [argument.browser_command + " " + row_list[inoliblist.Column.repository_url] + '\n'
+                                    for row_list in inolibbuglist_rows
+                                    if row_list[column_index] == "True" and
+                                    row_list[Column.i_have_open_pull_request] != "True"]
+            for line_index in range(0, len(browser_script_lines), script_tabs):
+                expected_browser_scripts[
+                    "column" + str(column_index) + "_" + str(line_index // script_tabs + 1) + browser_script_extension
+                ] = "".join(browser_script_lines[line_index:line_index + script_tabs])
+        self.assertEqual(browser_scripts, expected_browser_scripts)
+
+    # @unittest.skip("")
+    def test_inolibbuglist_index(self):
+        process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_archived.csv")
+        create_inolibbuglist_output_file()
+        inolibbuglist_index = InolibbuglistIndex.from_file(
+            input_path=output_folder_name + "/" + inolibbuglist_filename
+        )
+        self.assertEqual(inolibbuglist_index.query(expression="arduino_library_topic_abuse and not i_have_open_issue"),
+                         ["https://github.com/spapadim/XPT2046"])
+        self.assertEqual(inolibbuglist_index.query(expression="archived | ~archived"),
+                         [row_list[inoliblist.Column.repository_url] for row_list in get_table()[1:]])
+        with self.assertRaises(ValueError):
+            inolibbuglist_index.query(expression="(foobar")
+
+    # @unittest.skip("")
+    def test_run_query(self):
+        process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + "inoliblist_archived.csv")
+        create_inolibbuglist_output_file()
+        # a stale script of a previous query with more results
+        with open(file=output_folder_name + "/query2" + browser_script_extension, mode='w') as browser_script:
+            browser_script.write("foobar\n")
+        for _ in range(2):
+            self.assertEqual(run_query(expression="arduino_library_topic_abuse", script_filename="query"),
+                             ["https://github.com/spapadim/XPT2046"])
+        # running the query again replaces the scripts of the previous query
+        with open(file=output_folder_name + "/query1" + browser_script_extension,
+                  mode='r',
+                  encoding=inoliblist.file_encoding,
+                  newline=inoliblist.file_newline
+                  ) as browser_script:
+            self.assertEqual(browser_script.read(), argument.browser_command + " https://github.com/spapadim/XPT2046\n")
+        self.assertFalse(os.path.exists(output_folder_name + "/query2" + browser_script_extension))
+
     # @unittest.skip("")
     def test_check_blacklist(self):
         # Owner blacklist
@@ -432,6 +898,17 @@ class TestInolibbuglist(unittest.TestCase):
         # Not blacklisted
         self.assertFalse(check_blacklist(repository_url="https://github.com/per1234/MouseTo"))
 
+    # @unittest.skip("")
+    def test_load_blacklists(self):
+        load_blacklists()
+        # Blacklist entries are casefolded
+        self.assertIn("eaconner", get_owner_blacklist())
+        self.assertIn("per1234/inoliblist", get_repository_blacklist())
+        # The index is not rebuilt when the blacklist files have not been modified
+        indexed_owner_blacklist = get_owner_blacklist()
+        load_blacklists()
+        self.assertIs(get_owner_blacklist(), indexed_owner_blacklist)
+
     # @unittest.skip("")
     def test_run_bash_command(self):
         self.assertEqual(
@@ -464,6 +941,214 @@ class TestInolibbuglist(unittest.TestCase):
                                   row_list=test_arduino_ci_script_handler_row_list)
         self.assertEqual(test_arduino_ci_script_handler_row_list[Column.library_folder_doesnt_exist], "True")
 
+    # @unittest.skip("")
+    def test_arduino_ci_script_worker(self):
+        arduino_ci_script_worker = ArduinoCIScriptWorker()
+        # Run check_library_structure on a non-existent path
+        self.assertEqual(arduino_ci_script_worker.run(invocation="check_library_structure foobar/")[0],
+                         7)
+        self.assertEqual(arduino_ci_script_worker.run(invocation="echo foobar"),
+                         (bash_script_success_exit_status, "foobar\n"))
+        # The worker is restarted if it dies
+        arduino_ci_script_worker.process.kill()
+        arduino_ci_script_worker.process.wait()
+        self.assertEqual(arduino_ci_script_worker.run(invocation="echo foobar"),
+                         (bash_script_success_exit_status, "foobar\n"))
+        # Characters outside of Latin-1 are passed to the worker
+        self.assertEqual(arduino_ci_script_worker.run(invocation="echo \u20ac\u00e9"),
+                         (bash_script_success_exit_status, "\u20ac\u00e9\n"))
+        arduino_ci_script_worker.stop()
+
+        # An invocation that times out is abandoned and the worker is restarted for the next invocation
+        arduino_ci_script_worker = ArduinoCIScriptWorker(timeout=1)
+        self.assertIsNone(arduino_ci_script_worker.run(invocation="sleep 60"))
+        self.assertEqual(arduino_ci_script_worker.run(invocation="echo foobar"),
+                         (bash_script_success_exit_status, "foobar\n"))
+        arduino_ci_script_worker.stop()
+
+    # @unittest.skip("")
+    def test_check_library_structure_native(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/foobar.h", "")
+            zip_file.writestr("foobar-master/Examples/", "")
+            zip_file.writestr("foobar-master/Examples/foo/", "")
+            zip_file.writestr("foobar-master/Examples/foo/foo.ino", "")
+            zip_file.writestr("foobar-master/extras/", "")
+            zip_file.writestr("foobar-master/extras/library.properties", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Incorrect examples folder name is found before the stray library.properties
+            self.assertEqual(check_library_structure_native(repository_archive=repository_archive, path=""), 2)
+            # Specified folder doesn't exist
+            self.assertEqual(check_library_structure_native(repository_archive=repository_archive, path="foobar/"), 7)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/foobar/", "")
+            zip_file.writestr("foobar-master/foobar/utility/foobar.h", "")
+            zip_file.writestr("foobar-master/examples/", "")
+            zip_file.writestr("foobar-master/examples/foo/", "")
+            zip_file.writestr("foobar-master/examples/foo/foo.ino", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Header files are searched for in the whole library folder
+            self.assertEqual(check_library_structure_native(repository_archive=repository_archive, path=""),
+                             bash_script_success_exit_status)
+            # No header files
+            self.assertEqual(check_library_structure_native(repository_archive=repository_archive,
+                                                            path="examples/"), 9)
+
+    # @unittest.skip("")
+    def test_check_folder_name(self):
+        self.assertEqual(check_folder_name(folder_name="foobar", exit_statuses=(10, 11, 12)), [])
+        self.assertEqual(check_folder_name(folder_name="_foo bar", exit_statuses=(10, 11, 12)), [10, 11])
+        self.assertEqual(check_folder_name(folder_name="f" * 64, exit_statuses=(10, 11, 12)), [12])
+
+    # @unittest.skip("")
+    def test_check_library_properties_native(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties",
+                              "name=foobar\n"
+                              "version=1.0.0\n"
+                              "author=foo\n"
+                              "maintainer=foo\n"
+                              "sentence=Foo bar.\n"
+                              "paragraph=Foo bar. Baz.\n"
+                              "category=Foo\n"
+                              "url=https://github.com/per1234/inolibbuglist\n"
+                              "architecture=avr\n")
+            zip_file.writestr("foobar-master/Library.properties", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Incorrect filename case is found before the problems with the contents
+            self.assertEqual(check_library_properties_native(repository_archive=repository_archive, path=""), 8)
+            # Specified folder doesn't exist
+            self.assertEqual(check_library_properties_native(repository_archive=repository_archive, path="foobar/"),
+                             6)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties", "name=\nversion=r5\nfoobar\nincludes=\n"
+                                                                  "architectures=AVR\nurl=github.com\n")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Invalid line
+            self.assertEqual(check_library_properties_native(repository_archive=repository_archive, path=""), 17)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties",
+                              "name=foobar\n"
+                              "version=1.0.0\n"
+                              "author=foo\n"
+                              "maintainer=foo\n"
+                              "sentence=Foo bar.\n"
+                              "paragraph=Baz.\n"
+                              "category=Other\n"
+                              "url=https://github.com/per1234/inolibbuglist\n"
+                              "architectures=foobar\n")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Unknown architecture must be decided by arduino-ci-script
+            self.assertIsNone(check_library_properties_native(repository_archive=repository_archive, path=""))
+
+    # @unittest.skip("")
+    def test_check_keywords_txt_native(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/keywords.txt",
+                              "# comment\n"
+                              "\n"
+                              "foo\tKEYWORD1\n"
+                              "bar KEYWORD2\n"
+                              "baz\t\tKEYWORD2\n"
+                              "qux\tKEYWORD4\t\tDATA_TYPE\n"
+                              "foo.bar\tLITERAL1\t\tFOOBAR\n")
+            zip_file.writestr("foobar-master/keyword.txt", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Misspelled filename is found before the problems with the contents
+            self.assertEqual(check_keywords_txt_native(repository_archive=repository_archive, path=""), 7)
+            # Specified folder doesn't exist
+            self.assertEqual(check_keywords_txt_native(repository_archive=repository_archive, path="foobar/"), 6)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/keywords.txt",
+                              "foo\tKEYWORD1\n"
+                              "bar KEYWORD2\n"
+                              "baz\t\tKEYWORD2\n")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Invalid field separator is found before the multiple tabs on the next line
+            self.assertEqual(check_keywords_txt_native(repository_archive=repository_archive, path=""), 9)
+
+    # @unittest.skip("")
+    def test_check_library_manager_compliance_native(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties", "name=foo bar\n")
+            zip_file.writestr("foobar-master/extras/foobar.exe", "")
+            symlink_info = zipfile.ZipInfo("foobar-master/src/foobar.h")
+            symlink_info.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zip_file.writestr(symlink_info, "../foobar.h")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # .exe file is found before the symlink
+            self.assertEqual(check_library_manager_compliance_native(repository_archive=repository_archive, path=""),
+                             2)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties", "name=_foo/bar" + "r" * 64 + "\n")
+            zip_file.writestr("foobar-master/.development", "")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # .development file is found before the problems with the name
+            self.assertEqual(check_library_manager_compliance_native(repository_archive=repository_archive, path=""),
+                             3)
+
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/library.properties", "name=foo/bar" + "r" * 64 + "\n")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            # Invalid name character is found before the name too long
+            self.assertEqual(check_library_manager_compliance_native(repository_archive=repository_archive, path=""),
+                             6)
+
+    # @unittest.skip("")
+    def test_check_engine_parity(self):
+        # The Python implementations of the checks must produce the same results as arduino-ci-script
+        for inoliblist_filename in ("inoliblist_check_library_structure.csv",
+                                    "inoliblist_check_library_properties.csv",
+                                    "inoliblist_check_keywords_txt.csv",
+                                    "inoliblist_check_library_manager_compliance.csv"):
+            engine_tables = {}
+            for engine in ("bash", "python"):
+                set_check_engine(check_engine_input=engine)
+                process_inoliblist(inoliblist_path="tests/" + input_folder_name + "/" + inoliblist_filename)
+                engine_tables[engine] = get_table()
+            set_check_engine(check_engine_input=default_check_engine)
+
+            self.assertEqual(len(engine_tables["python"]), len(engine_tables["bash"]))
+            for bash_row, python_row in zip(engine_tables["bash"], engine_tables["python"]):
+                for column_index in range(Column.count):
+                    self.assertEqual(python_row[column_index], bash_row[column_index],
+                                     msg=inoliblist_filename + ": " + bash_row[inoliblist.Column.repository_url] +
+                                     ": " + engine_tables["bash"][0][column_index])
+
+    # @unittest.skip("")
+    def test_find_typos(self):
+        with zipfile.ZipFile(output_folder_name + "/archive.zip", "w") as zip_file:
+            zip_file.writestr("foobar-master/", "")
+            zip_file.writestr("foobar-master/src/foobar.cpp", "// teh\nSerial.print(\"\\nto\");\n")
+            zip_file.writestr("foobar-master/README.md", "Definately a libary.")
+            # Hidden and binary files are skipped
+            zip_file.writestr("foobar-master/.github/foobar.md", "teh")
+            zip_file.writestr("foobar-master/foobar.bin", b"teh\x00")
+        with RepositoryArchive(archive_file=output_folder_name + "/archive.zip") as repository_archive:
+            self.assertEqual(find_typos(repository_archive=repository_archive), {"src/foobar.cpp": 1, "README.md": 2})
+
+    # @unittest.skip("")
+    def test_count_typos_with_automaton(self):
+        file_text = "Teh foo-teh foo_teh\nSerial.print(\"\\nto\");\n/* recieve's recieve \u00e9t\u00e9 */"
+        self.assertEqual(count_typos_with_automaton(file_text=file_text, misspelling_automaton=load_typo_automaton()),
+                         2)
+        self.assertEqual(count_typos(file_text=file_text, misspelling_fixes=load_misspellings()), 2)
+
     # @unittest.skip("I haven't figured how to do a unit test for subprocess_run() yet")
     # def test_subprocess_run(self):
     #     self.assertEqual(subprocess_run(command="cd", arguments="."), 0)